@@ -1,48 +1,190 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+
 from app.domain.entities.document import Document, DocumentChunk
+from app.domain.interfaces.lexical_index import LexicalIndex
 from app.domain.interfaces.vector_store import VectorStore
 from app.infrastructure.embeddings.embedding_service import EmbeddingService
 from app.infrastructure.embeddings.chunking import ChunkingService
 
+ProgressCallback = Callable[[dict], Awaitable[None]]
+
 
 class IndexDocumentUseCase:
+    """
+    Indexes documents through a bounded chunk -> embed -> upsert pipeline.
+
+    Each stage runs as its own task connected by queues of at most
+    ``pipeline_depth`` batches, so embedding the next batch overlaps with
+    upserting the previous one, and a slow stage stalls the ones before it
+    instead of letting batches pile up in memory.
+
+    Re-indexing an existing document id is incremental: chunk ids are
+    derived from chunk content, so only new chunks are embedded and
+    upserted, unchanged ones are reused as they are and chunks no longer
+    produced are deleted in one batch at the end.
+
+    The optional ``lexical_index`` receives the same inserts, metadata
+    updates and deletes as the vector store.
+    """
+
     def __init__(
         self,
         vector_store: VectorStore,
         embedding_service: EmbeddingService,
-        chunking_service: ChunkingService
+        chunking_service: ChunkingService,
+        batch_size: int = 64,
+        pipeline_depth: int = 2,
+        lexical_index: Optional[LexicalIndex] = None
     ):
         self.vector_store = vector_store
+        self.lexical_index = lexical_index
         self.embedding_service = embedding_service
         self.chunking_service = chunking_service
-    
+        self.batch_size = batch_size
+        self.pipeline_depth = pipeline_depth
+
     async def execute(self, document: Document) -> dict:
-        # Chunk document
-        chunk_dicts = self.chunking_service.chunk_text(document.content, document.id)
-        
-        # Generate embeddings
+        chunks = self._iter_async(self.chunking_service.iter_chunks(document.content, document.id))
+        return await self._run_pipeline(document, chunks)
+
+    async def execute_stream(
+        self,
+        document: Document,
+        blocks: AsyncIterator[str],
+        on_progress: Optional[ProgressCallback] = None
+    ) -> dict:
+        """Index text arriving in blocks; ``document.content`` is not used."""
+        chunks = self.chunking_service.iter_chunks_stream(blocks, document.id)
+        return await self._run_pipeline(document, chunks, on_progress)
+
+    async def delete(self, doc_id: str) -> None:
+        await self.vector_store.delete_document(doc_id)
+        if self.lexical_index:
+            await self.lexical_index.delete_document(doc_id)
+
+    async def _run_pipeline(
+        self,
+        document: Document,
+        chunks: AsyncIterator[dict],
+        on_progress: Optional[ProgressCallback] = None
+    ) -> dict:
+        result = {
+            "doc_id": document.id,
+            "chunks_created": 0,
+            "total_words": 0,
+            "chunks_inserted": 0,
+            "chunks_reused": 0,
+            "chunks_deleted": 0
+        }
+        stored = await self.vector_store.get_document_chunks(document.id)
+        stale = set(stored)
+        to_embed: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_depth)
+        to_upsert: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_depth)
+
+        async def produce():
+            batch = []
+            async for chunk in chunks:
+                stale.discard(chunk["id"])
+                batch.append(chunk)
+                if len(batch) >= self.batch_size:
+                    await to_embed.put(batch)
+                    batch = []
+            if batch:
+                await to_embed.put(batch)
+            await to_embed.put(None)
+
+        async def embed():
+            while (batch := await to_embed.get()) is not None:
+                new = [c for c in batch if c["id"] not in stored]
+                reused = [c for c in batch if c["id"] in stored]
+                await to_upsert.put((await self._embed_batch(document, new), reused))
+            await to_upsert.put(None)
+
+        async def upsert():
+            while (item := await to_upsert.get()) is not None:
+                new, reused = item
+                changed = self._changed_metadata(document, reused, stored)
+                if new:
+                    await self.vector_store.upsert(new)
+                await self.vector_store.update_metadata(changed)
+                if self.lexical_index:
+                    await self.lexical_index.add(new)
+                    await self.lexical_index.update_metadata(changed)
+
+                result["chunks_created"] += len(new) + len(reused)
+                result["chunks_inserted"] += len(new)
+                result["chunks_reused"] += len(reused)
+                result["total_words"] += sum(c.metadata["word_count"] for c in new)
+                result["total_words"] += sum(c["metadata"]["word_count"] for c in reused)
+                if on_progress:
+                    await on_progress(result)
+
+        await self._run_stages(produce(), embed(), upsert())
+
+        if stale:
+            await self.vector_store.delete_many(sorted(stale))
+            if self.lexical_index:
+                await self.lexical_index.delete_many(sorted(stale))
+        result["chunks_deleted"] = len(stale)
+        return result
+
+    async def _embed_batch(self, document: Document, chunk_dicts: List[dict]) -> List[DocumentChunk]:
+        if not chunk_dicts:
+            return []
         texts = [c["content"] for c in chunk_dicts]
         embeddings = await self.embedding_service.batch_embed(texts)
-        
-        # Create chunks with embeddings
-        chunks = [
+
+        return [
             DocumentChunk(
                 id=chunk_dict["id"],
                 content=chunk_dict["content"],
                 embedding=embedding,
                 metadata={
-                    **chunk_dict["metadata"],
-                    "doc_title": document.title,
+                    **self._chunk_metadata(document, chunk_dict),
                     "created_at": document.created_at.isoformat()
                 }
             )
             for chunk_dict, embedding in zip(chunk_dicts, embeddings)
         ]
-        
-        # Store in vector DB
-        await self.vector_store.upsert(chunks)
-        
-        return {
-            "doc_id": document.id,
-            "chunks_created": len(chunks),
-            "total_words": sum(c.metadata["word_count"] for c in chunks)
-        }
\ No newline at end of file
+
+    def _changed_metadata(
+        self,
+        document: Document,
+        chunk_dicts: List[dict],
+        stored: Dict[str, dict]
+    ) -> Dict[str, dict]:
+        """Metadata to rewrite for reused chunks that moved or whose document was renamed."""
+        changed = {}
+        for chunk_dict in chunk_dicts:
+            metadata = self._chunk_metadata(document, chunk_dict)
+            previous = stored[chunk_dict["id"]]
+            if any(previous.get(key) != value for key, value in metadata.items()):
+                changed[chunk_dict["id"]] = metadata
+        return changed
+
+    @staticmethod
+    def _chunk_metadata(document: Document, chunk_dict: dict) -> dict:
+        # created_at is left out so reused chunks keep the time they were first indexed
+        return {**chunk_dict["metadata"], "doc_title": document.title}
+
+    @staticmethod
+    async def _run_stages(*stages) -> None:
+        # Fail fast: one failing stage cancels the others instead of leaving them blocked
+        tasks = [asyncio.create_task(stage) for stage in stages]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            if not task.cancelled() and task.exception():
+                raise task.exception()
+
+    @staticmethod
+    async def _iter_async(chunks: Iterator[dict]) -> AsyncIterator[dict]:
+        for chunk in chunks:
+            yield chunk
+            # Chunking is CPU-bound; let other requests run between chunks
+            await asyncio.sleep(0)
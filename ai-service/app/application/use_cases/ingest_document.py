@@ -0,0 +1,70 @@
+import codecs
+import uuid
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from app.application.use_cases.index_document import IndexDocumentUseCase
+from app.domain.entities.document import Document
+from app.domain.entities.job import IndexJob, JobStatus
+from app.domain.interfaces.job_store import JobStore
+
+
+class IngestDocumentUseCase:
+    """Streams an uploaded document into the index, tracking progress as a job."""
+
+    def __init__(self, index_document_use_case: IndexDocumentUseCase, job_store: JobStore):
+        self.index_document_use_case = index_document_use_case
+        self.job_store = job_store
+
+    async def create_job(self, title: str, metadata: dict, doc_id: Optional[str] = None) -> IndexJob:
+        """Pass the id of an indexed document to update it incrementally."""
+        job = IndexJob(
+            id=uuid.uuid4().hex,
+            doc_id=doc_id or f"doc_{datetime.utcnow().timestamp()}",
+            title=title,
+            metadata=metadata
+        )
+        return await self.job_store.create(job)
+
+    async def claim(self, job_id: str) -> Optional[IndexJob]:
+        """Claim a queued job for upload; None if missing, already started or its document is busy."""
+        return await self.job_store.claim_upload(job_id, datetime.utcnow())
+
+    async def execute(self, job: IndexJob, body: AsyncIterator[bytes]) -> IndexJob:
+        """Index the uploaded body into a job returned by ``claim``."""
+        document = Document(
+            id=job.doc_id,
+            content="",
+            title=job.title,
+            created_at=job.created_at,
+            metadata=job.metadata
+        )
+
+        async def blocks():
+            # Multi-byte characters may straddle network chunks
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            async for data in body:
+                job.bytes_received += len(data)
+                text = decoder.decode(data)
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+
+        async def on_progress(result: dict):
+            job.record_progress(result)
+            await self.job_store.update(job)
+
+        try:
+            result = await self.index_document_use_case.execute_stream(document, blocks(), on_progress)
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            await self.job_store.update(job)
+            raise
+
+        job.status = JobStatus.COMPLETED
+        job.record_progress(result)
+        await self.job_store.update(job)
+        return job
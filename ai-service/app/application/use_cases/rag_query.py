@@ -1,19 +1,260 @@
-# app/domain/entities/query.py
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
-from app.domain.entities.document import DocumentChunk
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+from app.config import settings
+from app.domain.entities.document import DocumentChunk, QueryResponse
+from app.domain.entities.query import Query, LLMResponse, TokenUsage
+from app.domain.interfaces.lexical_index import LexicalIndex
+from app.domain.interfaces.llm_provider import LLMProvider
+from app.domain.interfaces.reranker import Reranker
+from app.domain.interfaces.vector_store import VectorStore
+from app.infrastructure.cache.semantic_cache import SemanticCache
+from app.infrastructure.context.context_builder import BuiltContext, ContextBuilder
+from app.infrastructure.embeddings.embedding_service import EmbeddingService
+from app.infrastructure.evaluation.metrics import ResponseEvaluator
+from app.infrastructure.lexical.fusion import reciprocal_rank_fusion
 
-@dataclass
-class Query:
-    text: str
-    top_k: int = 5
-    filters: Optional[Dict[str, Any]] = None
+DEFAULT_PROMPT_PATH = Path(__file__).resolve().parents[3] / "prompts" / "system_v1.txt"
 
 
-@dataclass
-class QueryResponse:
-    text: str
-    sources: List[DocumentChunk]
-    metrics: Dict[str, Any]
-    model: str
\ No newline at end of file
+class RAGQueryUseCase:
+    """
+    Retrieval-augmented answering.
+
+    With a ``lexical_index``, retrieval is hybrid: BM25 and vector search
+    each fetch ``hybrid_candidates`` chunks concurrently and the lists are
+    merged by reciprocal rank fusion down to the query's ``top_k``.
+
+    With a ``reranker``, ``rerank_candidates`` chunks are retrieved and the
+    reranker picks the ``top_k`` that go into the prompt.
+
+    With a ``context_builder``, those chunks are deduplicated and fitted to
+    its token budget first; responses list the passages actually sent.
+    """
+    
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        vector_store: VectorStore,
+        embedding_service: EmbeddingService,
+        evaluator: ResponseEvaluator,
+        answer_cache: Optional[SemanticCache] = None,
+        system_prompt_path: Path = DEFAULT_PROMPT_PATH,
+        lexical_index: Optional[LexicalIndex] = None,
+        hybrid_candidates: int = 20,
+        rrf_k: int = 60,
+        reranker: Optional[Reranker] = None,
+        rerank_candidates: int = 50,
+        context_builder: Optional[ContextBuilder] = None
+    ):
+        self.llm_provider = llm_provider
+        self.vector_store = vector_store
+        self.embedding_service = embedding_service
+        self.evaluator = evaluator
+        self.answer_cache = answer_cache
+        self.lexical_index = lexical_index
+        self.hybrid_candidates = hybrid_candidates
+        self.rrf_k = rrf_k
+        self.reranker = reranker
+        self.rerank_candidates = rerank_candidates
+        self.context_builder = context_builder
+        # Read once instead of on every query
+        self.system_prompt = Path(system_prompt_path).read_text(encoding="utf-8").strip()
+
+    async def execute(self, query: Query) -> QueryResponse:
+        start_time = time.time()
+        embedding, sources = await self._retrieve(query)
+        retrieval_ms = (time.time() - start_time) * 1000
+
+        cached = self._lookup_cached(embedding, query, sources, retrieval_ms)
+        if cached:
+            return cached
+
+        passages, context = self._build_context(query.text, sources)
+        response = await self.llm_provider.generate(
+            self.build_messages(query.text, passages),
+            max_tokens=settings.max_tokens,
+            temperature=settings.temperature
+        )
+
+        metrics = self._finish(embedding, query, sources, response, retrieval_ms, context)
+
+        return QueryResponse(
+            text=response.text,
+            sources=passages,
+            metrics=metrics,
+            model=response.model
+        )
+
+    async def stream(self, query: Query) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the RAG pipeline, yielding events as soon as they are available:
+        ``sources`` after retrieval, one ``token`` per LLM delta, and a final
+        ``done`` event carrying the metrics.
+        """
+        start_time = time.time()
+        embedding, sources = await self._retrieve(query)
+        retrieval_ms = (time.time() - start_time) * 1000
+
+        cached = self._lookup_cached(embedding, query, sources, retrieval_ms)
+        if cached:
+            yield {"type": "sources", "sources": sources}
+            yield {"type": "token", "text": cached.text}
+            yield {"type": "done", "metrics": cached.metrics, "model": cached.model}
+            return
+
+        passages, context = self._build_context(query.text, sources)
+        yield {"type": "sources", "sources": passages}
+
+        llm_start = time.time()
+        ttfb_ms: Optional[float] = None
+        parts: List[str] = []
+        usage: Optional[TokenUsage] = None
+        model = None
+
+        async for chunk in self.llm_provider.stream(
+            self.build_messages(query.text, passages),
+            max_tokens=settings.max_tokens,
+            temperature=settings.temperature
+        ):
+            if chunk.usage:
+                usage = chunk.usage
+            model = chunk.model or model
+            if not chunk.text:
+                continue
+            if ttfb_ms is None:
+                ttfb_ms = (time.time() - llm_start) * 1000
+            parts.append(chunk.text)
+            yield {"type": "token", "text": chunk.text}
+
+        response = LLMResponse(
+            text="".join(parts),
+            usage=usage or TokenUsage(input_tokens=0, output_tokens=0, total_tokens=0),
+            model=model or "",
+            duration_ms=(time.time() - llm_start) * 1000,
+            ttfb_ms=ttfb_ms
+        )
+        metrics = self._finish(embedding, query, sources, response, retrieval_ms, context)
+
+        yield {"type": "done", "metrics": metrics, "model": response.model}
+
+    def build_messages(self, question: str, sources: List[DocumentChunk]) -> List[dict]:
+        context = "\n\n".join(
+            f"Documento {i}:\n{chunk.content}" for i, chunk in enumerate(sources, start=1)
+        )
+
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": f"Contexto:\n{context}\n\nPregunta: {question}"}
+        ]
+
+    def _build_context(
+        self,
+        question: str,
+        sources: List[DocumentChunk]
+    ) -> Tuple[List[DocumentChunk], Optional[BuiltContext]]:
+        if self.context_builder is None:
+            return sources, None
+
+        # Everything but the passages: system prompt, question and template
+        reserved = sum(
+            self.context_builder.count_tokens(message["content"])
+            for message in self.build_messages(question, [])
+        )
+        context = self.context_builder.build(question, sources, reserved_tokens=reserved)
+        return context.passages, context
+
+    async def _retrieve(self, query: Query) -> Tuple[List[float], List[DocumentChunk]]:
+        if self.reranker is None:
+            return await self._search(query, query.top_k)
+
+        embedding, candidates = await self._search(query, max(self.rerank_candidates, query.top_k))
+        return embedding, await self.reranker.rerank(query.text, candidates, query.top_k)
+
+    async def _search(self, query: Query, limit: int) -> Tuple[List[float], List[DocumentChunk]]:
+        # The lexical index cannot evaluate vector store filters
+        if self.lexical_index is None or query.filters:
+            return await self._vector_search(query, limit)
+
+        candidates = max(self.hybrid_candidates, limit)
+        (embedding, dense), lexical = await asyncio.gather(
+            self._vector_search(query, candidates),
+            self.lexical_index.search(query.text, top_k=candidates)
+        )
+        return embedding, reciprocal_rank_fusion([dense, lexical], limit, self.rrf_k)
+
+    async def _vector_search(self, query: Query, top_k: int) -> Tuple[List[float], List[DocumentChunk]]:
+        embedding = await self.embedding_service.embed(query.text)
+        sources = await self.vector_store.search(
+            embedding,
+            top_k=top_k,
+            filters=query.filters,
+            hnsw_ef=query.hnsw_ef,
+            exact=query.exact
+        )
+        return embedding, sources
+
+    def _lookup_cached(
+        self,
+        embedding: List[float],
+        query: Query,
+        sources: List[DocumentChunk],
+        retrieval_ms: float
+    ) -> Optional[QueryResponse]:
+        if self.answer_cache is None:
+            return None
+
+        # Matching on the retrieved chunk ids keeps answers tied to current sources
+        match = self.answer_cache.lookup(embedding, query.filters, [s.id for s in sources])
+        if match is None:
+            return None
+
+        entry, similarity = match
+        return QueryResponse(
+            text=entry.text,
+            sources=sources,
+            metrics={
+                "latency_ms": 0.0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "total_tokens": 0,
+                "cost_usd": 0.0,
+                "model": entry.model,
+                "retrieval_ms": retrieval_ms,
+                "cache_hit": True,
+                "cache_similarity": round(similarity, 4),
+                "cost_saved_usd": entry.cost_usd,
+                "semantic_cache": self.answer_cache.stats()
+            },
+            model=entry.model
+        )
+
+    def _finish(
+        self,
+        embedding: List[float],
+        query: Query,
+        sources: List[DocumentChunk],
+        response: LLMResponse,
+        retrieval_ms: float,
+        context: Optional[BuiltContext] = None
+    ) -> Dict[str, Any]:
+        metrics = self.evaluator.evaluate(response)
+        metrics["retrieval_ms"] = retrieval_ms
+        if context is not None:
+            metrics["context"] = context.stats()
+
+        if self.answer_cache is not None:
+            self.answer_cache.store(
+                embedding,
+                query.filters,
+                [s.id for s in sources],
+                text=response.text,
+                model=response.model,
+                cost_usd=metrics["cost_usd"]
+            )
+            metrics["cache_hit"] = False
+            metrics["semantic_cache"] = self.answer_cache.stats()
+
+        return metrics
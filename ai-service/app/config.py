@@ -1,3 +1,4 @@
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -5,22 +6,90 @@ class Settings(BaseSettings):
     # Groq
     groq_api_key: str
     groq_model: str = "llama-3.3-70b-versatile"
+    # Client-side pacing under the account's Groq limits for groq_model
+    groq_rate_limit_enabled: bool = True
+    groq_rpm_limit: int = 30
+    groq_tpm_limit: int = 12000
+    groq_max_concurrent: int = 8
+    # Calls expected to queue longer go to the fallback model, or get a 429
+    groq_max_queue_wait_seconds: float = 10.0
+    groq_fallback_model: str = ""
+    groq_fallback_rpm_limit: int = 30
+    groq_fallback_tpm_limit: int = 6000
+    
+    # LLM routing across providers, as a JSON list of {"name", "model", and
+    # optionally "base_url" of an OpenAI-compatible server and "api_key"};
+    # empty sends every call to groq_model
+    llm_providers: List[Dict[str, str]] = []
+    llm_timeout_seconds: float = 30.0
+    llm_hedging_enabled: bool = True
+    # Consecutive failures that take a provider out of rotation for the cooldown
+    llm_circuit_failure_threshold: int = 3
+    llm_circuit_cooldown_seconds: float = 30.0
     
     # Qdrant
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
     qdrant_collection: str = "documents"
+    # Payload fields to index for filtered search, as field -> schema type
+    qdrant_payload_indexes: Dict[str, str] = {"doc_id": "keyword", "doc_title": "keyword"}
+    # Collection tuning, applied on creation; `python -m app.migrate` applies changes
+    qdrant_hnsw_m: int = 16
+    qdrant_hnsw_ef_construct: int = 100
+    # Default search-time ef, overridable per request; unset uses Qdrant's default
+    qdrant_hnsw_ef: Optional[int] = None
+    qdrant_quantization_enabled: bool = False
+    qdrant_quantization_quantile: float = 0.99
+    qdrant_on_disk_vectors: bool = False
+    qdrant_on_disk_payload: bool = False
     
     # Embedding
     embedding_model: str = "all-MiniLM-L6-v2"
-    chunk_size: int = 500
-    chunk_overlap: int = 50
+    # Sizes in model tokens; chunk_size is capped at the model's sequence length
+    chunk_size: int = 256
+    chunk_overlap: int = 32
+    index_batch_size: int = 64
+    # Batches buffered between chunk, embed and upsert stages
+    index_pipeline_depth: int = 2
+    embedding_max_batch_size: int = 64
+    embedding_max_wait_ms: float = 5
+    embedding_cache_enabled: bool = True
+    embedding_cache_dir: str = "data/embedding_cache"
+    
+    # Background indexing jobs
+    job_store_path: str = "data/jobs.db"
+    job_content_dir: str = "data/jobs"
+    index_workers: int = 2
+    index_max_attempts: int = 3
+    # Retry delay doubles after each failed attempt
+    index_retry_backoff_seconds: float = 2.0
     
     # RAG
     top_k: int = 5
+    # Hybrid retrieval: BM25 + vector search fused by reciprocal rank
+    hybrid_search_enabled: bool = True
+    lexical_index_path: str = "data/lexical.db"
+    hybrid_candidates: int = 20
+    rrf_k: int = 60
+    # Cross-encoder reranking of over-fetched candidates
+    rerank_enabled: bool = True
+    rerank_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    rerank_candidates: int = 50
+    rerank_batch_size: int = 32
+    # Above this, candidates keep their retrieval order
+    rerank_budget_ms: float = 300
+    # Prompt budget for the system message, question and retrieved context
+    context_max_tokens: int = 3000
+    context_trim_sentences: bool = False
     max_tokens: int = 1000
     temperature: float = 0.7
     
+    # Semantic answer cache
+    semantic_cache_enabled: bool = True
+    semantic_cache_threshold: float = 0.95
+    semantic_cache_ttl_seconds: int = 3600
+    semantic_cache_max_size: int = 1000
+    
     # Service
     log_level: str = "INFO"
     
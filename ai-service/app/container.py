@@ -1,54 +1,157 @@
 from app.config import settings
 from app.infrastructure.groq.groq_client import GroqClient
+from app.infrastructure.llm.llm_router import LLMRouter
+from app.infrastructure.llm.rate_governor import RateGovernor
 from app.infrastructure.qdrant.qdrant_repo import QdrantRepository
 from app.infrastructure.embeddings.embedding_service import EmbeddingService
 from app.infrastructure.embeddings.chunking import ChunkingService
+from app.infrastructure.embeddings.reranker import CrossEncoderReranker
 from app.infrastructure.evaluation.metrics import ResponseEvaluator
+from app.infrastructure.cache.semantic_cache import SemanticCache
+from app.infrastructure.jobs.sqlite_job_store import SqliteJobStore
+from app.infrastructure.jobs.index_job_worker import IndexJobWorker
+from app.infrastructure.lexical.bm25_index import SqliteBm25Index
+from app.infrastructure.context.context_builder import ContextBuilder
 from app.application.use_cases.rag_query import RAGQueryUseCase
 from app.application.use_cases.index_document import IndexDocumentUseCase
+from app.application.use_cases.ingest_document import IngestDocumentUseCase
 
 
 class Container:
     def __init__(self):
         # Infrastructure
+        # Governed calls are retried through the governor's queue instead
         self.groq_client = GroqClient(
             api_key=settings.groq_api_key,
-            model_id=settings.groq_model
+            model_id=settings.groq_model,
+            max_attempts=1 if settings.groq_rate_limit_enabled else 3
         )
         
-        self.qdrant_repo = QdrantRepository(
-            host=settings.qdrant_host,
-            port=settings.qdrant_port,
-            collection_name=settings.qdrant_collection
-        )
+        self.llm_router = LLMRouter.from_settings(settings) if settings.llm_providers else None
+        # Paces the single Groq model; a router fails over instead of queueing
+        self.llm_governor = self._rate_governor() if (
+            settings.groq_rate_limit_enabled and self.llm_router is None
+        ) else None
+        self.llm_provider = self.llm_router or self.llm_governor or self.groq_client
+        
+        self.qdrant_repo = QdrantRepository.from_settings(settings)
         
         self.embedding_service = EmbeddingService(
-            model_name=settings.embedding_model
+            model_name=settings.embedding_model,
+            max_batch_size=settings.embedding_max_batch_size,
+            max_wait_ms=settings.embedding_max_wait_ms,
+            cache_dir=settings.embedding_cache_dir if settings.embedding_cache_enabled else None
         )
         
+        # Chunks longer than the model's window would be silently truncated
         self.chunking_service = ChunkingService(
-            chunk_size=settings.chunk_size,
-            overlap=settings.chunk_overlap
+            chunk_size=min(settings.chunk_size, self.embedding_service.max_tokens),
+            overlap=settings.chunk_overlap,
+            token_offsets=self.embedding_service.token_offsets
         )
         
+        self.reranker = CrossEncoderReranker(
+            model_name=settings.rerank_model,
+            batch_size=settings.rerank_batch_size,
+            budget_ms=settings.rerank_budget_ms
+        ) if settings.rerank_enabled else None
+        
         self.evaluator = ResponseEvaluator()
         
+        self.answer_cache = SemanticCache(
+            threshold=settings.semantic_cache_threshold,
+            ttl_seconds=settings.semantic_cache_ttl_seconds,
+            max_size=settings.semantic_cache_max_size
+        ) if settings.semantic_cache_enabled else None
+        
+        self.job_store = SqliteJobStore(settings.job_store_path)
+        
+        self.lexical_index = SqliteBm25Index(
+            settings.lexical_index_path
+        ) if settings.hybrid_search_enabled else None
+        
+        # The embedding tokenizer stands in for the LLM's; it counts slightly high
+        self.context_builder = ContextBuilder(
+            count_tokens=self.embedding_service.count_tokens,
+            max_tokens=settings.context_max_tokens,
+            trim_sentences=settings.context_trim_sentences
+        )
+        
         # Use Cases
         self.rag_query_use_case = RAGQueryUseCase(
-            llm_provider=self.groq_client,
+            llm_provider=self.llm_provider,
             vector_store=self.qdrant_repo,
             embedding_service=self.embedding_service,
-            evaluator=self.evaluator
+            evaluator=self.evaluator,
+            answer_cache=self.answer_cache,
+            lexical_index=self.lexical_index,
+            hybrid_candidates=settings.hybrid_candidates,
+            rrf_k=settings.rrf_k,
+            reranker=self.reranker,
+            rerank_candidates=settings.rerank_candidates,
+            context_builder=self.context_builder
         )
         
         self.index_document_use_case = IndexDocumentUseCase(
             vector_store=self.qdrant_repo,
             embedding_service=self.embedding_service,
-            chunking_service=self.chunking_service
+            chunking_service=self.chunking_service,
+            batch_size=settings.index_batch_size,
+            pipeline_depth=settings.index_pipeline_depth,
+            lexical_index=self.lexical_index
+        )
+        
+        self.ingest_document_use_case = IngestDocumentUseCase(
+            index_document_use_case=self.index_document_use_case,
+            job_store=self.job_store
+        )
+        
+        self.index_job_worker = IndexJobWorker(
+            job_store=self.job_store,
+            index_document_use_case=self.index_document_use_case,
+            content_dir=settings.job_content_dir,
+            concurrency=settings.index_workers,
+            max_attempts=settings.index_max_attempts,
+            backoff_seconds=settings.index_retry_backoff_seconds
+        )
+    
+    def _rate_governor(self) -> RateGovernor:
+        fallback = RateGovernor(
+            GroqClient(
+                api_key=settings.groq_api_key,
+                model_id=settings.groq_fallback_model,
+                max_attempts=1
+            ),
+            rpm_limit=settings.groq_fallback_rpm_limit,
+            tpm_limit=settings.groq_fallback_tpm_limit,
+            max_concurrent=settings.groq_max_concurrent,
+            max_queue_wait_seconds=settings.groq_max_queue_wait_seconds
+        ) if settings.groq_fallback_model else None
+        
+        return RateGovernor(
+            self.groq_client,
+            rpm_limit=settings.groq_rpm_limit,
+            tpm_limit=settings.groq_tpm_limit,
+            max_concurrent=settings.groq_max_concurrent,
+            max_queue_wait_seconds=settings.groq_max_queue_wait_seconds,
+            fallback=fallback
         )
     
     async def initialize(self):
         await self.qdrant_repo.initialize(vector_size=self.embedding_service.dimension)
+        self.embedding_service.start()
+        await self.index_job_worker.start()
+    
+    async def shutdown(self):
+        await self.index_job_worker.stop()
+        await self.embedding_service.stop()
+        if self.reranker:
+            self.reranker.stop()
+        self.job_store.close()
+        if self.lexical_index:
+            self.lexical_index.close()
+        if self.llm_router:
+            await self.llm_router.close()
 
 
 container = Container()
\ No newline at end of file
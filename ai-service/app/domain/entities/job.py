@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class IndexJob:
+    id: str
+    doc_id: str
+    title: str
+    metadata: dict = None
+    status: JobStatus = JobStatus.PENDING
+    bytes_received: int = 0
+    chunks_indexed: int = 0
+    total_words: int = 0
+    chunks_inserted: int = 0
+    chunks_reused: int = 0
+    chunks_deleted: int = 0
+    error: Optional[str] = None
+    attempts: int = 0
+    # Set for queued jobs whose text was stored on submission
+    content_path: Optional[str] = None
+    next_attempt_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    
+    def __post_init__(self):
+        if self.metadata is None:
+            self.metadata = {}
+    
+    def record_progress(self, result: dict) -> None:
+        """Copy counters from an IndexDocumentUseCase result."""
+        self.chunks_indexed = result["chunks_created"]
+        self.total_words = result["total_words"]
+        self.chunks_inserted = result["chunks_inserted"]
+        self.chunks_reused = result["chunks_reused"]
+        self.chunks_deleted = result["chunks_deleted"]
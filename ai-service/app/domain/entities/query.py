@@ -7,6 +7,9 @@ class Query:
     text: str
     top_k: int = 5
     filters: Optional[dict] = None
+    # Vector search accuracy: larger hnsw_ef raises recall and latency
+    hnsw_ef: Optional[int] = None
+    exact: bool = False
     
 
 @dataclass
@@ -15,6 +18,14 @@ class LLMResponse:
     usage: 'TokenUsage'
     model: str
     duration_ms: float
+    ttfb_ms: Optional[float] = None
+
+
+@dataclass
+class LLMStreamChunk:
+    text: str
+    usage: Optional['TokenUsage'] = None
+    model: Optional[str] = None
 
 
 @dataclass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from app.domain.entities.job import IndexJob, JobStatus
+
+
+class JobStore(ABC):
+    @abstractmethod
+    async def create(self, job: IndexJob) -> IndexJob:
+        pass
+    
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[IndexJob]:
+        pass
+    
+    @abstractmethod
+    async def update(self, job: IndexJob) -> None:
+        pass
+    
+    @abstractmethod
+    async def list(self, status: Optional[JobStatus] = None, limit: int = 100) -> List[IndexJob]:
+        pass
+    
+    @abstractmethod
+    async def claim_next(self, now: datetime) -> Optional[IndexJob]:
+        """Atomically mark the oldest due queued job as running and return it."""
+        pass
+    
+    @abstractmethod
+    async def claim_upload(self, job_id: str, now: datetime) -> Optional[IndexJob]:
+        """Atomically mark a queued streamed-upload job as running; None if it is not claimable."""
+        pass
+    
+    @abstractmethod
+    async def recover(self) -> int:
+        """Requeue jobs left running by a previous process; returns how many."""
+        pass
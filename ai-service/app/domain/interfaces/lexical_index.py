@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from app.domain.entities.document import DocumentChunk
+
+
+class LexicalIndex(ABC):
+    """Keyword index over chunk text, kept alongside the vector store."""
+    
+    @abstractmethod
+    async def add(self, chunks: List[DocumentChunk]) -> None:
+        pass
+    
+    @abstractmethod
+    async def search(self, text: str, top_k: int = 5) -> List[DocumentChunk]:
+        """Chunks matching any query term, best first."""
+        pass
+    
+    @abstractmethod
+    async def update_metadata(self, metadata_by_id: Dict[str, dict]) -> None:
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, chunk_ids: List[str]) -> None:
+        pass
+    
+    @abstractmethod
+    async def delete_document(self, doc_id: str) -> None:
+        pass
@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List
-from app.domain.entities.query import LLMResponse
+from typing import AsyncIterator, List, Optional
+from app.domain.entities.query import LLMResponse, LLMStreamChunk
+
+
+class ProviderRateLimitError(Exception):
+    """The provider rejected a call for exceeding its rate limits (HTTP 429)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class LLMProvider(ABC):
@@ -11,4 +19,14 @@ class LLMProvider(ABC):
         max_tokens: int = 1000,
         temperature: float = 0.7
     ) -> LLMResponse:
-        pass
\ No newline at end of file
+        pass
+    
+    async def stream(
+        self,
+        messages: List[dict],
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> AsyncIterator[LLMStreamChunk]:
+        # Providers without native streaming emit the whole answer at once
+        response = await self.generate(messages, max_tokens, temperature)
+        yield LLMStreamChunk(text=response.text, usage=response.usage, model=response.model)
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import List
+from app.domain.entities.document import DocumentChunk
+
+
+class Reranker(ABC):
+    @abstractmethod
+    async def rerank(self, query: str, chunks: List[DocumentChunk], top_k: int) -> List[DocumentChunk]:
+        """The ``top_k`` chunks most relevant to ``query``, best first."""
+        pass
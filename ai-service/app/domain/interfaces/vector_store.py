@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional
 from app.domain.entities.document import DocumentChunk
 
 
@@ -13,10 +13,32 @@ class VectorStore(ABC):
         self, 
         embedding: List[float], 
         top_k: int = 5,
-        filters: dict = None
+        filters: dict = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False
     ) -> List[DocumentChunk]:
+        """``hnsw_ef`` trades latency for recall; ``exact`` skips the index entirely."""
         pass
     
     @abstractmethod
     async def delete(self, chunk_id: str) -> bool:
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, chunk_ids: List[str]) -> None:
+        pass
+    
+    @abstractmethod
+    async def delete_document(self, doc_id: str) -> None:
+        """Delete every chunk of a document."""
+        pass
+    
+    @abstractmethod
+    async def get_document_chunks(self, doc_id: str) -> Dict[str, dict]:
+        """Metadata of every stored chunk of a document, keyed by chunk id."""
+        pass
+    
+    @abstractmethod
+    async def update_metadata(self, metadata_by_id: Dict[str, dict]) -> None:
+        """Overwrite the given metadata fields of stored chunks, keeping their embeddings."""
         pass
\ No newline at end of file
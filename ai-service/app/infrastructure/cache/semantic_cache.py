@@ -0,0 +1,115 @@
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+import numpy as np
+
+
+@dataclass
+class CachedAnswer:
+    embedding: np.ndarray
+    filters_key: str
+    source_ids: FrozenSet[str]
+    text: str
+    model: str
+    cost_usd: float
+    expires_at: float
+
+
+class SemanticCache:
+    """
+    In-memory cache of answers keyed by query meaning.
+
+    A lookup hits when a stored query has the same filters, a cosine
+    similarity of at least ``threshold`` and was answered from exactly the
+    chunks retrieved now, so answers are never served from stale sources.
+    Entries expire after ``ttl_seconds``; beyond ``max_size`` the least
+    recently used entry is evicted.
+    """
+
+    def __init__(self, threshold: float = 0.95, ttl_seconds: int = 3600, max_size: int = 1000):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.cost_saved_usd = 0.0
+        self._entries: "OrderedDict[int, CachedAnswer]" = OrderedDict()
+        self._next_id = 0
+
+    def lookup(
+        self,
+        embedding: List[float],
+        filters: Optional[dict],
+        source_ids: Iterable[str]
+    ) -> Optional[Tuple[CachedAnswer, float]]:
+        now = time.time()
+        query = self._normalize(embedding)
+        filters_key = self._filters_key(filters)
+        source_ids = frozenset(source_ids)
+
+        best: Optional[Tuple[int, float]] = None
+        for entry_id, entry in list(self._entries.items()):
+            if entry.expires_at <= now:
+                del self._entries[entry_id]
+                continue
+            if entry.filters_key != filters_key or entry.source_ids != source_ids:
+                continue
+            similarity = float(np.dot(query, entry.embedding))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (entry_id, similarity)
+
+        if best is None:
+            self.misses += 1
+            return None
+
+        entry_id, similarity = best
+        entry = self._entries[entry_id]
+        self._entries.move_to_end(entry_id)
+        self.hits += 1
+        self.cost_saved_usd += entry.cost_usd
+        return entry, similarity
+
+    def store(
+        self,
+        embedding: List[float],
+        filters: Optional[dict],
+        source_ids: Iterable[str],
+        text: str,
+        model: str,
+        cost_usd: float
+    ) -> None:
+        self._entries[self._next_id] = CachedAnswer(
+            embedding=self._normalize(embedding),
+            filters_key=self._filters_key(filters),
+            source_ids=frozenset(source_ids),
+            text=text,
+            model=model,
+            cost_usd=cost_usd,
+            expires_at=time.time() + self.ttl_seconds
+        )
+        self._next_id += 1
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "cost_saved_usd": round(self.cost_saved_usd, 6)
+        }
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    @staticmethod
+    def _filters_key(filters: Optional[dict]) -> str:
+        return json.dumps(filters or {}, sort_keys=True, default=str)
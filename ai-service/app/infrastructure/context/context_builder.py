@@ -0,0 +1,153 @@
+import re
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from app.domain.entities.document import DocumentChunk
+from app.infrastructure.embeddings.chunking import SEGMENT_BOUNDARY
+
+TokenCounter = Callable[[str], int]
+Span = Tuple[int, int]
+
+QUERY_TERM = re.compile(r"\w{3,}")
+# Joins the parts of a chunk left after removing text already in the context
+GAP = " … "
+
+
+@dataclass
+class BuiltContext:
+    passages: List[DocumentChunk]
+    tokens: int
+    tokens_saved: int
+    overlaps_removed: int = 0
+    sentences_trimmed: int = 0
+    dropped: int = 0
+
+    def stats(self) -> dict:
+        return {
+            "chunks": len(self.passages),
+            "tokens": self.tokens,
+            "tokens_saved": self.tokens_saved,
+            "overlaps_removed": self.overlaps_removed,
+            "sentences_trimmed": self.sentences_trimmed,
+            "dropped": self.dropped
+        }
+
+
+class ContextBuilder:
+    """
+    Fits retrieved chunks into an input token budget, most relevant first.
+
+    Text a chunk shares with an already selected chunk of the same document
+    (the chunker's overlap, or neighbouring chunks) is cut using the chunks'
+    character offsets, so it is only paid for once. With ``trim_sentences``,
+    a chunk keeps only the sentences sharing the most words with the query.
+    Chunks that no longer fit are skipped; ``tokens_saved`` compares the
+    result with sending every retrieved chunk whole.
+    """
+
+    def __init__(
+        self,
+        count_tokens: TokenCounter,
+        max_tokens: int = 3000,
+        trim_sentences: bool = False
+    ):
+        self.count_tokens = count_tokens
+        self.max_tokens = max_tokens
+        self.trim_sentences = trim_sentences
+
+    def build(self, question: str, chunks: List[DocumentChunk], reserved_tokens: int = 0) -> BuiltContext:
+        """``reserved_tokens`` is the rest of the prompt (system message, question)."""
+        budget = self.max_tokens - reserved_tokens
+        terms = {term.lower() for term in QUERY_TERM.findall(question)}
+        covered: Dict[str, List[Span]] = {}
+        seen: Set[str] = set()
+        context = BuiltContext(passages=[], tokens=0, tokens_saved=0)
+        full_tokens = 0
+
+        for chunk in chunks:
+            full_tokens += self.count_tokens(chunk.content)
+            text = self._new_text(chunk, covered, seen)
+            if text is None:
+                context.overlaps_removed += 1
+                continue
+            if text != chunk.content:
+                context.overlaps_removed += 1
+
+            if self.trim_sentences:
+                trimmed = self._relevant_sentences(text, terms)
+                if trimmed != text:
+                    context.sentences_trimmed += 1
+                    text = trimmed
+
+            tokens = self.count_tokens(text)
+            if context.tokens + tokens > budget:
+                context.dropped += 1
+                continue
+
+            context.tokens += tokens
+            context.passages.append(replace(chunk, content=text))
+            self._mark_covered(chunk, covered, seen)
+
+        context.tokens_saved = full_tokens - context.tokens
+        return context
+
+    def _new_text(
+        self,
+        chunk: DocumentChunk,
+        covered: Dict[str, List[Span]],
+        seen: Set[str]
+    ) -> Optional[str]:
+        """The chunk's text minus what the context already holds; None if nothing is left."""
+        span = self._span(chunk)
+        if span is None:
+            return None if chunk.content in seen else chunk.content
+
+        start, end = span
+        parts = []
+        position = start
+        for covered_start, covered_end in sorted(covered.get(chunk.metadata["doc_id"], [])):
+            if covered_end <= position or covered_start >= end:
+                continue
+            if covered_start > position:
+                parts.append(chunk.content[position - start:covered_start - start])
+            position = max(position, covered_end)
+        if position < end:
+            parts.append(chunk.content[position - start:])
+
+        parts = [part.strip() for part in parts if part.strip()]
+        return GAP.join(parts) if parts else None
+
+    def _mark_covered(
+        self,
+        chunk: DocumentChunk,
+        covered: Dict[str, List[Span]],
+        seen: Set[str]
+    ) -> None:
+        span = self._span(chunk)
+        if span is None:
+            seen.add(chunk.content)
+        else:
+            covered.setdefault(chunk.metadata["doc_id"], []).append(span)
+
+    @staticmethod
+    def _span(chunk: DocumentChunk) -> Optional[Span]:
+        metadata = chunk.metadata
+        if "doc_id" not in metadata or "start_char" not in metadata or "end_char" not in metadata:
+            return None
+        return metadata["start_char"], metadata["end_char"]
+
+    @staticmethod
+    def _relevant_sentences(text: str, terms: Set[str]) -> str:
+        sentences = [s for s in SEGMENT_BOUNDARY.split(text) if s.strip()]
+        scores = [
+            len(terms & {word.lower() for word in QUERY_TERM.findall(sentence)})
+            for sentence in sentences
+        ]
+        best = max(scores, default=0)
+        if best == 0:
+            # Nothing to go on lexically; the retriever found the chunk relevant as a whole
+            return text
+
+        # Sentences matching only a common word are dropped when better ones exist
+        keep = [s.strip() for s, score in zip(sentences, scores) if score * 2 >= best]
+        return " ".join(keep) if len(keep) < len(sentences) else text
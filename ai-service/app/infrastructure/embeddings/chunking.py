@@ -1,32 +1,241 @@
-from typing import List
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 import hashlib
+import re
+import zlib
+
+Span = Tuple[int, int]
+TokenOffsets = Callable[[str], List[Span]]
+
+# Paragraph breaks, or whitespace following sentence-ending punctuation
+SEGMENT_BOUNDARY = re.compile(r"\n\s*\n|(?<=[.!?])\s+")
+WORD = re.compile(r"\S+")
+
+# About one piece in ANCHOR_PERIOD is a content-defined cut point, see _ChunkPacker
+ANCHOR_PERIOD = 8
+
+
+def word_offsets(text: str) -> List[Span]:
+    return [match.span() for match in WORD.finditer(text)]
 
 
 class ChunkingService:
-    def __init__(self, chunk_size: int = 500, overlap: int = 50):
+    """
+    Splits text into overlapping chunks sized in model tokens.
+
+    Chunks are built from whole sentences and paragraphs where possible and
+    are yielded lazily as slices of the original string, so only the chunk
+    being built is held besides the input. ``token_offsets`` returns the
+    character span of each token (e.g. the embedding model's tokenizer);
+    without it, whitespace-separated words are counted.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 256,
+        overlap: int = 32,
+        token_offsets: Optional[TokenOffsets] = None
+    ):
+        if overlap >= chunk_size:
+            raise ValueError("overlap must be smaller than chunk_size")
         self.chunk_size = chunk_size
         self.overlap = overlap
-    
+        self.token_offsets = token_offsets or word_offsets
+
     def chunk_text(self, text: str, doc_id: str) -> List[dict]:
-        words = text.split()
-        chunks = []
-        
-        for i in range(0, len(words), self.chunk_size - self.overlap):
-            chunk_words = words[i:i + self.chunk_size]
-            chunk_text = " ".join(chunk_words)
-            
-            chunk_id = self._generate_chunk_id(doc_id, i)
-            chunks.append({
-                "id": chunk_id,
-                "content": chunk_text,
-                "metadata": {
-                    "doc_id": doc_id,
-                    "chunk_index": len(chunks),
-                    "word_count": len(chunk_words)
-                }
-            })
-        
-        return chunks
-    
-    def _generate_chunk_id(self, doc_id: str, index: int) -> str:
-        return hashlib.md5(f"{doc_id}_{index}".encode()).hexdigest()
\ No newline at end of file
+        return list(self.iter_chunks(text, doc_id))
+
+    def iter_chunks(self, text: str, doc_id: str) -> Iterator[dict]:
+        packer = _ChunkPacker(self.chunk_size, self.overlap)
+        seen: Dict[str, int] = {}
+        index = 0
+
+        for piece in self._iter_pieces(text, 0, len(text)):
+            span = packer.add(*piece)
+            if span:
+                yield self._make_chunk(text, 0, doc_id, index, span, seen)
+                index += 1
+
+        span = packer.finish()
+        if span:
+            yield self._make_chunk(text, 0, doc_id, index, span, seen)
+
+    async def iter_chunks_stream(
+        self,
+        blocks: AsyncIterator[str],
+        doc_id: str,
+        max_pending_chars: int = 65536
+    ) -> AsyncIterator[dict]:
+        """
+        Chunk text arriving in blocks, e.g. a streamed upload.
+
+        Text is only split up to the last sentence or paragraph boundary
+        seen so far; everything before the current chunk is dropped, so
+        memory stays bounded regardless of document size. Offsets in the
+        metadata refer to the whole stream.
+        """
+        packer = _ChunkPacker(self.chunk_size, self.overlap)
+        buffer = ""
+        base = 0      # stream offset of buffer[0]
+        scanned = 0   # buffer offset up to which pieces were produced
+        seen: Dict[str, int] = {}
+        index = 0
+
+        async for block in blocks:
+            buffer += block
+            complete = self._complete_prefix(buffer, scanned, max_pending_chars)
+            if complete <= scanned:
+                continue
+
+            for start, end, tokens, anchor in self._iter_pieces(buffer, scanned, complete):
+                span = packer.add(base + start, base + end, tokens, anchor)
+                if span:
+                    yield self._make_chunk(buffer, base, doc_id, index, span, seen)
+                    index += 1
+            scanned = complete
+
+            # Keep only what the next chunk may still need
+            keep_from = min(packer.window_start - base, scanned) if packer.window_start is not None else scanned
+            buffer = buffer[keep_from:]
+            base += keep_from
+            scanned -= keep_from
+
+        for start, end, tokens, anchor in self._iter_pieces(buffer, scanned, len(buffer)):
+            span = packer.add(base + start, base + end, tokens, anchor)
+            if span:
+                yield self._make_chunk(buffer, base, doc_id, index, span, seen)
+                index += 1
+
+        span = packer.finish()
+        if span:
+            yield self._make_chunk(buffer, base, doc_id, index, span, seen)
+
+    def _complete_prefix(self, buffer: str, scanned: int, max_pending_chars: int) -> int:
+        """Offset in buffer up to which text cannot change the segmentation."""
+        last = None
+        for last in SEGMENT_BOUNDARY.finditer(buffer, scanned):
+            pass
+        if last is not None:
+            return last.end()
+
+        # No boundary for too long: cut at the last whitespace instead
+        if len(buffer) - scanned > max_pending_chars:
+            cut = max(buffer.rfind(" ", scanned), buffer.rfind("\n", scanned))
+            return cut + 1 if cut >= scanned else len(buffer)
+        return scanned
+
+    def _iter_pieces(self, text: str, start: int, end: int) -> Iterator[Tuple[int, int, int, bool]]:
+        """Yield (start, end, token_count, is_anchor) for each sentence, split further if too long."""
+        piece_size = self.overlap or self.chunk_size
+
+        for segment_start, segment_end in self._iter_segments(text, start, end):
+            offsets = self.token_offsets(text[segment_start:segment_end])
+            if not offsets:
+                continue
+
+            if len(offsets) <= self.chunk_size:
+                windows = [offsets]
+            else:
+                # Over-long sentence: fall back to token windows small enough to overlap
+                windows = [offsets[i:i + piece_size] for i in range(0, len(offsets), piece_size)]
+
+            for window in windows:
+                piece_start, piece_end = segment_start + window[0][0], segment_start + window[-1][1]
+                yield piece_start, piece_end, len(window), self._is_anchor(text[piece_start:piece_end])
+
+    def _iter_segments(self, text: str, start: int, end: int) -> Iterator[Span]:
+        position = start
+        for match in SEGMENT_BOUNDARY.finditer(text, start, end):
+            if match.start() > position:
+                yield position, match.start()
+            position = match.end()
+        if position < end:
+            yield position, end
+
+    @staticmethod
+    def _is_anchor(piece: str) -> bool:
+        return zlib.crc32(piece.encode()) % ANCHOR_PERIOD == 0
+
+    def _make_chunk(
+        self,
+        text: str,
+        base: int,
+        doc_id: str,
+        index: int,
+        span: Tuple[int, int, int],
+        seen: Dict[str, int]
+    ) -> dict:
+        start, end, tokens = span
+        content = text[start - base:end - base]
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        occurrence = seen.get(content_hash, 0)
+        seen[content_hash] = occurrence + 1
+
+        return {
+            "id": self._generate_chunk_id(doc_id, content_hash, occurrence),
+            "content": content,
+            "metadata": {
+                "doc_id": doc_id,
+                "chunk_index": index,
+                "content_hash": content_hash,
+                "word_count": len(content.split()),
+                "token_count": tokens,
+                "start_char": start,
+                "end_char": end
+            }
+        }
+
+    def _generate_chunk_id(self, doc_id: str, content_hash: str, occurrence: int) -> str:
+        # Content-addressed, so unchanged chunks keep their id when a document is edited
+        return hashlib.md5(f"{doc_id}_{content_hash}_{occurrence}".encode()).hexdigest()
+
+
+class _ChunkPacker:
+    """
+    Greedily packs consecutive pieces into chunks, carrying an overlap.
+
+    A chunk that is at least half full is also cut before an anchor piece.
+    Anchors depend only on the piece's text, so after an edit the chunk
+    boundaries realign at the next anchor and later chunks come out
+    identical, which keeps re-indexing proportional to the edit.
+    """
+
+    def __init__(self, chunk_size: int, overlap: int):
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self._window: Deque[Tuple[int, int, int]] = deque()
+        self._tokens = 0
+
+    @property
+    def window_start(self) -> Optional[int]:
+        return self._window[0][0] if self._window else None
+
+    def add(
+        self,
+        start: int,
+        end: int,
+        tokens: int,
+        anchor: bool = False
+    ) -> Optional[Tuple[int, int, int]]:
+        """Add a piece; returns the finished chunk span if the piece starts a new chunk."""
+        span = None
+        full = self._tokens + tokens > self.chunk_size
+        at_anchor = anchor and self._tokens * 2 >= self.chunk_size
+        if self._window and (full or at_anchor):
+            span = self._span()
+
+            # Carry trailing pieces that fit in the overlap into the next chunk
+            while self._window and (
+                self._tokens > self.overlap or self._tokens + tokens > self.chunk_size
+            ):
+                self._tokens -= self._window.popleft()[2]
+
+        self._window.append((start, end, tokens))
+        self._tokens += tokens
+        return span
+
+    def finish(self) -> Optional[Tuple[int, int, int]]:
+        return self._span() if self._window else None
+
+    def _span(self) -> Tuple[int, int, int]:
+        return self._window[0][0], self._window[-1][1], self._tokens
@@ -0,0 +1,115 @@
+import hashlib
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+
+DIGEST_SIZE = 32
+
+
+class EmbeddingCache:
+    """
+    Persistent, content-addressed store of embeddings for one model.
+
+    Keys are SHA-256 digests of (model name, normalized text). Vectors are
+    appended as raw float32 rows to ``<model>.vectors`` and read back through
+    a memory map; the matching digests are appended to ``<model>.keys``, so
+    row ``i`` of one file belongs to digest ``i`` of the other. Only the
+    digest -> row index lives in memory.
+    """
+
+    def __init__(self, directory: str, model_name: str, dimension: int):
+        self.model_name = model_name
+        self.dimension = dimension
+        self.hits = 0
+        self.misses = 0
+
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self._keys_path = Path(directory) / f"{safe_name}.keys"
+        self._vectors_path = Path(directory) / f"{safe_name}.vectors"
+        self._row_bytes = dimension * np.dtype(np.float32).itemsize
+        self._index: Dict[bytes, int] = {}
+        self._rows = 0
+        self._vectors: Optional[np.memmap] = None
+        self._load()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def key(self, text: str) -> bytes:
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        return hashlib.sha256(f"{self.model_name}\0{normalized}".encode()).digest()
+
+    def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        results: List[Optional[List[float]]] = []
+        for text in texts:
+            row = self._index.get(self.key(text))
+            if row is None:
+                self.misses += 1
+                results.append(None)
+            else:
+                self.hits += 1
+                results.append(self._read_row(row))
+        return results
+
+    def put_many(self, texts: List[str], vectors: List[List[float]]) -> None:
+        new_keys: Dict[bytes, List[float]] = {}
+        for text, vector in zip(texts, vectors):
+            key = self.key(text)
+            if key not in self._index:
+                new_keys.setdefault(key, vector)
+        if not new_keys:
+            return
+
+        # Vectors first: a crash in between leaves extra rows, trimmed on load
+        with open(self._vectors_path, "ab") as f:
+            f.write(np.asarray(list(new_keys.values()), dtype=np.float32).tobytes())
+        with open(self._keys_path, "ab") as f:
+            f.write(b"".join(new_keys))
+
+        for key in new_keys:
+            self._index[key] = self._rows
+            self._rows += 1
+        self._vectors = None
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._rows,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "size_bytes": self._rows * self._row_bytes
+        }
+
+    def _read_row(self, row: int) -> List[float]:
+        if self._vectors is None:
+            self._vectors = np.memmap(
+                self._vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(self._rows, self.dimension)
+            )
+        return self._vectors[row].tolist()
+
+    def _load(self) -> None:
+        keys = self._keys_path.read_bytes() if self._keys_path.exists() else b""
+        vector_rows = (
+            self._vectors_path.stat().st_size // self._row_bytes
+            if self._vectors_path.exists() else 0
+        )
+
+        rows = min(len(keys) // DIGEST_SIZE, vector_rows)
+        for row in range(rows):
+            self._index.setdefault(keys[row * DIGEST_SIZE:(row + 1) * DIGEST_SIZE], row)
+        self._rows = rows
+
+        # Drop anything half-written by an interrupted append
+        if self._keys_path.exists() and len(keys) != rows * DIGEST_SIZE:
+            with open(self._keys_path, "r+b") as f:
+                f.truncate(rows * DIGEST_SIZE)
+        if self._vectors_path.exists() and self._vectors_path.stat().st_size != rows * self._row_bytes:
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(rows * self._row_bytes)
@@ -1,16 +1,163 @@
-from typing import List
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from sentence_transformers import SentenceTransformer
 
+from app.infrastructure.embeddings.embedding_cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
 
 class EmbeddingService:
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    """
+    Runs SentenceTransformer off the event loop.
+
+    Once started, concurrent ``embed`` calls are queued and coalesced into
+    micro-batches of up to ``max_batch_size`` texts, waiting at most
+    ``max_wait_ms`` for a batch to fill. Encoding happens on a dedicated
+    thread; torch releases the GIL and parallelises the batch internally.
+
+    With a ``cache_dir``, ``batch_embed`` only encodes texts whose vectors
+    are not already in the persistent EmbeddingCache.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5,
+        cache_dir: Optional[str] = None
+    ):
         self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
         self.dimension = self.model.get_sentence_embedding_dimension()
-    
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.stats = {"requests": 0, "batches": 0}
+        self.cache = (
+            EmbeddingCache(cache_dir, model_name, self.dimension) if cache_dir else None
+        )
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while self._queue and not self._queue.empty():
+            self._fail([self._queue.get_nowait()], RuntimeError("Embedding service stopped"))
+        self._executor.shutdown(wait=False)
+
+    @property
+    def max_tokens(self) -> int:
+        # Leave room for the [CLS]/[SEP] tokens added on encode
+        return self.model.max_seq_length - 2
+
+    def token_offsets(self, text: str) -> List[Tuple[int, int]]:
+        encoding = self.model.tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            verbose=False
+        )
+        return encoding["offset_mapping"]
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.token_offsets(text))
+
     async def embed(self, text: str) -> List[float]:
-        embedding = self.model.encode(text, convert_to_tensor=False)
-        return embedding.tolist()
-    
+        self.stats["requests"] += 1
+        if self._task is None:
+            return (await self._encode([text]))[0]
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
     async def batch_embed(self, texts: List[str]) -> List[List[float]]:
-        embeddings = self.model.encode(texts, convert_to_tensor=False)
-        return embeddings.tolist()
\ No newline at end of file
+        if not texts:
+            return []
+        if self.cache is None:
+            return await self._encode(texts)
+
+        embeddings = self.cache.get_many(texts)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = await self._encode([texts[i] for i in missing])
+            self.cache.put_many([texts[i] for i in missing], computed)
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+
+        logger.info(
+            f"Embedded {len(texts)} texts, {len(texts) - len(missing)} from cache "
+            f"(hit rate {self.cache.stats()['hit_rate']:.1%})"
+        )
+        return embeddings
+
+    async def _encode(self, texts: List[str]) -> List[List[float]]:
+        self.stats["batches"] += 1
+        embeddings = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(
+                self.model.encode,
+                texts,
+                batch_size=self.max_batch_size,
+                convert_to_tensor=False
+            )
+        )
+        return embeddings.tolist()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Callers that gave up (e.g. client disconnected) are skipped
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                vectors = await self._encode([text for text, _ in batch])
+            except asyncio.CancelledError:
+                self._fail(batch, RuntimeError("Embedding service stopped"))
+                raise
+            except Exception as e:
+                self._fail(batch, e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[str, asyncio.Future]], error: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
@@ -0,0 +1,72 @@
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from sentence_transformers import CrossEncoder
+
+from app.domain.entities.document import DocumentChunk
+from app.domain.interfaces.reranker import Reranker
+
+logger = logging.getLogger(__name__)
+
+
+class CrossEncoderReranker(Reranker):
+    """
+    Reorders retrieved candidates with a local cross-encoder.
+
+    Query/chunk pairs are scored in batches of ``batch_size`` on a dedicated
+    thread, so the event loop keeps serving requests. If scoring takes
+    longer than ``budget_ms`` the candidates are returned in retrieval order
+    instead; a request queued behind the slow one is dropped before it
+    starts, so timeouts do not pile up work on the model thread.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        batch_size: int = 32,
+        budget_ms: float = 300
+    ):
+        self.model = CrossEncoder(model_name)
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.budget = budget_ms / 1000
+        self.stats = {"requests": 0, "fallbacks": 0, "last_ms": 0.0}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reranker")
+
+    def stop(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def rerank(self, query: str, chunks: List[DocumentChunk], top_k: int) -> List[DocumentChunk]:
+        if len(chunks) <= 1:
+            return chunks[:top_k]
+
+        self.stats["requests"] += 1
+        start = time.perf_counter()
+        scoring = asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(
+                self.model.predict,
+                [(query, chunk.content) for chunk in chunks],
+                batch_size=self.batch_size,
+                show_progress_bar=False
+            )
+        )
+        try:
+            scores = await asyncio.wait_for(scoring, self.budget)
+        except asyncio.TimeoutError:
+            self.stats["fallbacks"] += 1
+            logger.warning(
+                f"Reranking {len(chunks)} chunks exceeded {self.budget * 1000:.0f} ms; "
+                f"keeping retrieval order"
+            )
+            return chunks[:top_k]
+        finally:
+            self.stats["last_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+        ranked = sorted(zip(scores, chunks), key=lambda pair: pair[0], reverse=True)[:top_k]
+        for score, chunk in ranked:
+            chunk.metadata["rerank_score"] = float(score)
+        return [chunk for _, chunk in ranked]
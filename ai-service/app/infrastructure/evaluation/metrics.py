@@ -12,7 +12,7 @@ class ResponseEvaluator:
     def evaluate(self, response: LLMResponse) -> dict:
         cost = self._calculate_cost(response)
         
-        return {
+        metrics = {
             "latency_ms": response.duration_ms,
             "input_tokens": response.usage.input_tokens,
             "output_tokens": response.usage.output_tokens,
@@ -20,6 +20,12 @@ class ResponseEvaluator:
             "cost_usd": cost,
             "model": response.model
         }
+        
+        # Only known for streamed responses
+        if response.ttfb_ms is not None:
+            metrics["ttfb_ms"] = response.ttfb_ms
+        
+        return metrics
     
     def _calculate_cost(self, response: LLMResponse) -> float:
         pricing = GROQ_PRICING.get(response.model, {"input": 0, "output": 0})
@@ -1,26 +1,43 @@
 import time
-from typing import List
-from groq import AsyncGroq
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import AsyncIterator, List, Optional
+from groq import AsyncGroq, RateLimitError
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential
 
-from app.domain.interfaces.llm_provider import LLMProvider
-from app.domain.entities.query import LLMResponse, TokenUsage
+from app.domain.interfaces.llm_provider import LLMProvider, ProviderRateLimitError
+from app.domain.entities.query import LLMResponse, LLMStreamChunk, TokenUsage
 
 
 class GroqClient(LLMProvider):
-    def __init__(self, api_key: str, model_id: str = "llama-3.3-70b-versatile"):
-        self.client = AsyncGroq(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model_id: str = "llama-3.3-70b-versatile",
+        max_attempts: int = 3,
+        timeout: float = 60.0
+    ):
+        # Retries are done here; the SDK's own would multiply them
+        self.client = AsyncGroq(api_key=api_key, timeout=timeout, max_retries=0)
         self.model_id = model_id
+        self.max_attempts = max_attempts
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
     async def generate(
         self, 
         messages: List[dict], 
         max_tokens: int = 1000,
         temperature: float = 0.7
+    ) -> LLMResponse:
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=wait_exponential(multiplier=1, min=2, max=10)
+        ):
+            with attempt:
+                return await self._generate(messages, max_tokens, temperature)
+    
+    async def _generate(
+        self,
+        messages: List[dict],
+        max_tokens: int,
+        temperature: float
     ) -> LLMResponse:
         start_time = time.time()
         
@@ -44,5 +61,50 @@ class GroqClient(LLMProvider):
                 model=completion.model,
                 duration_ms=duration_ms
             )
+        except RateLimitError as e:
+            raise ProviderRateLimitError(f"Groq API error: {str(e)}", _retry_after(e.response))
         except Exception as e:
-            raise Exception(f"Groq API error: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Groq API error: {str(e)}")
+    
+    async def stream(
+        self,
+        messages: List[dict],
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> AsyncIterator[LLMStreamChunk]:
+        # Not retried: tokens may already have reached the client
+        try:
+            completion = await self.client.chat.completions.create(
+                model=self.model_id,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+            
+            async for chunk in completion:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                
+                # Groq reports usage on the final chunk
+                usage = None
+                x_groq = getattr(chunk, "x_groq", None)
+                if x_groq is not None and getattr(x_groq, "usage", None):
+                    usage = TokenUsage(
+                        input_tokens=x_groq.usage.prompt_tokens,
+                        output_tokens=x_groq.usage.completion_tokens,
+                        total_tokens=x_groq.usage.total_tokens
+                    )
+                
+                if text or usage:
+                    yield LLMStreamChunk(text=text or "", usage=usage, model=chunk.model)
+        except RateLimitError as e:
+            raise ProviderRateLimitError(f"Groq API error: {str(e)}", _retry_after(e.response))
+        except Exception as e:
+            raise Exception(f"Groq API error: {str(e)}")
+
+
+def _retry_after(response) -> Optional[float]:
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
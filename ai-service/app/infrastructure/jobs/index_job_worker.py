@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, List, Optional
+
+from app.application.use_cases.index_document import IndexDocumentUseCase
+from app.domain.entities.document import Document
+from app.domain.entities.job import IndexJob, JobStatus
+from app.domain.interfaces.job_store import JobStore
+
+logger = logging.getLogger(__name__)
+
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class IndexJobWorker:
+    """
+    Background pool that runs queued indexing jobs.
+
+    ``submit`` stores the text next to the job store and returns at once;
+    ``concurrency`` workers claim due jobs and index them by streaming the
+    stored text through IndexDocumentUseCase. Failed jobs are retried with
+    exponential backoff until ``max_attempts`` is reached. Jobs left running
+    by a crash are requeued on start.
+    """
+
+    def __init__(
+        self,
+        job_store: JobStore,
+        index_document_use_case: IndexDocumentUseCase,
+        content_dir: str,
+        concurrency: int = 2,
+        max_attempts: int = 3,
+        backoff_seconds: float = 2.0,
+        poll_interval: float = 1.0
+    ):
+        self.job_store = job_store
+        self.index_document_use_case = index_document_use_case
+        self.content_dir = Path(content_dir)
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self.content_dir.mkdir(parents=True, exist_ok=True)
+        requeued = await self.job_store.recover()
+        if requeued:
+            logger.info(f"Requeued {requeued} interrupted indexing jobs")
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+        logger.info(f"Index job worker started with {self.concurrency} workers")
+
+    async def stop(self) -> None:
+        # Running jobs stay marked running and are requeued on next start
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(
+        self,
+        title: str,
+        content: str,
+        metadata: dict,
+        doc_id: Optional[str] = None
+    ) -> IndexJob:
+        """Queue a document; pass the id of an indexed document to update it incrementally."""
+        job_id = uuid.uuid4().hex
+        content_path = self.content_dir / f"{job_id}.txt"
+        await asyncio.to_thread(self._write_content, content_path, content)
+
+        job = await self.job_store.create(IndexJob(
+            id=job_id,
+            doc_id=doc_id or f"doc_{datetime.utcnow().timestamp()}",
+            title=title,
+            metadata=metadata,
+            bytes_received=len(content.encode()),
+            content_path=str(content_path)
+        ))
+        self._wakeup.set()
+        return job
+
+    async def run_next(self) -> bool:
+        """Claim and run one due job; returns False if none was due."""
+        job = await self.job_store.claim_next(datetime.utcnow())
+        if job is None:
+            return False
+        await self._run(job)
+        return True
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                if await self.run_next():
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Index job worker error: {e}")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run(self, job: IndexJob) -> None:
+        document = Document(
+            id=job.doc_id,
+            content="",
+            title=job.title,
+            created_at=job.created_at,
+            metadata=job.metadata
+        )
+
+        async def on_progress(result: dict):
+            job.record_progress(result)
+            await self.job_store.update(job)
+
+        # A retry reuses the chunks a failed attempt already stored
+        try:
+            result = await self.index_document_use_case.execute_stream(
+                document, self._read_content(Path(job.content_path)), on_progress
+            )
+        except Exception as e:
+            await self._fail(job, e)
+            return
+
+        job.status = JobStatus.COMPLETED
+        job.record_progress(result)
+        job.error = None
+        await self.job_store.update(job)
+        await asyncio.to_thread(Path(job.content_path).unlink, True)
+        logger.info(
+            f"Indexed job {job.id}: {job.chunks_inserted} chunks inserted, "
+            f"{job.chunks_reused} reused, {job.chunks_deleted} deleted"
+        )
+
+    async def _fail(self, job: IndexJob, error: Exception) -> None:
+        job.error = str(error)
+        if job.attempts >= self.max_attempts:
+            job.status = JobStatus.FAILED
+            logger.error(f"Index job {job.id} failed after {job.attempts} attempts: {error}")
+        else:
+            delay = self.backoff_seconds * 2 ** (job.attempts - 1)
+            job.status = JobStatus.PENDING
+            job.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+            logger.warning(f"Index job {job.id} attempt {job.attempts} failed, retrying in {delay}s: {error}")
+        await self.job_store.update(job)
+
+    async def _read_content(self, path: Path) -> AsyncIterator[str]:
+        f = await asyncio.to_thread(open, path, "r", encoding="utf-8")
+        try:
+            while block := await asyncio.to_thread(f.read, READ_BLOCK_SIZE):
+                yield block
+        finally:
+            f.close()
+
+    @staticmethod
+    def _write_content(path: Path, content: str) -> None:
+        path.write_text(content, encoding="utf-8")
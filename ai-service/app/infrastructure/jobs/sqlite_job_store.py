@@ -0,0 +1,180 @@
+import asyncio
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from app.domain.entities.job import IndexJob, JobStatus
+from app.domain.interfaces.job_store import JobStore
+
+COLUMNS = (
+    "id", "doc_id", "title", "metadata", "status", "bytes_received", "chunks_indexed",
+    "total_words", "error", "attempts", "content_path", "next_attempt_at",
+    "created_at", "updated_at", "chunks_inserted", "chunks_reused", "chunks_deleted"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_jobs (
+    id TEXT PRIMARY KEY,
+    doc_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    status TEXT NOT NULL,
+    bytes_received INTEGER NOT NULL,
+    chunks_indexed INTEGER NOT NULL,
+    total_words INTEGER NOT NULL,
+    error TEXT,
+    attempts INTEGER NOT NULL,
+    content_path TEXT,
+    next_attempt_at TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    chunks_inserted INTEGER NOT NULL DEFAULT 0,
+    chunks_reused INTEGER NOT NULL DEFAULT 0,
+    chunks_deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_index_jobs_status_next_attempt
+    ON index_jobs (status, next_attempt_at);
+"""
+
+# Columns added after the table was first released
+MIGRATIONS = {
+    "chunks_inserted": "INTEGER NOT NULL DEFAULT 0",
+    "chunks_reused": "INTEGER NOT NULL DEFAULT 0",
+    "chunks_deleted": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+class SqliteJobStore(JobStore):
+    """
+    Job store backed by a local SQLite file, so queued jobs survive restarts.
+
+    Queries run on a worker thread behind a lock; claiming a job is a single
+    locked read-modify-write, so concurrent workers and uploads never get the
+    same job, nor two jobs for the same document.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _migrate(self) -> None:
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(index_jobs)")}
+        for column, definition in MIGRATIONS.items():
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE index_jobs ADD COLUMN {column} {definition}")
+
+    async def create(self, job: IndexJob) -> IndexJob:
+        await self._run(self._upsert, job)
+        return job
+
+    async def get(self, job_id: str) -> Optional[IndexJob]:
+        rows = await self._run(self._select, "WHERE id = ?", (job_id,))
+        return rows[0] if rows else None
+
+    async def update(self, job: IndexJob) -> None:
+        job.updated_at = datetime.utcnow()
+        await self._run(self._upsert, job)
+
+    async def list(self, status: Optional[JobStatus] = None, limit: int = 100) -> List[IndexJob]:
+        if status is None:
+            return await self._run(self._select, "ORDER BY created_at DESC LIMIT ?", (limit,))
+        return await self._run(
+            self._select,
+            "WHERE status = ? ORDER BY created_at DESC LIMIT ?",
+            (status.value, limit)
+        )
+
+    async def claim_next(self, now: datetime) -> Optional[IndexJob]:
+        return await self._run(self._claim_next, now)
+
+    async def claim_upload(self, job_id: str, now: datetime) -> Optional[IndexJob]:
+        return await self._run(self._claim_upload, job_id, now)
+
+    async def recover(self) -> int:
+        return await self._run(self._recover)
+
+    async def _run(self, fn, *args):
+        return await asyncio.to_thread(self._locked, fn, *args)
+
+    def _locked(self, fn, *args):
+        with self._lock:
+            return fn(*args)
+
+    def _upsert(self, job: IndexJob) -> None:
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO index_jobs ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+            self._to_row(job)
+        )
+
+    def _select(self, clause: str, params: tuple) -> List[IndexJob]:
+        cursor = self._conn.execute(f"SELECT {', '.join(COLUMNS)} FROM index_jobs {clause}", params)
+        return [self._from_row(row) for row in cursor.fetchall()]
+
+    def _claim_next(self, now: datetime) -> Optional[IndexJob]:
+        jobs = self._select(
+            "WHERE status = ? AND content_path IS NOT NULL AND next_attempt_at <= ? "
+            "AND doc_id NOT IN (SELECT doc_id FROM index_jobs WHERE status = ?) "
+            "ORDER BY next_attempt_at LIMIT 1",
+            (JobStatus.PENDING.value, now.isoformat(), JobStatus.RUNNING.value)
+        )
+        return self._mark_running(jobs[0], now) if jobs else None
+
+    def _claim_upload(self, job_id: str, now: datetime) -> Optional[IndexJob]:
+        jobs = self._select(
+            "WHERE id = ? AND status = ? AND content_path IS NULL "
+            "AND doc_id NOT IN (SELECT doc_id FROM index_jobs WHERE status = ?)",
+            (job_id, JobStatus.PENDING.value, JobStatus.RUNNING.value)
+        )
+        return self._mark_running(jobs[0], now) if jobs else None
+
+    def _mark_running(self, job: IndexJob, now: datetime) -> IndexJob:
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.updated_at = now
+        self._upsert(job)
+        return job
+
+    def _recover(self) -> int:
+        now = datetime.utcnow().isoformat()
+        requeued = self._conn.execute(
+            "UPDATE index_jobs SET status = ?, updated_at = ? "
+            "WHERE status = ? AND content_path IS NOT NULL",
+            (JobStatus.PENDING.value, now, JobStatus.RUNNING.value)
+        ).rowcount
+        # Streamed uploads cannot be resumed once the connection is gone
+        self._conn.execute(
+            "UPDATE index_jobs SET status = ?, error = ?, updated_at = ? "
+            "WHERE status = ? AND content_path IS NULL",
+            (JobStatus.FAILED.value, "Interrupted by restart", now, JobStatus.RUNNING.value)
+        )
+        return requeued
+
+    @staticmethod
+    def _to_row(job: IndexJob) -> tuple:
+        return (
+            job.id, job.doc_id, job.title, json.dumps(job.metadata), job.status.value,
+            job.bytes_received, job.chunks_indexed, job.total_words, job.error, job.attempts,
+            job.content_path, job.next_attempt_at.isoformat(),
+            job.created_at.isoformat(), job.updated_at.isoformat(),
+            job.chunks_inserted, job.chunks_reused, job.chunks_deleted
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> IndexJob:
+        values = dict(zip(COLUMNS, row))
+        values["metadata"] = json.loads(values["metadata"])
+        values["status"] = JobStatus(values["status"])
+        for column in ("next_attempt_at", "created_at", "updated_at"):
+            values[column] = datetime.fromisoformat(values[column])
+        return IndexJob(**values)
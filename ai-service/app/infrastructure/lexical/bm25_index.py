@@ -0,0 +1,140 @@
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+from app.domain.entities.document import DocumentChunk
+from app.domain.interfaces.lexical_index import LexicalIndex
+
+# Words, keeping identifiers such as ERR-401, user_id or v2.1.0 together
+QUERY_TERM = re.compile(r"\w+(?:[-_.:/]\w+)*")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    rowid INTEGER PRIMARY KEY,
+    chunk_id TEXT NOT NULL UNIQUE,
+    doc_id TEXT NOT NULL,
+    content TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_chunks_doc_id ON chunks (doc_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+    content, content='chunks', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS chunks_ai AFTER INSERT ON chunks BEGIN
+    INSERT INTO chunks_fts (rowid, content) VALUES (new.rowid, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS chunks_ad AFTER DELETE ON chunks BEGIN
+    INSERT INTO chunks_fts (chunks_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+END;
+"""
+
+
+class SqliteBm25Index(LexicalIndex):
+    """
+    BM25 keyword index on SQLite FTS5, persisted in a local file.
+
+    Catches what dense retrieval misses: exact identifiers, error codes and
+    product names. Query terms are matched as phrases joined by OR, so
+    ``ERR-401`` only matches where "err" is directly followed by "401".
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    async def add(self, chunks: List[DocumentChunk]) -> None:
+        if chunks:
+            await self._run(self._add, chunks)
+
+    async def search(self, text: str, top_k: int = 5) -> List[DocumentChunk]:
+        terms = QUERY_TERM.findall(text)
+        if not terms:
+            return []
+        match = " OR ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        return await self._run(self._search, match, top_k)
+
+    async def update_metadata(self, metadata_by_id: Dict[str, dict]) -> None:
+        if metadata_by_id:
+            await self._run(self._update_metadata, metadata_by_id)
+
+    async def delete_many(self, chunk_ids: List[str]) -> None:
+        if chunk_ids:
+            await self._run(self._delete_many, chunk_ids)
+
+    async def delete_document(self, doc_id: str) -> None:
+        await self._run(self._delete_document, doc_id)
+
+    async def count(self) -> int:
+        return await self._run(self._count)
+
+    async def clear(self) -> None:
+        await self._run(self._clear)
+
+    async def _run(self, fn, *args):
+        return await asyncio.to_thread(self._locked, fn, *args)
+
+    def _locked(self, fn, *args):
+        with self._lock:
+            return fn(*args)
+
+    def _add(self, chunks: List[DocumentChunk]) -> None:
+        with self._conn:
+            # Plain delete + insert: REPLACE would skip the FTS delete trigger
+            self._conn.executemany("DELETE FROM chunks WHERE chunk_id = ?", [(c.id,) for c in chunks])
+            self._conn.executemany(
+                "INSERT INTO chunks (chunk_id, doc_id, content, metadata) VALUES (?, ?, ?, ?)",
+                [
+                    (c.id, c.metadata.get("doc_id", ""), c.content, json.dumps(c.metadata))
+                    for c in chunks
+                ]
+            )
+
+    def _search(self, match: str, top_k: int) -> List[DocumentChunk]:
+        rows = self._conn.execute(
+            "SELECT c.chunk_id, c.content, c.metadata FROM chunks_fts "
+            "JOIN chunks c ON c.rowid = chunks_fts.rowid "
+            "WHERE chunks_fts MATCH ? ORDER BY rank LIMIT ?",
+            (match, top_k)
+        ).fetchall()
+        return [
+            DocumentChunk(id=chunk_id, content=content, metadata=json.loads(metadata))
+            for chunk_id, content, metadata in rows
+        ]
+
+    def _update_metadata(self, metadata_by_id: Dict[str, dict]) -> None:
+        with self._conn:
+            for chunk_id, changes in metadata_by_id.items():
+                row = self._conn.execute(
+                    "SELECT metadata FROM chunks WHERE chunk_id = ?", (chunk_id,)
+                ).fetchone()
+                if row:
+                    metadata = {**json.loads(row[0]), **changes}
+                    self._conn.execute(
+                        "UPDATE chunks SET metadata = ? WHERE chunk_id = ?",
+                        (json.dumps(metadata), chunk_id)
+                    )
+
+    def _delete_many(self, chunk_ids: List[str]) -> None:
+        with self._conn:
+            self._conn.executemany("DELETE FROM chunks WHERE chunk_id = ?", [(i,) for i in chunk_ids])
+
+    def _delete_document(self, doc_id: str) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM chunks WHERE doc_id = ?", (doc_id,))
+
+    def _clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM chunks")
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
@@ -0,0 +1,25 @@
+from typing import Dict, List
+
+from app.domain.entities.document import DocumentChunk
+
+
+def reciprocal_rank_fusion(
+    rankings: List[List[DocumentChunk]],
+    top_k: int,
+    k: int = 60
+) -> List[DocumentChunk]:
+    """
+    Merge ranked result lists by summing 1 / (k + rank) per chunk.
+
+    Only ranks are used, so lists with incomparable scores (BM25, cosine)
+    fuse without normalisation; a chunk found by several retrievers rises.
+    """
+    scores: Dict[str, float] = {}
+    chunks: Dict[str, DocumentChunk] = {}
+    for ranking in rankings:
+        for rank, chunk in enumerate(ranking, start=1):
+            scores[chunk.id] = scores.get(chunk.id, 0.0) + 1.0 / (k + rank)
+            chunks.setdefault(chunk.id, chunk)
+
+    best = sorted(scores, key=scores.get, reverse=True)[:top_k]
+    return [chunks[chunk_id] for chunk_id in best]
@@ -0,0 +1,295 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
+
+from app.domain.interfaces.llm_provider import LLMProvider
+from app.domain.entities.query import LLMResponse, LLMStreamChunk
+from app.infrastructure.groq.groq_client import GroqClient
+from app.infrastructure.llm.openai_compatible_client import OpenAICompatibleClient
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderHealth:
+    """Rolling latency and error window of one provider, plus its circuit breaker."""
+
+    def __init__(self, window: int, failure_threshold: int, cooldown_seconds: float):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CLOSED
+        if time.monotonic() - self.opened_at < self.cooldown_seconds:
+            return OPEN
+        return HALF_OPEN
+
+    def available(self) -> bool:
+        # A half-open circuit lets a single trial request through
+        state = self.state
+        return state == CLOSED or (state == HALF_OPEN and not self.trial_in_flight)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def expected_ms(self) -> float:
+        """Mean latency inflated by the error rate; 0 until measured."""
+        if not self.latencies:
+            return 0.0
+        mean = sum(self.latencies) / len(self.latencies)
+        return mean / max(1.0 - self.error_rate, 0.1)
+
+    def record_success(self, latency_ms: float) -> None:
+        self.latencies.append(latency_ms)
+        self.outcomes.append(True)
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.outcomes.append(False)
+        self.consecutive_failures += 1
+        # Also re-opens a half-open circuit whose trial failed
+        if self.consecutive_failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        return {
+            "state": self.state,
+            "samples": len(self.outcomes),
+            "error_rate": round(self.error_rate, 4),
+            "p50_ms": round(p50, 1) if p50 is not None else None,
+            "p95_ms": round(p95, 1) if p95 is not None else None
+        }
+
+
+class LLMRouter(LLMProvider):
+    """
+    Sends each call to the fastest healthy provider.
+
+    Providers are ranked by rolling mean latency, inflated by their error
+    rate; unmeasured ones go first so each gets measured, ties keep the
+    configured order. A failed call fails over to the next provider, and
+    ``failure_threshold`` consecutive failures open a provider's circuit for
+    ``cooldown_seconds``, after which one trial request may close it again.
+
+    With ``hedging``, a call still running past its provider's p95 latency
+    is duplicated on the next provider and the first answer wins. A cancelled
+    call records its elapsed time, so a provider that keeps losing drops in
+    the ranking. Streams fail over only before their first chunk.
+    """
+
+    def __init__(
+        self,
+        providers: Dict[str, LLMProvider],
+        window: int = 100,
+        min_samples: int = 10,
+        hedging: bool = True,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 30.0
+    ):
+        if not providers:
+            raise ValueError("LLMRouter needs at least one provider")
+        self.providers = providers
+        self.min_samples = min_samples
+        self.hedging = hedging
+        self.health = {
+            name: ProviderHealth(window, failure_threshold, cooldown_seconds)
+            for name in providers
+        }
+        self._counts = {"requests": 0, "failovers": 0, "hedged": 0, "hedge_wins": 0}
+
+    @classmethod
+    def from_settings(cls, settings) -> "LLMRouter":
+        providers: Dict[str, LLMProvider] = {}
+        for entry in settings.llm_providers:
+            name = entry.get("name") or entry["model"]
+            if entry.get("base_url"):
+                providers[name] = OpenAICompatibleClient(
+                    base_url=entry["base_url"],
+                    model_id=entry["model"],
+                    api_key=entry.get("api_key", ""),
+                    timeout=settings.llm_timeout_seconds
+                )
+            else:
+                # Failing over beats retrying against a degraded endpoint
+                providers[name] = GroqClient(
+                    api_key=entry.get("api_key", settings.groq_api_key),
+                    model_id=entry["model"],
+                    max_attempts=1,
+                    timeout=settings.llm_timeout_seconds
+                )
+
+        return cls(
+            providers,
+            hedging=settings.llm_hedging_enabled,
+            failure_threshold=settings.llm_circuit_failure_threshold,
+            cooldown_seconds=settings.llm_circuit_cooldown_seconds
+        )
+
+    async def close(self) -> None:
+        for provider in self.providers.values():
+            close = getattr(provider, "close", None)
+            if close is not None:
+                await close()
+
+    def stats(self) -> dict:
+        return {
+            **self._counts,
+            "providers": {name: health.stats() for name, health in self.health.items()}
+        }
+
+    async def generate(
+        self,
+        messages: List[dict],
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> LLMResponse:
+        self._counts["requests"] += 1
+        ranked = self._ranked()
+        # Running calls: task -> (provider, started, is_hedge)
+        pending: Dict[asyncio.Task, Tuple[str, float, bool]] = {}
+        errors: List[str] = []
+
+        def launch(hedge: bool = False) -> None:
+            name = ranked.pop(0)
+            task = asyncio.create_task(self._generate(name, messages, max_tokens, temperature))
+            pending[task] = (name, time.monotonic(), hedge)
+
+        if ranked:
+            launch()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self._hedge_timeout(pending, ranked),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self._counts["hedged"] += 1
+                    launch(hedge=True)
+                    continue
+
+                winner = None
+                for task in done:
+                    name, _, hedge = pending.pop(task)
+                    if task.exception() is not None:
+                        errors.append(f"{name}: {task.exception()}")
+                    elif winner is None:
+                        winner = task
+                        if hedge:
+                            self._counts["hedge_wins"] += 1
+                if winner is not None:
+                    return winner.result()
+
+                if not pending and ranked:
+                    self._counts["failovers"] += 1
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise RuntimeError(self._unavailable_message(errors))
+
+    async def stream(
+        self,
+        messages: List[dict],
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> AsyncIterator[LLMStreamChunk]:
+        self._counts["requests"] += 1
+        errors: List[str] = []
+
+        for attempt, name in enumerate(self._ranked()):
+            if attempt:
+                self._counts["failovers"] += 1
+            received = False
+            try:
+                with self._track(name):
+                    async for chunk in self.providers[name].stream(messages, max_tokens, temperature):
+                        received = True
+                        yield chunk
+                return
+            except Exception as e:
+                # Tokens already sent cannot be taken back
+                if received:
+                    raise
+                errors.append(f"{name}: {e}")
+
+        raise RuntimeError(self._unavailable_message(errors))
+
+    def _ranked(self) -> List[str]:
+        available = [name for name, health in self.health.items() if health.available()]
+        return sorted(available, key=lambda name: self.health[name].expected_ms())
+
+    def _hedge_timeout(
+        self,
+        pending: Dict[asyncio.Task, Tuple[str, float, bool]],
+        ranked: List[str]
+    ) -> Optional[float]:
+        if not self.hedging or not ranked or len(pending) != 1:
+            return None
+        name, started, _ = next(iter(pending.values()))
+        health = self.health[name]
+        if len(health.latencies) < self.min_samples:
+            return None
+        return max(0.0, started + health.percentile(0.95) / 1000 - time.monotonic())
+
+    async def _generate(
+        self,
+        name: str,
+        messages: List[dict],
+        max_tokens: int,
+        temperature: float
+    ) -> LLMResponse:
+        with self._track(name):
+            return await self.providers[name].generate(messages, max_tokens, temperature)
+
+    @contextmanager
+    def _track(self, name: str) -> Iterator[None]:
+        health = self.health[name]
+        if health.state == HALF_OPEN:
+            health.trial_in_flight = True
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            health.record_failure()
+            if health.state == OPEN:
+                logger.warning(f"LLM provider {name} circuit open: {e}")
+            raise
+        except BaseException:
+            # Cancelled or abandoned: the time spent is a lower bound on latency
+            health.latencies.append((time.monotonic() - start) * 1000)
+            raise
+        else:
+            health.record_success((time.monotonic() - start) * 1000)
+        finally:
+            health.trial_in_flight = False
+
+    def _unavailable_message(self, errors: List[str]) -> str:
+        if errors:
+            return f"All LLM providers failed: {'; '.join(errors)}"
+        return f"No LLM provider available, circuits open: {', '.join(self.providers)}"
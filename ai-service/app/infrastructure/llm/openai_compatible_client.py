@@ -0,0 +1,110 @@
+import json
+import time
+from typing import AsyncIterator, List
+
+import httpx
+
+from app.domain.interfaces.llm_provider import LLMProvider, ProviderRateLimitError
+from app.domain.entities.query import LLMResponse, LLMStreamChunk, TokenUsage
+
+
+class OpenAICompatibleClient(LLMProvider):
+    """
+    Chat completions from any server speaking the OpenAI API (vLLM, Ollama,
+    OpenRouter, ...). ``base_url`` includes the version prefix, e.g.
+    ``http://localhost:8000/v1``. Errors are not retried; the router fails over.
+    """
+
+    def __init__(self, base_url: str, model_id: str, api_key: str = "", timeout: float = 60.0):
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.base_url = base_url.rstrip("/")
+        self.client = httpx.AsyncClient(base_url=self.base_url, headers=headers, timeout=timeout)
+        self.model_id = model_id
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def generate(
+        self,
+        messages: List[dict],
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> LLMResponse:
+        start_time = time.time()
+
+        try:
+            response = await self.client.post(
+                "/chat/completions",
+                json=self._body(messages, max_tokens, temperature)
+            )
+            _raise_for_status(response)
+            completion = response.json()
+        except ProviderRateLimitError:
+            raise
+        except Exception as e:
+            raise Exception(f"{self.base_url} API error: {str(e)}")
+
+        return LLMResponse(
+            text=completion["choices"][0]["message"]["content"],
+            usage=self._usage(completion.get("usage")),
+            model=completion.get("model", self.model_id),
+            duration_ms=(time.time() - start_time) * 1000
+        )
+
+    async def stream(
+        self,
+        messages: List[dict],
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> AsyncIterator[LLMStreamChunk]:
+        body = self._body(messages, max_tokens, temperature)
+        body["stream"] = True
+        body["stream_options"] = {"include_usage": True}
+
+        try:
+            async with self.client.stream("POST", "/chat/completions", json=body) as response:
+                _raise_for_status(response)
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+
+                    chunk = json.loads(data)
+                    choices = chunk.get("choices") or []
+                    text = choices[0].get("delta", {}).get("content") if choices else None
+                    usage = self._usage(chunk["usage"]) if chunk.get("usage") else None
+                    if text or usage:
+                        yield LLMStreamChunk(text=text or "", usage=usage, model=chunk.get("model"))
+        except ProviderRateLimitError:
+            raise
+        except Exception as e:
+            raise Exception(f"{self.base_url} API error: {str(e)}")
+
+    def _body(self, messages: List[dict], max_tokens: int, temperature: float) -> dict:
+        return {
+            "model": self.model_id,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+
+    @staticmethod
+    def _usage(usage: dict) -> TokenUsage:
+        usage = usage or {}
+        return TokenUsage(
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0)
+        )
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.status_code == 429:
+        try:
+            retry_after = float(response.headers["retry-after"])
+        except (KeyError, ValueError):
+            retry_after = None
+        raise ProviderRateLimitError(f"{response.url} rate limited", retry_after)
+    response.raise_for_status()
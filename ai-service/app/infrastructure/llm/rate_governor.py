@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, List, Optional
+
+from app.domain.interfaces.llm_provider import LLMProvider, ProviderRateLimitError
+from app.domain.entities.query import LLMResponse, LLMStreamChunk
+
+logger = logging.getLogger(__name__)
+
+# Rough prompt size before the provider reports real usage
+CHARS_PER_TOKEN = 4
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, retry_after: float):
+        super().__init__(f"LLM rate limit reached, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Per-minute budget refilled continuously; the level may go negative on overdraft."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.level = per_minute
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def wait_time(self, amount: float) -> float:
+        self._refill()
+        pause = max(0.0, self.paused_until - time.monotonic())
+        return pause + max(0.0, (amount - self.level) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket and stop refilling it for ``seconds``."""
+        self._refill()
+        self.level = min(self.level, 0.0)
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def take(self, amount: float) -> None:
+        """Negative amounts return unused budget."""
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        refill_from = max(self.updated, min(self.paused_until, now))
+        self.level = min(self.capacity, self.level + (now - refill_from) * self.rate)
+        self.updated = now
+
+
+class RateGovernor(LLMProvider):
+    """
+    Paces calls to a provider under its requests- and tokens-per-minute limits.
+
+    A call reserves one request and an estimate of its tokens (prompt size
+    plus ``max_tokens``); once the provider reports usage, the difference is
+    returned to or taken from the token budget. Calls are admitted in arrival
+    order, so large prompts are not starved by small ones, and at most
+    ``max_concurrent`` run at once.
+
+    A call expected to wait longer than ``max_queue_wait_seconds`` goes to
+    ``fallback`` (typically a smaller model with its own limits) or is shed
+    with RateLimitExceeded.
+
+    Failed calls are retried up to ``max_attempts`` times, each attempt
+    queued and charged again; the wrapped provider should not retry itself.
+    A provider 429 empties and pauses both buckets for its retry-after.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        rpm_limit: int,
+        tpm_limit: int,
+        max_concurrent: int = 8,
+        max_queue_wait_seconds: float = 10.0,
+        fallback: Optional[LLMProvider] = None,
+        max_attempts: int = 3,
+        backoff_seconds: float = 2.0
+    ):
+        self.provider = provider
+        self.requests = TokenBucket(rpm_limit)
+        self.tokens = TokenBucket(tpm_limit)
+        self.max_queue_wait_seconds = max_queue_wait_seconds
+        self.fallback = fallback
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self._admission = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._queued_requests = 0
+        self._queued_tokens = 0
+        self._counts = {
+            "admitted": 0, "degraded": 0, "shed": 0, "retried": 0, "rate_limited": 0, "queue_wait_ms": 0.0
+        }
+
+    def stats(self) -> dict:
+        admitted = self._counts["admitted"]
+        stats = {
+            "admitted": admitted,
+            "degraded": self._counts["degraded"],
+            "shed": self._counts["shed"],
+            "retried": self._counts["retried"],
+            "rate_limited": self._counts["rate_limited"],
+            "queued": self._queued_requests,
+            "avg_queue_wait_ms": round(self._counts["queue_wait_ms"] / admitted, 1) if admitted else 0.0,
+            "requests_available": round(self.requests.level, 1),
+            "tokens_available": round(self.tokens.level)
+        }
+        if isinstance(self.fallback, RateGovernor):
+            stats["fallback"] = self.fallback.stats()
+        return stats
+
+    async def generate(
+        self,
+        messages: List[dict],
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> LLMResponse:
+        reserved = self._reservation(messages, max_tokens)
+        for attempt in range(1, self.max_attempts + 1):
+            if not await self._admit(reserved):
+                return await self._overflow(reserved).generate(messages, max_tokens, temperature)
+
+            try:
+                async with self._slots:
+                    response = await self.provider.generate(messages, max_tokens, temperature)
+            except Exception as e:
+                self.tokens.take(-reserved)
+                if isinstance(e, ProviderRateLimitError):
+                    self._rate_limited(e)
+                if attempt == self.max_attempts:
+                    raise
+                logger.warning(f"LLM call attempt {attempt} failed, requeueing: {e}")
+                self._counts["retried"] += 1
+                # A 429 already delays the next admission
+                if not isinstance(e, ProviderRateLimitError):
+                    await asyncio.sleep(self.backoff_seconds * 2 ** (attempt - 1))
+                continue
+
+            self.tokens.take(response.usage.total_tokens - reserved)
+            return response
+
+    async def stream(
+        self,
+        messages: List[dict],
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> AsyncIterator[LLMStreamChunk]:
+        reserved = self._reservation(messages, max_tokens)
+        if not await self._admit(reserved):
+            async for chunk in self._overflow(reserved).stream(messages, max_tokens, temperature):
+                yield chunk
+            return
+
+        # Without reported usage (e.g. a broken stream) the reservation stands
+        used = reserved
+        try:
+            async with self._slots:
+                async for chunk in self.provider.stream(messages, max_tokens, temperature):
+                    if chunk.usage:
+                        used = chunk.usage.total_tokens
+                    yield chunk
+        except ProviderRateLimitError as e:
+            used = 0
+            self._rate_limited(e)
+            raise
+        finally:
+            self.tokens.take(used - reserved)
+
+    @staticmethod
+    def _reservation(messages: List[dict], max_tokens: int) -> int:
+        prompt_chars = sum(len(message["content"]) for message in messages)
+        return prompt_chars // CHARS_PER_TOKEN + max_tokens
+
+    def _expected_wait(self, reserved: int) -> float:
+        # Everything queued ahead is admitted first
+        return max(
+            self.requests.wait_time(self._queued_requests + 1),
+            self.tokens.wait_time(self._queued_tokens + min(reserved, self.tokens.capacity))
+        )
+
+    async def _admit(self, reserved: int) -> bool:
+        if self._expected_wait(reserved) > self.max_queue_wait_seconds:
+            return False
+
+        self._queued_requests += 1
+        self._queued_tokens += reserved
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(self._acquire(reserved), self.max_queue_wait_seconds)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._queued_requests -= 1
+            self._queued_tokens -= reserved
+
+        self._counts["admitted"] += 1
+        self._counts["queue_wait_ms"] += (time.monotonic() - start) * 1000
+        return True
+
+    async def _acquire(self, reserved: int) -> None:
+        # asyncio.Lock wakes waiters in arrival order
+        async with self._admission:
+            # A prompt larger than the whole budget waits for a full bucket
+            amount = min(reserved, self.tokens.capacity)
+            while (wait := max(self.requests.wait_time(1), self.tokens.wait_time(amount))) > 0:
+                await asyncio.sleep(wait)
+            self.requests.take(1)
+            self.tokens.take(reserved)
+
+    def _rate_limited(self, error: ProviderRateLimitError) -> None:
+        self._counts["rate_limited"] += 1
+        # Without a retry-after, back off as for any other failure
+        seconds = error.retry_after if error.retry_after is not None else self.backoff_seconds
+        self.requests.pause(seconds)
+        self.tokens.pause(seconds)
+
+    def _overflow(self, reserved: int) -> LLMProvider:
+        if self.fallback is not None:
+            self._counts["degraded"] += 1
+            return self.fallback
+
+        self._counts["shed"] += 1
+        retry_after = self._expected_wait(reserved)
+        logger.warning(f"Shedding LLM call, queue wait above {self.max_queue_wait_seconds}s")
+        raise RateLimitExceeded(retry_after)
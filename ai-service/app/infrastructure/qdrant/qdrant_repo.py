@@ -1,23 +1,163 @@
-from typing import List
+import logging
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct, Filter
+from qdrant_client.models import (
+    Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue,
+    PointIdsList, FilterSelector, PayloadSchemaType, PayloadSelectorExclude,
+    SetPayload, SetPayloadOperation, HnswConfigDiff, VectorParamsDiff,
+    CollectionParamsDiff, ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+    Disabled, SearchParams
+)
 
+from app.config import Settings
 from app.domain.interfaces.vector_store import VectorStore
 from app.domain.entities.document import DocumentChunk
 
+logger = logging.getLogger(__name__)
+
+SCROLL_PAGE_SIZE = 1000
+
 
 class QdrantRepository(VectorStore):
-    def __init__(self, host: str, port: int, collection_name: str = "documents"):
+    """
+    Qdrant-backed vector store.
+
+    The HNSW graph, int8 scalar quantization and on-disk storage options are
+    applied when the collection is created; ``apply_tuning`` brings an
+    existing collection in line with them (see ``python -m app.migrate``).
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        collection_name: str = "documents",
+        payload_indexes: Optional[Dict[str, str]] = None,
+        hnsw_m: int = 16,
+        hnsw_ef_construct: int = 100,
+        hnsw_ef: Optional[int] = None,
+        quantization: bool = False,
+        quantization_quantile: float = 0.99,
+        on_disk_vectors: bool = False,
+        on_disk_payload: bool = False
+    ):
         self.client = AsyncQdrantClient(host=host, port=port)
         self.collection_name = collection_name
+        # Payload field -> Qdrant schema type ("keyword", "integer", "datetime", ...)
+        self.payload_indexes = payload_indexes or {}
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construct = hnsw_ef_construct
+        # Search-time default; None leaves it to Qdrant
+        self.hnsw_ef = hnsw_ef
+        self.quantization = quantization
+        self.quantization_quantile = quantization_quantile
+        self.on_disk_vectors = on_disk_vectors
+        self.on_disk_payload = on_disk_payload
+    
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "QdrantRepository":
+        return cls(
+            host=settings.qdrant_host,
+            port=settings.qdrant_port,
+            collection_name=settings.qdrant_collection,
+            payload_indexes=settings.qdrant_payload_indexes,
+            hnsw_m=settings.qdrant_hnsw_m,
+            hnsw_ef_construct=settings.qdrant_hnsw_ef_construct,
+            hnsw_ef=settings.qdrant_hnsw_ef,
+            quantization=settings.qdrant_quantization_enabled,
+            quantization_quantile=settings.qdrant_quantization_quantile,
+            on_disk_vectors=settings.qdrant_on_disk_vectors,
+            on_disk_payload=settings.qdrant_on_disk_payload
+        )
     
     async def initialize(self, vector_size: int):
         collections = await self.client.get_collections()
         if self.collection_name not in [c.name for c in collections.collections]:
             await self.client.create_collection(
                 collection_name=self.collection_name,
-                vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE)
+                vectors_config=VectorParams(
+                    size=vector_size,
+                    distance=Distance.COSINE,
+                    on_disk=self.on_disk_vectors
+                ),
+                hnsw_config=HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct),
+                quantization_config=self._quantization_config(),
+                on_disk_payload=self.on_disk_payload
             )
+        else:
+            changes = await self.tuning_changes()
+            if changes:
+                logger.warning(
+                    f"Collection {self.collection_name} differs from settings: {changes}; "
+                    f"run `python -m app.migrate` to apply them"
+                )
+        await self.ensure_payload_indexes()
+    
+    async def tuning_changes(self) -> Dict[str, Tuple[Any, Any]]:
+        """Collection options that differ from the configured ones, as name -> (current, configured)."""
+        config = (await self.client.get_collection(self.collection_name)).config
+        scalar = getattr(config.quantization_config, "scalar", None)
+        current = {
+            "hnsw_m": config.hnsw_config.m,
+            "hnsw_ef_construct": config.hnsw_config.ef_construct,
+            "quantization_quantile": scalar.quantile if scalar else None,
+            "on_disk_vectors": bool(config.params.vectors.on_disk),
+            "on_disk_payload": bool(config.params.on_disk_payload)
+        }
+        configured = {
+            "hnsw_m": self.hnsw_m,
+            "hnsw_ef_construct": self.hnsw_ef_construct,
+            "quantization_quantile": self.quantization_quantile if self.quantization else None,
+            "on_disk_vectors": self.on_disk_vectors,
+            "on_disk_payload": self.on_disk_payload
+        }
+        return {
+            name: (current[name], value)
+            for name, value in configured.items() if current[name] != value
+        }
+    
+    async def apply_tuning(self) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Update the collection to the configured options and return what changed.
+
+        Qdrant rebuilds the HNSW graph, quantized vectors and storage in the
+        background; the collection stays searchable meanwhile.
+        """
+        changes = await self.tuning_changes()
+        if not changes:
+            return changes
+        
+        hnsw_changed = "hnsw_m" in changes or "hnsw_ef_construct" in changes
+        await self.client.update_collection(
+            collection_name=self.collection_name,
+            hnsw_config=HnswConfigDiff(
+                m=self.hnsw_m, ef_construct=self.hnsw_ef_construct
+            ) if hnsw_changed else None,
+            quantization_config=(
+                self._quantization_config() or Disabled.DISABLED
+            ) if "quantization_quantile" in changes else None,
+            vectors_config={
+                "": VectorParamsDiff(on_disk=self.on_disk_vectors)
+            } if "on_disk_vectors" in changes else None,
+            collection_params=CollectionParamsDiff(
+                on_disk_payload=self.on_disk_payload
+            ) if "on_disk_payload" in changes else None
+        )
+        return changes
+    
+    async def ensure_payload_indexes(self) -> None:
+        """Create the configured payload indexes that the collection is missing."""
+        info = await self.client.get_collection(self.collection_name)
+        for field_name, schema in self.payload_indexes.items():
+            if field_name in info.payload_schema:
+                continue
+            await self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType(schema)
+            )
+            logger.info(f"Created {schema} payload index on {field_name}")
     
     async def upsert(self, chunks: List[DocumentChunk]) -> None:
         points = [
@@ -34,20 +174,25 @@ class QdrantRepository(VectorStore):
         self, 
         embedding: List[float], 
         top_k: int = 5,
-        filters: dict = None
+        filters: dict = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False
     ) -> List[DocumentChunk]:
         search_filter = Filter(**filters) if filters else None
+        hnsw_ef = hnsw_ef or self.hnsw_ef
+        search_params = SearchParams(hnsw_ef=hnsw_ef, exact=exact) if hnsw_ef or exact else None
         
         results = await self.client.search(
             collection_name=self.collection_name,
             query_vector=embedding,
             limit=top_k,
-            query_filter=search_filter
+            query_filter=search_filter,
+            search_params=search_params
         )
         
         return [
             DocumentChunk(
-                id=str(hit.id),
+                id=self._chunk_id(hit.id),
                 content=hit.payload["content"],
                 metadata={k: v for k, v in hit.payload.items() if k != "content"}
             )
@@ -55,8 +200,90 @@ class QdrantRepository(VectorStore):
         ]
     
     async def delete(self, chunk_id: str) -> bool:
+        await self.delete_many([chunk_id])
+        return True
+    
+    async def delete_many(self, chunk_ids: List[str]) -> None:
+        if not chunk_ids:
+            return
+        await self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=chunk_ids)
+        )
+    
+    async def delete_document(self, doc_id: str) -> None:
         await self.client.delete(
             collection_name=self.collection_name,
-            points_selector=[chunk_id]
+            points_selector=FilterSelector(filter=self._document_filter(doc_id))
+        )
+    
+    async def get_document_chunks(self, doc_id: str) -> Dict[str, dict]:
+        chunks = {}
+        offset = None
+        while True:
+            points, offset = await self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=self._document_filter(doc_id),
+                limit=SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=PayloadSelectorExclude(exclude=["content"]),
+                with_vectors=False
+            )
+            for point in points:
+                chunks[self._chunk_id(point.id)] = point.payload
+            if offset is None:
+                return chunks
+    
+    async def iter_chunks(self) -> AsyncIterator[List[DocumentChunk]]:
+        """Every stored chunk, without embeddings, one scroll page at a time."""
+        offset = None
+        while True:
+            points, offset = await self.client.scroll(
+                collection_name=self.collection_name,
+                limit=SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False
+            )
+            yield [
+                DocumentChunk(
+                    id=self._chunk_id(point.id),
+                    content=point.payload["content"],
+                    metadata={k: v for k, v in point.payload.items() if k != "content"}
+                )
+                for point in points
+            ]
+            if offset is None:
+                return
+    
+    async def update_metadata(self, metadata_by_id: Dict[str, dict]) -> None:
+        if not metadata_by_id:
+            return
+        await self.client.batch_update_points(
+            collection_name=self.collection_name,
+            update_operations=[
+                SetPayloadOperation(set_payload=SetPayload(payload=metadata, points=[chunk_id]))
+                for chunk_id, metadata in metadata_by_id.items()
+            ]
+        )
+    
+    @staticmethod
+    def _chunk_id(point_id) -> str:
+        # Qdrant returns ids in dashed UUID form; chunk ids are plain hex
+        return uuid.UUID(str(point_id)).hex
+    
+    @staticmethod
+    def _document_filter(doc_id: str) -> Filter:
+        return Filter(must=[FieldCondition(key="doc_id", match=MatchValue(value=doc_id))])
+    
+    def _quantization_config(self) -> Optional[ScalarQuantization]:
+        if not self.quantization:
+            return None
+        # Quantized vectors stay in RAM; originals (on disk if configured) are used for rescoring
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=self.quantization_quantile,
+                always_ram=True
+            )
         )
-        return True
\ No newline at end of file
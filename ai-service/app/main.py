@@ -18,6 +18,7 @@ async def lifespan(app: FastAPI):
     logger.info("AI Service ready")
     yield
     logger.info("Shutting down AI Service")
+    await container.shutdown()
 
 
 app = FastAPI(title="AI Service", version="1.0.0", lifespan=lifespan)
@@ -0,0 +1,54 @@
+"""
+Apply the Qdrant collection settings (HNSW, quantization, on-disk storage,
+payload indexes) to an existing collection.
+
+    python -m app.migrate                          # apply
+    python -m app.migrate --dry-run                # only show what would change
+    python -m app.migrate --rebuild-lexical-index  # refill the BM25 index from Qdrant
+"""
+import argparse
+import asyncio
+
+from app.config import settings
+from app.infrastructure.lexical.bm25_index import SqliteBm25Index
+from app.infrastructure.qdrant.qdrant_repo import QdrantRepository
+
+
+async def migrate(dry_run: bool) -> None:
+    repo = QdrantRepository.from_settings(settings)
+    changes = await repo.tuning_changes() if dry_run else await repo.apply_tuning()
+
+    if not changes:
+        print(f"Collection {repo.collection_name} already matches settings")
+    for name, (current, configured) in changes.items():
+        print(f"{name}: {current} -> {configured}")
+
+    if dry_run:
+        return
+    await repo.ensure_payload_indexes()
+    if changes:
+        print("Updated; Qdrant rebuilds the affected segments in the background")
+
+
+async def rebuild_lexical_index() -> None:
+    """Needed once for chunks indexed before hybrid search was enabled."""
+    repo = QdrantRepository.from_settings(settings)
+    index = SqliteBm25Index(settings.lexical_index_path)
+    try:
+        await index.clear()
+        async for chunks in repo.iter_chunks():
+            await index.add(chunks)
+        print(f"Lexical index rebuilt with {await index.count()} chunks")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply Qdrant collection settings")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--rebuild-lexical-index", action="store_true")
+    args = parser.parse_args()
+    if args.rebuild_lexical_index:
+        asyncio.run(rebuild_lexical_index())
+    else:
+        asyncio.run(migrate(args.dry_run))
@@ -1,17 +1,26 @@
+import json
+import logging
+import math
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from typing import Optional
 
 from app.container import container
 from app.domain.entities.query import Query
+from app.infrastructure.llm.rate_governor import RateLimitExceeded
 
 router = APIRouter(prefix="/chat", tags=["chat"])
+logger = logging.getLogger(__name__)
 
 
 class QueryRequest(BaseModel):
     query: str
     top_k: Optional[int] = 5
     filters: Optional[dict] = None
+    # Per-request recall/latency trade-off for the vector search
+    hnsw_ef: Optional[int] = Field(None, ge=1)
+    exact: bool = False
 
 
 class QueryResponseModel(BaseModel):
@@ -27,7 +36,9 @@ async def query_rag(request: QueryRequest):
         query = Query(
             text=request.query,
             top_k=request.top_k,
-            filters=request.filters
+            filters=request.filters,
+            hnsw_ef=request.hnsw_ef,
+            exact=request.exact
         )
         
         response = await container.rag_query_use_case.execute(query)
@@ -38,5 +49,63 @@ async def query_rag(request: QueryRequest):
             metrics=response.metrics,
             model=response.model
         )
+    except RateLimitExceeded as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after))}
+        )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/stream")
+async def stream_rag(request: QueryRequest):
+    """Server-sent events: sources, then tokens as generated, then metrics."""
+    query = Query(
+        text=request.query,
+        top_k=request.top_k,
+        filters=request.filters,
+        hnsw_ef=request.hnsw_ef,
+        exact=request.exact
+    )
+    
+    async def event_stream():
+        try:
+            async for event in container.rag_query_use_case.stream(query):
+                if event["type"] == "sources":
+                    data = [{"id": s.id, "content": s.content[:200]} for s in event["sources"]]
+                elif event["type"] == "token":
+                    data = event["text"]
+                else:
+                    data = {"metrics": event["metrics"], "model": event["model"]}
+                yield _sse(event["type"], data)
+        except Exception as e:
+            logger.error(f"Streaming query failed: {e}")
+            yield _sse("error", str(e))
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/llm/stats")
+async def llm_stats():
+    """Per-provider latency, error rate and circuit state of the LLM router."""
+    if container.llm_router is None:
+        return {"enabled": False}
+    return {"enabled": True, **container.llm_router.stats()}
+
+
+@router.get("/llm/rate-limit/stats")
+async def llm_rate_limit_stats():
+    governor = container.llm_governor
+    if governor is None:
+        return {"enabled": False}
+    return {"enabled": True, **governor.stats()}
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
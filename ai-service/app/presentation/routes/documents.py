@@ -1,9 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
 from datetime import datetime
+from typing import List, Optional
 
 from app.container import container
-from app.domain.entities.document import Document
+from app.domain.entities.job import IndexJob, JobStatus
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
@@ -12,29 +13,124 @@ class IndexRequest(BaseModel):
     content: str
     title: str
     metadata: dict = {}
+    # Reuse an id to update that document; only changed chunks are re-embedded
+    doc_id: Optional[str] = None
 
 
-class IndexResponse(BaseModel):
+class IngestRequest(BaseModel):
+    title: str
+    metadata: dict = {}
+    doc_id: Optional[str] = None
+
+
+class JobResponse(BaseModel):
+    job_id: str
     doc_id: str
-    chunks_created: int
+    title: str
+    status: str
+    bytes_received: int
+    chunks_indexed: int
     total_words: int
+    chunks_inserted: int
+    chunks_reused: int
+    chunks_deleted: int
+    attempts: int
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    
+    @classmethod
+    def from_job(cls, job: IndexJob) -> "JobResponse":
+        return cls(
+            job_id=job.id,
+            doc_id=job.doc_id,
+            title=job.title,
+            status=job.status.value,
+            bytes_received=job.bytes_received,
+            chunks_indexed=job.chunks_indexed,
+            total_words=job.total_words,
+            chunks_inserted=job.chunks_inserted,
+            chunks_reused=job.chunks_reused,
+            chunks_deleted=job.chunks_deleted,
+            attempts=job.attempts,
+            error=job.error,
+            created_at=job.created_at,
+            updated_at=job.updated_at
+        )
 
 
-@router.post("/index", response_model=IndexResponse)
+@router.post("/index", response_model=JobResponse, status_code=202)
 async def index_document(request: IndexRequest):
+    """Queue the document for background indexing; poll GET /documents/jobs/{job_id}."""
     try:
-        doc_id = f"doc_{datetime.utcnow().timestamp()}"
-        
-        document = Document(
-            id=doc_id,
-            content=request.content,
-            title=request.title,
-            created_at=datetime.utcnow(),
-            metadata=request.metadata
+        job = await container.index_job_worker.submit(
+            request.title, request.content, request.metadata, request.doc_id
         )
-        
-        result = await container.index_document_use_case.execute(document)
-        
-        return IndexResponse(**result)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+    return JobResponse.from_job(job)
+
+
+@router.post("/ingest", response_model=JobResponse, status_code=201)
+async def create_ingest_job(request: IngestRequest):
+    """Create an ingestion job; upload the text with PUT /documents/ingest/{job_id}."""
+    job = await container.ingest_document_use_case.create_job(
+        request.title, request.metadata, request.doc_id
+    )
+    return JobResponse.from_job(job)
+
+
+@router.put("/ingest/{job_id}", response_model=JobResponse)
+async def upload_document(job_id: str, request: Request):
+    """
+    Stream the document body (plain text, any length, chunked transfer
+    allowed). It is chunked, embedded and indexed while it uploads; poll
+    GET /documents/jobs/{job_id} for progress.
+    """
+    job = await container.ingest_document_use_case.claim(job_id)
+    if job is None:
+        existing = await container.job_store.get(job_id)
+        if existing is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if existing.status != JobStatus.PENDING:
+            raise HTTPException(status_code=409, detail=f"Job is already {existing.status.value}")
+        if existing.content_path is not None:
+            raise HTTPException(status_code=409, detail="Job content was submitted with POST /documents/index")
+        raise HTTPException(status_code=409, detail=f"Document {existing.doc_id} is already being indexed")
+    
+    try:
+        job = await container.ingest_document_use_case.execute(job, request.stream())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return JobResponse.from_job(job)
+
+
+@router.get("/jobs", response_model=List[JobResponse])
+async def list_jobs(status: Optional[JobStatus] = None, limit: int = Query(100, ge=1, le=1000)):
+    jobs = await container.job_store.list(status=status, limit=limit)
+    return [JobResponse.from_job(job) for job in jobs]
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    job = await container.job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse.from_job(job)
+
+
+@router.delete("/{doc_id}", status_code=204)
+async def delete_document(doc_id: str):
+    """Delete every indexed chunk of a document."""
+    try:
+        await container.index_document_use_case.delete(doc_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/embedding-cache/stats")
+async def embedding_cache_stats():
+    cache = container.embedding_service.cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
@@ -0,0 +1,107 @@
+"""
+Filtered-search latency with and without payload indexes.
+
+Fills a scratch collection with random vectors spread over ``--docs``
+documents, times searches filtered on one ``doc_id``, then creates the
+payload indexes from Settings and times the same searches again. The
+scratch collection is dropped afterwards.
+
+    python -m benchmarks.filtered_search --points 200000 --docs 2000
+
+Runs against the Qdrant server in QDRANT_HOST / QDRANT_PORT unless
+``--host`` / ``--port`` are given.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from typing import List
+
+import numpy as np
+
+from app.config import settings
+from app.domain.entities.document import DocumentChunk
+from app.infrastructure.qdrant.qdrant_repo import QdrantRepository
+
+UPSERT_BATCH_SIZE = 1000
+
+
+async def fill(repo: QdrantRepository, points: int, docs: int, dimension: int) -> None:
+    rng = np.random.default_rng(0)
+    for offset in range(0, points, UPSERT_BATCH_SIZE):
+        count = min(UPSERT_BATCH_SIZE, points - offset)
+        vectors = rng.standard_normal((count, dimension), dtype=np.float32)
+        await repo.upsert([
+            DocumentChunk(
+                id=uuid.uuid4().hex,
+                content=f"chunk {offset + i}",
+                embedding=vector.tolist(),
+                metadata={"doc_id": f"doc_{doc}", "doc_title": f"Document {doc}"}
+            )
+            for i, vector in enumerate(vectors)
+            for doc in [(offset + i) % docs]
+        ])
+
+
+async def time_searches(
+    repo: QdrantRepository,
+    queries: int,
+    docs: int,
+    dimension: int,
+    top_k: int
+) -> List[float]:
+    rng = np.random.default_rng(1)
+    picker = random.Random(1)
+    latencies = []
+    for _ in range(queries):
+        doc_id = f"doc_{picker.randrange(docs)}"
+        started = time.perf_counter()
+        await repo.search(
+            rng.standard_normal(dimension).tolist(),
+            top_k=top_k,
+            filters={"must": [{"key": "doc_id", "match": {"value": doc_id}}]}
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def report(label: str, latencies: List[float]) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:>12}: p50 {statistics.median(latencies):7.2f} ms  p95 {p95:7.2f} ms")
+
+
+async def main(args: argparse.Namespace) -> None:
+    repo = QdrantRepository(
+        host=args.host,
+        port=args.port,
+        collection_name=f"bench_filtered_{uuid.uuid4().hex[:8]}",
+        payload_indexes=settings.qdrant_payload_indexes
+    )
+    indexes, repo.payload_indexes = repo.payload_indexes, {}
+    try:
+        await repo.initialize(vector_size=args.dimension)
+        print(f"Loading {args.points} points over {args.docs} documents...")
+        await fill(repo, args.points, args.docs, args.dimension)
+
+        report("no index", await time_searches(repo, args.queries, args.docs, args.dimension, args.top_k))
+
+        repo.payload_indexes = indexes
+        await repo.ensure_payload_indexes()
+        report("indexed", await time_searches(repo, args.queries, args.docs, args.dimension, args.top_k))
+    finally:
+        await repo.client.delete_collection(repo.collection_name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default=settings.qdrant_host)
+    parser.add_argument("--port", type=int, default=settings.qdrant_port)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--docs", type=int, default=1_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--top-k", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
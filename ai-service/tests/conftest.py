@@ -0,0 +1,4 @@
+import os
+
+# Settings() requires a key at import time; tests never call Groq
+os.environ.setdefault("GROQ_API_KEY", "test-key")
@@ -0,0 +1,57 @@
+import pytest
+
+from app.domain.entities.document import DocumentChunk
+from app.infrastructure.lexical.bm25_index import SqliteBm25Index
+from app.infrastructure.lexical.fusion import reciprocal_rank_fusion
+
+
+def chunk(chunk_id, content, doc_id="doc_1"):
+    return DocumentChunk(id=chunk_id, content=content, metadata={"doc_id": doc_id, "doc_title": "Manual"})
+
+
+CHUNKS = [
+    chunk("a", "Login fails with ERR-401 when the JWT token has expired."),
+    chunk("b", "Error 500 is returned when the database is unreachable."),
+    chunk("c", "Rate limiting in the API gateway allows 100 requests per minute.", doc_id="doc_2"),
+    chunk("d", "Tokens are refreshed by the auth-service every 30 minutes.")
+]
+
+
+@pytest.mark.asyncio
+async def test_exact_identifiers_rank_first(tmp_path):
+    index = SqliteBm25Index(str(tmp_path / "lexical.db"))
+    await index.add(CHUNKS)
+
+    results = await index.search("what does ERR-401 mean?", top_k=3)
+
+    assert results[0].id == "a"
+    assert results[0].metadata["doc_title"] == "Manual"
+    assert [r.id for r in await index.search("auth-service")] == ["d"]
+    assert await index.search("?!") == []
+
+
+@pytest.mark.asyncio
+async def test_updates_and_deletes_are_reflected_after_reopen(tmp_path):
+    path = str(tmp_path / "lexical.db")
+    index = SqliteBm25Index(path)
+    await index.add(CHUNKS)
+    await index.add([chunk("a", "Login fails with ERR-403 for disabled users.")])
+    await index.update_metadata({"b": {"doc_title": "Runbook"}})
+    await index.delete_many(["d"])
+    await index.delete_document("doc_2")
+    index.close()
+
+    index = SqliteBm25Index(path)
+    assert await index.count() == 2
+    assert await index.search("ERR-401") == []
+    assert [r.id for r in await index.search("ERR-403")] == ["a"]
+    assert (await index.search("database"))[0].metadata["doc_title"] == "Runbook"
+    assert await index.search("gateway") == []
+
+
+def test_reciprocal_rank_fusion_favours_chunks_found_by_both():
+    a, b, c, d = CHUNKS
+
+    fused = reciprocal_rank_fusion([[a, b, c], [d, b]], top_k=3)
+
+    assert [x.id for x in fused] == ["b", "a", "d"]
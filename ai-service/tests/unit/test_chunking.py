@@ -0,0 +1,107 @@
+import pytest
+
+from app.infrastructure.embeddings.chunking import ChunkingService
+
+
+def sentences(count: int, words: int = 5) -> str:
+    return " ".join(
+        " ".join(f"s{i}w{j}" for j in range(words)) + "." for i in range(count)
+    )
+
+
+def test_chunks_respect_token_budget_and_sentence_boundaries():
+    text = sentences(20)
+    chunker = ChunkingService(chunk_size=12, overlap=5)
+
+    chunks = chunker.chunk_text(text, "doc")
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        meta = chunk["metadata"]
+        assert meta["token_count"] <= 12
+        assert chunk["content"] == text[meta["start_char"]:meta["end_char"]]
+        assert chunk["content"].endswith(".")
+    assert [c["metadata"]["chunk_index"] for c in chunks] == list(range(len(chunks)))
+
+
+def test_consecutive_chunks_overlap_by_whole_sentences():
+    chunker = ChunkingService(chunk_size=12, overlap=5)
+
+    chunks = chunker.chunk_text(sentences(6), "doc")
+
+    for previous, current in zip(chunks, chunks[1:]):
+        last_sentence = previous["content"].rsplit(". ", 1)[-1]
+        assert current["content"].startswith(last_sentence.rstrip("."))
+
+
+def test_overlong_sentence_is_split_into_token_windows():
+    text = " ".join(f"w{i}" for i in range(50))
+    chunker = ChunkingService(chunk_size=10, overlap=2)
+
+    chunks = chunker.chunk_text(text, "doc")
+
+    assert all(c["metadata"]["token_count"] <= 10 for c in chunks)
+    assert chunks[0]["content"].startswith("w0 ")
+    assert chunks[-1]["content"].endswith("w49")
+
+
+def test_paragraphs_are_boundaries_and_blank_text_yields_nothing():
+    chunker = ChunkingService(chunk_size=4, overlap=1)
+
+    chunks = chunker.chunk_text("one two three\n\nfour five six", "doc")
+
+    assert [c["content"] for c in chunks] == ["one two three", "four five six"]
+    assert chunker.chunk_text("   \n\n  ", "doc") == []
+
+
+def test_uses_injected_tokenizer_for_sizes():
+    # Every character is a token
+    chunker = ChunkingService(
+        chunk_size=8,
+        overlap=0,
+        token_offsets=lambda s: [(i, i + 1) for i, c in enumerate(s) if not c.isspace()]
+    )
+
+    chunks = chunker.chunk_text("abcd. efgh. ijkl.", "doc")
+
+    assert [c["content"] for c in chunks] == ["abcd.", "efgh.", "ijkl."]
+
+
+def test_overlap_must_be_smaller_than_chunk_size():
+    with pytest.raises(ValueError):
+        ChunkingService(chunk_size=10, overlap=10)
+
+
+def test_chunk_ids_follow_content_so_edits_keep_later_ids():
+    text = sentences(300, words=6)
+    chunker = ChunkingService(chunk_size=40, overlap=8)
+    edited = text.replace("s150w0 s150w1", "an inserted clause, s150w0 s150w1")
+
+    before = {c["id"] for c in chunker.chunk_text(text, "doc")}
+    after = [c["id"] for c in chunker.chunk_text(edited, "doc")]
+
+    assert len(set(after) - before) <= 3
+    assert after[-1] in before
+
+
+def test_identical_chunks_get_distinct_ids():
+    chunker = ChunkingService(chunk_size=4, overlap=0)
+
+    chunks = chunker.chunk_text("same words here.\n\nsame words here.", "doc")
+
+    assert chunks[0]["metadata"]["content_hash"] == chunks[1]["metadata"]["content_hash"]
+    assert chunks[0]["id"] != chunks[1]["id"]
+
+
+@pytest.mark.asyncio
+async def test_streamed_chunks_match_in_memory_chunks():
+    text = sentences(40, words=7) + "\n\n" + " ".join(f"x{i}" for i in range(60))
+    chunker = ChunkingService(chunk_size=20, overlap=6)
+
+    async def blocks():
+        for i in range(0, len(text), 13):
+            yield text[i:i + 13]
+
+    streamed = [chunk async for chunk in chunker.iter_chunks_stream(blocks(), "doc")]
+
+    assert streamed == chunker.chunk_text(text, "doc")
@@ -0,0 +1,74 @@
+from app.domain.entities.document import DocumentChunk
+from app.infrastructure.context.context_builder import ContextBuilder
+from app.infrastructure.embeddings.chunking import ChunkingService
+
+TEXT = (
+    "Login fails with ERR-401 when the token has expired. "
+    "Tokens are refreshed every 30 minutes. "
+    "The gateway allows 100 requests per minute. "
+    "Errors are logged to the audit service."
+)
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def chunks_of(text, doc_id="doc_1", **kwargs):
+    chunker = ChunkingService(**kwargs)
+    return [
+        DocumentChunk(id=c["id"], content=c["content"], metadata=c["metadata"])
+        for c in chunker.chunk_text(text, doc_id)
+    ]
+
+
+def test_overlapping_text_is_sent_once():
+    chunks = chunks_of(TEXT, chunk_size=18, overlap=9)
+    assert len(chunks) > 1
+
+    context = ContextBuilder(count_words, max_tokens=1000).build("ERR-401", chunks)
+
+    sent = " ".join(p.content for p in context.passages)
+    for sentence in TEXT.split(". "):
+        assert sent.count(sentence.rstrip(".")) == 1
+    assert context.overlaps_removed >= 1
+    assert context.tokens == count_words(sent)
+    assert context.tokens_saved == sum(count_words(c.content) for c in chunks) - context.tokens
+
+
+def test_fully_covered_and_duplicate_chunks_are_dropped():
+    whole = chunks_of(TEXT, chunk_size=100, overlap=0)[0]
+    part = chunks_of(TEXT, chunk_size=18, overlap=9)[1]
+    no_offsets = DocumentChunk(id="x", content="Same text.")
+    copy = DocumentChunk(id="y", content="Same text.")
+
+    context = ContextBuilder(count_words).build("tokens", [whole, part, no_offsets, copy])
+
+    assert [p.id for p in context.passages] == [whole.id, "x"]
+    assert context.overlaps_removed == 2
+
+
+def test_budget_keeps_most_relevant_chunks_that_fit():
+    chunks = [
+        DocumentChunk(id="a", content="one two three four"),
+        DocumentChunk(id="b", content="five six seven eight nine ten"),
+        DocumentChunk(id="c", content="eleven twelve")
+    ]
+
+    context = ContextBuilder(count_words, max_tokens=10).build("q", chunks, reserved_tokens=4)
+
+    assert [p.id for p in context.passages] == ["a", "c"]
+    assert context.tokens == 6
+    assert context.dropped == 1
+
+
+def test_trimming_keeps_sentences_matching_the_query():
+    chunk = DocumentChunk(id="a", content=TEXT)
+    builder = ContextBuilder(count_words, trim_sentences=True)
+
+    context = builder.build("How often are tokens refreshed?", [chunk])
+
+    assert context.passages[0].content == "Tokens are refreshed every 30 minutes."
+    assert context.sentences_trimmed == 1
+    assert chunk.content == TEXT
+    assert builder.build("unrelated", [chunk]).passages[0].content == TEXT
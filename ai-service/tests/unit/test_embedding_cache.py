@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from app.infrastructure.embeddings import embedding_service
+from app.infrastructure.embeddings.embedding_cache import EmbeddingCache, DIGEST_SIZE
+from app.infrastructure.embeddings.embedding_service import EmbeddingService
+
+
+class CountingModel:
+    def __init__(self, model_name):
+        self.encoded = []
+
+    def get_sentence_embedding_dimension(self):
+        return 3
+
+    def encode(self, texts, batch_size=32, convert_to_tensor=False):
+        self.encoded.extend(texts)
+        return np.array([[len(text), 0.5, -1.0] for text in texts], dtype=np.float32)
+
+
+def test_cache_persists_and_normalizes_whitespace(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "all-MiniLM-L6-v2", 3)
+    cache.put_many(["hello  world", "other"], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    reopened = EmbeddingCache(str(tmp_path), "all-MiniLM-L6-v2", 3)
+
+    assert len(reopened) == 2
+    assert reopened.get_many(["hello world\n", "missing"]) == [[1.0, 2.0, 3.0], None]
+    assert reopened.stats()["hit_rate"] == 0.5
+
+
+def test_cache_is_scoped_to_model(tmp_path):
+    EmbeddingCache(str(tmp_path), "model-a", 3).put_many(["text"], [[1.0, 1.0, 1.0]])
+
+    assert EmbeddingCache(str(tmp_path), "model-b", 3).get_many(["text"]) == [None]
+
+
+def test_interrupted_append_is_trimmed_on_load(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "m", 3)
+    cache.put_many(["a"], [[1.0, 2.0, 3.0]])
+
+    # Simulate a crash after writing a vector but before its key
+    with open(tmp_path / "m.vectors", "ab") as f:
+        f.write(np.zeros(3, dtype=np.float32).tobytes())
+    with open(tmp_path / "m.keys", "ab") as f:
+        f.write(b"\x00" * (DIGEST_SIZE // 2))
+
+    reopened = EmbeddingCache(str(tmp_path), "m", 3)
+
+    assert len(reopened) == 1
+    assert (tmp_path / "m.keys").stat().st_size == DIGEST_SIZE
+    assert reopened.get_many(["a"]) == [[1.0, 2.0, 3.0]]
+
+
+@pytest.mark.asyncio
+async def test_batch_embed_only_encodes_misses(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_service, "SentenceTransformer", CountingModel)
+    service = EmbeddingService("fake", cache_dir=str(tmp_path))
+
+    first = await service.batch_embed(["alpha", "beta"])
+    second = await service.batch_embed(["alpha", "gamma", "beta"])
+
+    assert service.model.encoded == ["alpha", "beta", "gamma"]
+    assert second == [first[0], [5.0, 0.5, -1.0], first[1]]
+    assert service.cache.stats()["hits"] == 2
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import numpy as np
+import pytest
+
+from app.infrastructure.embeddings import embedding_service
+from app.infrastructure.embeddings.embedding_service import EmbeddingService
+
+
+class FakeModel:
+    def __init__(self, model_name):
+        self.calls = []
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+    def encode(self, texts, batch_size=32, convert_to_tensor=False):
+        self.calls.append((list(texts), threading.current_thread().name))
+        return np.array([[len(text), 1.0] for text in texts])
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(embedding_service, "SentenceTransformer", FakeModel)
+    return EmbeddingService("fake", max_batch_size=8, max_wait_ms=20)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embeds_are_coalesced(service):
+    service.start()
+    try:
+        vectors = await asyncio.gather(*(service.embed("x" * i) for i in range(1, 11)))
+    finally:
+        await service.stop()
+
+    assert vectors == [[float(i), 1.0] for i in range(1, 11)]
+    assert [len(texts) for texts, _ in service.model.calls] == [8, 2]
+
+
+@pytest.mark.asyncio
+async def test_encoding_runs_off_the_event_loop(service):
+    await service.batch_embed(["a", "b"])
+    await service.embed("c")
+
+    assert all(thread.startswith("embedding") for _, thread in service.model.calls)
+
+
+@pytest.mark.asyncio
+async def test_encode_error_fails_every_caller_in_batch(service):
+    def broken(texts, **kwargs):
+        raise RuntimeError("out of memory")
+
+    service.model.encode = broken
+    service.start()
+    try:
+        results = await asyncio.gather(
+            service.embed("a"), service.embed("b"), return_exceptions=True
+        )
+    finally:
+        await service.stop()
+
+    assert all(isinstance(r, RuntimeError) for r in results)
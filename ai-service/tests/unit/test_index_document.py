@@ -0,0 +1,211 @@
+import asyncio
+from datetime import datetime
+import pytest
+
+from app.application.use_cases.index_document import IndexDocumentUseCase
+from app.application.use_cases.ingest_document import IngestDocumentUseCase
+from app.domain.entities.document import Document
+from app.domain.entities.job import JobStatus
+from app.infrastructure.embeddings.chunking import ChunkingService
+from app.infrastructure.jobs.sqlite_job_store import SqliteJobStore
+from app.infrastructure.lexical.bm25_index import SqliteBm25Index
+
+TEXT = " ".join(f"Sentence number {i} is here." for i in range(100))
+
+
+class FakeEmbeddingService:
+    def __init__(self):
+        self.embedded = 0
+
+    async def batch_embed(self, texts):
+        self.embedded += len(texts)
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+class FakeVectorStore:
+    def __init__(self, fail_after=None, delay=0.0):
+        self.upserts = []
+        self.points = {}
+        self.deletes = []
+        self.fail_after = fail_after
+        self.delay = delay
+
+    async def upsert(self, chunks):
+        await asyncio.sleep(self.delay)
+        if self.fail_after is not None and len(self.upserts) >= self.fail_after:
+            raise ConnectionError("qdrant unavailable")
+        self.upserts.append(chunks)
+        for chunk in chunks:
+            self.points[chunk.id] = dict(chunk.metadata)
+
+    async def get_document_chunks(self, doc_id):
+        return {i: dict(m) for i, m in self.points.items() if m["doc_id"] == doc_id}
+
+    async def update_metadata(self, metadata_by_id):
+        for chunk_id, metadata in metadata_by_id.items():
+            self.points[chunk_id].update(metadata)
+
+    async def delete_many(self, chunk_ids):
+        self.deletes.append(list(chunk_ids))
+        for chunk_id in chunk_ids:
+            del self.points[chunk_id]
+
+    async def delete_document(self, doc_id):
+        self.points = {i: m for i, m in self.points.items() if m["doc_id"] != doc_id}
+
+
+def make_use_case(vector_store, batch_size=4, embedding_service=None):
+    return IndexDocumentUseCase(
+        vector_store=vector_store,
+        embedding_service=embedding_service or FakeEmbeddingService(),
+        chunking_service=ChunkingService(chunk_size=20, overlap=5),
+        batch_size=batch_size,
+        pipeline_depth=1
+    )
+
+
+def make_document(content="", title="Manual"):
+    return Document(id="doc_1", content=content, title=title, created_at=datetime.utcnow())
+
+
+@pytest.mark.asyncio
+async def test_execute_indexes_all_chunks_in_batches():
+    vector_store = FakeVectorStore()
+    use_case = make_use_case(vector_store)
+
+    result = await use_case.execute(make_document(TEXT))
+
+    expected = ChunkingService(chunk_size=20, overlap=5).chunk_text(TEXT, "doc_1")
+    assert result["chunks_created"] == len(expected)
+    assert all(len(batch) <= 4 for batch in vector_store.upserts)
+    assert [c.id for batch in vector_store.upserts for c in batch] == [c["id"] for c in expected]
+    assert vector_store.upserts[0][0].metadata["doc_title"] == "Manual"
+
+
+@pytest.mark.asyncio
+async def test_reindexing_embeds_only_changed_chunks():
+    vector_store = FakeVectorStore()
+    embedding_service = FakeEmbeddingService()
+    use_case = make_use_case(vector_store, embedding_service=embedding_service)
+    first = await use_case.execute(make_document(TEXT))
+
+    sentences = TEXT.split(". ")
+    sentences[50] = "This sentence was rewritten by an editor"
+    edited = ". ".join(sentences)
+    embedding_service.embedded = 0
+    result = await use_case.execute(make_document(edited))
+
+    expected = ChunkingService(chunk_size=20, overlap=5).chunk_text(edited, "doc_1")
+    assert set(vector_store.points) == {c["id"] for c in expected}
+    assert result["chunks_created"] == len(expected)
+    assert result["chunks_inserted"] == embedding_service.embedded
+    assert 0 < result["chunks_inserted"] <= 4
+    assert result["chunks_reused"] == len(expected) - result["chunks_inserted"]
+    assert result["chunks_deleted"] == first["chunks_created"] - result["chunks_reused"]
+    assert len(vector_store.deletes) == 1
+
+
+@pytest.mark.asyncio
+async def test_reindexing_unchanged_text_only_refreshes_metadata():
+    vector_store = FakeVectorStore()
+    embedding_service = FakeEmbeddingService()
+    use_case = make_use_case(vector_store, embedding_service=embedding_service)
+    await use_case.execute(make_document(TEXT))
+    embedding_service.embedded = 0
+
+    result = await use_case.execute(make_document(TEXT, title="Manual v2"))
+
+    assert embedding_service.embedded == 0
+    assert result["chunks_inserted"] == result["chunks_deleted"] == 0
+    assert all(m["doc_title"] == "Manual v2" for m in vector_store.points.values())
+
+
+@pytest.mark.asyncio
+async def test_lexical_index_follows_vector_store(tmp_path):
+    vector_store = FakeVectorStore()
+    lexical_index = SqliteBm25Index(str(tmp_path / "lexical.db"))
+    use_case = make_use_case(vector_store)
+    use_case.lexical_index = lexical_index
+    await use_case.execute(make_document(TEXT))
+
+    await use_case.execute(make_document(TEXT.replace("number 50 ", "number ERR-50 "), title="Manual v2"))
+
+    assert await lexical_index.count() == len(vector_store.points)
+    hits = await lexical_index.search("ERR-50", top_k=10)
+    assert hits and all(h.id in vector_store.points for h in hits)
+    assert all(h.metadata["doc_title"] == "Manual v2" for h in hits)
+
+    await use_case.delete("doc_1")
+    assert vector_store.points == {}
+    assert await lexical_index.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_failing_stage_stops_the_pipeline():
+    use_case = make_use_case(FakeVectorStore(fail_after=1))
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(use_case.execute(make_document(TEXT)), timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_streamed_ingest_reports_progress_and_completes(tmp_path):
+    vector_store = FakeVectorStore(delay=0.001)
+    job_store = SqliteJobStore(str(tmp_path / "jobs.db"))
+    ingest = IngestDocumentUseCase(make_use_case(vector_store), job_store)
+    job = await ingest.claim((await ingest.create_job("Manual", {})).id)
+    data = TEXT.encode()
+    progress = []
+
+    original_update = job_store.update
+
+    async def tracking_update(updated):
+        progress.append(updated.chunks_indexed)
+        await original_update(updated)
+
+    job_store.update = tracking_update
+
+    async def body():
+        for i in range(0, len(data), 100):
+            yield data[i:i + 100]
+
+    job = await ingest.execute(job, body())
+
+    stored = await job_store.get(job.id)
+    assert stored.status == JobStatus.COMPLETED
+    assert stored.bytes_received == len(data)
+    assert stored.chunks_indexed == sum(len(b) for b in vector_store.upserts)
+    assert progress == sorted(progress) and len(set(progress)) > 2
+
+
+@pytest.mark.asyncio
+async def test_upload_claim_is_granted_once_per_job_and_document(tmp_path):
+    job_store = SqliteJobStore(str(tmp_path / "jobs.db"))
+    ingest = IngestDocumentUseCase(make_use_case(FakeVectorStore()), job_store)
+    job = await ingest.create_job("Manual", {}, doc_id="doc_1")
+    other = await ingest.create_job("Manual", {}, doc_id="doc_1")
+
+    claims = await asyncio.gather(ingest.claim(job.id), ingest.claim(job.id))
+
+    assert sum(c is not None for c in claims) == 1
+    assert (await job_store.get(job.id)).status == JobStatus.RUNNING
+    # The document is already being indexed by the first job
+    assert await ingest.claim(other.id) is None
+    assert await ingest.claim("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_ingest_is_recorded_on_job(tmp_path):
+    job_store = SqliteJobStore(str(tmp_path / "jobs.db"))
+    ingest = IngestDocumentUseCase(make_use_case(FakeVectorStore(fail_after=0)), job_store)
+    job = await ingest.claim((await ingest.create_job("Manual", {})).id)
+
+    async def body():
+        yield TEXT.encode()
+
+    with pytest.raises(ConnectionError):
+        await ingest.execute(job, body())
+
+    stored = await job_store.get(job.id)
+    assert stored.status == JobStatus.FAILED
+    assert "qdrant unavailable" in stored.error
@@ -0,0 +1,150 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+
+from app.application.use_cases.index_document import IndexDocumentUseCase
+from app.domain.entities.job import IndexJob, JobStatus
+from app.infrastructure.embeddings.chunking import ChunkingService
+from app.infrastructure.jobs.index_job_worker import IndexJobWorker
+from app.infrastructure.jobs.sqlite_job_store import SqliteJobStore
+
+TEXT = " ".join(f"Sentence number {i} is here." for i in range(100))
+
+
+class FakeEmbeddingService:
+    async def batch_embed(self, texts):
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+class FlakyVectorStore:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.upserts = []
+
+    async def upsert(self, chunks):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("qdrant unavailable")
+        self.upserts.append(chunks)
+
+    async def get_document_chunks(self, doc_id):
+        return {}
+
+    async def update_metadata(self, metadata_by_id):
+        pass
+
+    async def delete_many(self, chunk_ids):
+        pass
+
+
+def make_worker(tmp_path, vector_store, **kwargs):
+    use_case = IndexDocumentUseCase(
+        vector_store=vector_store,
+        embedding_service=FakeEmbeddingService(),
+        chunking_service=ChunkingService(chunk_size=20, overlap=5),
+        batch_size=4
+    )
+    store = SqliteJobStore(str(tmp_path / "jobs.db"))
+    return IndexJobWorker(store, use_case, str(tmp_path / "jobs"), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_submitted_job_is_indexed_in_background(tmp_path):
+    vector_store = FlakyVectorStore()
+    worker = make_worker(tmp_path, vector_store, poll_interval=0.01)
+    await worker.start()
+    try:
+        job = await worker.submit("Manual", TEXT, {"lang": "en"})
+        assert job.status == JobStatus.PENDING
+
+        for _ in range(200):
+            stored = await worker.job_store.get(job.id)
+            if stored.status == JobStatus.COMPLETED:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await worker.stop()
+
+    assert stored.status == JobStatus.COMPLETED
+    assert stored.attempts == 1
+    assert stored.chunks_indexed == sum(len(b) for b in vector_store.upserts) > 0
+    assert vector_store.upserts[0][0].metadata["doc_title"] == "Manual"
+    assert not (tmp_path / "jobs" / f"{job.id}.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_with_backoff_then_fails(tmp_path):
+    worker = make_worker(tmp_path, FlakyVectorStore(failures=10), max_attempts=2, backoff_seconds=60)
+    worker.content_dir.mkdir()
+    job = await worker.submit("Manual", TEXT, {})
+
+    before = datetime.utcnow()
+    assert await worker.run_next()
+    stored = await worker.job_store.get(job.id)
+    assert stored.status == JobStatus.PENDING
+    assert "qdrant unavailable" in stored.error
+    assert stored.next_attempt_at >= before + timedelta(seconds=60)
+
+    # Not due yet
+    assert not await worker.run_next()
+
+    stored.next_attempt_at = datetime.utcnow()
+    await worker.job_store.update(stored)
+    assert await worker.run_next()
+    stored = await worker.job_store.get(job.id)
+    assert stored.status == JobStatus.FAILED
+    assert stored.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_succeeds_after_transient_failure(tmp_path):
+    vector_store = FlakyVectorStore(failures=1)
+    worker = make_worker(tmp_path, vector_store, backoff_seconds=0)
+    worker.content_dir.mkdir()
+    job = await worker.submit("Manual", TEXT, {})
+
+    assert await worker.run_next()
+    assert await worker.run_next()
+
+    stored = await worker.job_store.get(job.id)
+    assert stored.status == JobStatus.COMPLETED
+    assert stored.error is None
+    assert stored.chunks_indexed == sum(len(b) for b in vector_store.upserts)
+
+
+@pytest.mark.asyncio
+async def test_recover_requeues_interrupted_jobs(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    store = SqliteJobStore(path)
+    queued = await store.create(IndexJob(id="a", doc_id="doc_a", title="A", content_path="a.txt"))
+    await store.create(IndexJob(id="b", doc_id="doc_b", title="B", status=JobStatus.RUNNING))
+    assert (await store.claim_next(datetime.utcnow())).id == queued.id
+    store.close()
+
+    # Simulated restart
+    store = SqliteJobStore(path)
+    assert await store.recover() == 1
+    assert (await store.get("a")).status == JobStatus.PENDING
+    streamed = await store.get("b")
+    assert streamed.status == JobStatus.FAILED
+    assert streamed.error == "Interrupted by restart"
+
+    claimed = await store.claim_next(datetime.utcnow())
+    assert claimed.id == "a" and claimed.attempts == 2
+    assert await store.claim_next(datetime.utcnow()) is None
+    assert [j.id for j in await store.list(status=JobStatus.RUNNING)] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_jobs_for_the_same_document_run_one_at_a_time(tmp_path):
+    store = SqliteJobStore(str(tmp_path / "jobs.db"))
+    await store.create(IndexJob(id="a", doc_id="doc", title="v1", content_path="a.txt"))
+    await store.create(IndexJob(id="b", doc_id="doc", title="v2", content_path="b.txt"))
+
+    first = await store.claim_next(datetime.utcnow())
+    assert first.id == "a"
+    assert await store.claim_next(datetime.utcnow()) is None
+
+    first.status = JobStatus.COMPLETED
+    await store.update(first)
+    assert (await store.claim_next(datetime.utcnow())).id == "b"
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_asyncio
+
+from app.infrastructure.llm.llm_router import LLMRouter, OPEN
+from app.infrastructure.llm.openai_compatible_client import OpenAICompatibleClient
+
+MESSAGES = [{"role": "user", "content": "When do tokens expire?"}]
+
+# Path prefix -> response delay in seconds, or None for an outage
+BACKENDS = {"fast": 0.01, "slow": 0.5, "down": None}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """OpenAI-compatible chat completions; the first path segment picks the backend."""
+
+    def do_POST(self):
+        backend = self.path.strip("/").split("/")[0]
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.calls[backend] += 1
+
+        delay = BACKENDS[backend]
+        if delay is None:
+            self.send_response(503)
+            self.end_headers()
+            return
+        time.sleep(delay)
+
+        usage = {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12}
+        if body.get("stream"):
+            events = [
+                {"model": body["model"], "choices": [{"delta": {"content": token}}]}
+                for token in ["30", " minutes"]
+            ] + [{"model": body["model"], "choices": [], "usage": usage}]
+            payload = "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+            content_type = "text/event-stream"
+        else:
+            payload = json.dumps({
+                "model": body["model"],
+                "choices": [{"message": {"role": "assistant", "content": f"answer from {backend}"}}],
+                "usage": usage
+            })
+            content_type = "application/json"
+
+        data = payload.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.calls = Counter()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+
+@pytest_asyncio.fixture
+async def make_router(stub_server):
+    routers = []
+    stub_server.calls.clear()
+
+    def make(*backends, **kwargs):
+        port = stub_server.server_address[1]
+        router = LLMRouter({
+            backend: OpenAICompatibleClient(f"http://127.0.0.1:{port}/{backend}/v1", model_id=backend)
+            for backend in backends
+        }, **kwargs)
+        routers.append(router)
+        return router
+
+    yield make
+    for router in routers:
+        await router.close()
+
+
+@pytest.mark.asyncio
+async def test_routes_to_fastest_provider_once_measured(make_router):
+    router = make_router("slow", "fast", hedging=False)
+
+    models = [(await router.generate(MESSAGES)).model for _ in range(4)]
+
+    # Each provider is measured once, then the faster one takes the traffic
+    assert models == ["slow", "fast", "fast", "fast"]
+    stats = router.stats()["providers"]
+    assert stats["fast"]["p50_ms"] < stats["slow"]["p50_ms"]
+
+
+@pytest.mark.asyncio
+async def test_failures_fail_over_and_open_the_circuit(make_router, stub_server):
+    router = make_router("down", "fast", failure_threshold=2, cooldown_seconds=60)
+
+    for _ in range(4):
+        response = await router.generate(MESSAGES)
+        assert response.text == "answer from fast"
+
+    assert stub_server.calls["down"] == 2
+    assert router.health["down"].state == OPEN
+    assert router.stats()["failovers"] == 2
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_closes_after_successful_trial(make_router):
+    router = make_router("fast", failure_threshold=1, cooldown_seconds=0)
+    router.health["fast"].record_failure()
+
+    await router.generate(MESSAGES)
+
+    assert router.health["fast"].opened_at is None
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_past_p95(make_router):
+    router = make_router("slow", "fast", min_samples=5)
+    # Past measurements rank "slow" first with a 20 ms p95
+    for _ in range(5):
+        router.health["slow"].record_success(20.0)
+        router.health["fast"].record_success(50.0)
+
+    start = time.monotonic()
+    response = await router.generate(MESSAGES)
+
+    assert response.text == "answer from fast"
+    assert time.monotonic() - start < 0.4
+    assert router.stats()["hedged"] == router.stats()["hedge_wins"] == 1
+    # The cancelled call is recorded as at least as slow as it ran
+    await asyncio.sleep(0.05)
+    assert max(router.health["slow"].latencies) > 20.0
+
+
+@pytest.mark.asyncio
+async def test_stream_fails_over_before_first_token(make_router):
+    router = make_router("down", "fast")
+
+    chunks = [c async for c in router.stream(MESSAGES)]
+
+    assert "".join(c.text for c in chunks) == "30 minutes"
+    assert chunks[-1].usage.total_tokens == 12
+
+
+@pytest.mark.asyncio
+async def test_all_providers_failing_raises(make_router):
+    router = make_router("down", failure_threshold=1, cooldown_seconds=60)
+
+    with pytest.raises(RuntimeError, match="All LLM providers failed"):
+        await router.generate(MESSAGES)
+    with pytest.raises(RuntimeError, match="No LLM provider available"):
+        await router.generate(MESSAGES)
@@ -0,0 +1,153 @@
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Disabled
+
+from app.domain.entities.document import DocumentChunk
+from app.infrastructure.qdrant.qdrant_repo import QdrantRepository
+
+
+def chunk(i: int, doc_id: str) -> DocumentChunk:
+    return DocumentChunk(
+        id=f"{i:032x}",
+        content=f"chunk {i}",
+        embedding=[1.0, float(i)],
+        metadata={"doc_id": doc_id, "doc_title": doc_id.upper()}
+    )
+
+
+@pytest_asyncio.fixture
+async def repo():
+    repo = QdrantRepository("localhost", 6333, payload_indexes={"doc_id": "keyword"})
+    repo.client = AsyncQdrantClient(location=":memory:")
+    await repo.initialize(vector_size=2)
+    await repo.upsert([chunk(i, "a") for i in range(1, 6)] + [chunk(i, "b") for i in range(6, 9)])
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_delete_many_and_delete_document(repo):
+    await repo.delete_many([f"{1:032x}", f"{2:032x}"])
+    assert sorted(await repo.get_document_chunks("a")) == [f"{i:032x}" for i in range(3, 6)]
+
+    await repo.delete_document("a")
+    assert await repo.get_document_chunks("a") == {}
+    assert len(await repo.get_document_chunks("b")) == 3
+
+
+@pytest.mark.asyncio
+async def test_filtered_search_only_returns_matching_document(repo):
+    results = await repo.search(
+        [1.0, 7.0],
+        top_k=10,
+        filters={"must": [{"key": "doc_id", "match": {"value": "b"}}]}
+    )
+
+    assert {r.metadata["doc_id"] for r in results} == {"b"}
+    assert len(results) == 3
+
+
+@pytest.mark.asyncio
+async def test_only_missing_payload_indexes_are_created(repo, monkeypatch):
+    created = []
+
+    class Info:
+        payload_schema = {"doc_id": object()}
+
+    async def get_collection(name):
+        return Info()
+
+    async def create_payload_index(collection_name, field_name, field_schema):
+        created.append((field_name, field_schema.value))
+
+    monkeypatch.setattr(repo.client, "get_collection", get_collection)
+    monkeypatch.setattr(repo.client, "create_payload_index", create_payload_index)
+    repo.payload_indexes = {"doc_id": "keyword", "doc_title": "keyword", "chunk_index": "integer"}
+
+    await repo.ensure_payload_indexes()
+
+    assert created == [("doc_title", "keyword"), ("chunk_index", "integer")]
+
+
+def collection_info(m=16, ef_construct=100, quantile=None, on_disk=False, on_disk_payload=None):
+    scalar = SimpleNamespace(quantile=quantile) if quantile else None
+    return SimpleNamespace(config=SimpleNamespace(
+        hnsw_config=SimpleNamespace(m=m, ef_construct=ef_construct),
+        quantization_config=SimpleNamespace(scalar=scalar) if scalar else None,
+        params=SimpleNamespace(vectors=SimpleNamespace(on_disk=on_disk), on_disk_payload=on_disk_payload)
+    ))
+
+
+@pytest.mark.asyncio
+async def test_apply_tuning_updates_only_changed_options(monkeypatch):
+    repo = QdrantRepository(
+        "localhost", 6333, hnsw_m=32, quantization=True, on_disk_vectors=True
+    )
+    updates = []
+
+    async def get_collection(name):
+        return collection_info()
+
+    async def update_collection(**kwargs):
+        updates.append(kwargs)
+
+    monkeypatch.setattr(repo.client, "get_collection", get_collection)
+    monkeypatch.setattr(repo.client, "update_collection", update_collection)
+
+    changes = await repo.apply_tuning()
+
+    assert changes == {
+        "hnsw_m": (16, 32),
+        "quantization_quantile": (None, 0.99),
+        "on_disk_vectors": (False, True)
+    }
+    update = updates[0]
+    assert (update["hnsw_config"].m, update["hnsw_config"].ef_construct) == (32, 100)
+    assert update["quantization_config"].scalar.always_ram
+    assert update["vectors_config"][""].on_disk is True
+    assert update["collection_params"] is None
+
+
+@pytest.mark.asyncio
+async def test_apply_tuning_can_disable_quantization_and_is_idempotent(monkeypatch):
+    repo = QdrantRepository("localhost", 6333)
+    info = collection_info(quantile=0.99)
+    updates = []
+
+    async def get_collection(name):
+        return info
+
+    async def update_collection(**kwargs):
+        updates.append(kwargs)
+
+    monkeypatch.setattr(repo.client, "get_collection", get_collection)
+    monkeypatch.setattr(repo.client, "update_collection", update_collection)
+
+    assert await repo.apply_tuning() == {"quantization_quantile": (0.99, None)}
+    assert updates[0]["quantization_config"] == Disabled.DISABLED
+
+    info = collection_info()
+    assert await repo.apply_tuning() == {}
+    assert len(updates) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_params_come_from_request_or_default(repo, monkeypatch):
+    calls = []
+
+    async def search(**kwargs):
+        calls.append(kwargs["search_params"])
+        return []
+
+    monkeypatch.setattr(repo.client, "search", search)
+
+    await repo.search([1.0, 0.0])
+    await repo.search([1.0, 0.0], hnsw_ef=128)
+    repo.hnsw_ef = 64
+    await repo.search([1.0, 0.0], exact=True)
+
+    assert calls[0] is None
+    assert calls[1].hnsw_ef == 128 and not calls[1].exact
+    assert calls[2].hnsw_ef == 64 and calls[2].exact
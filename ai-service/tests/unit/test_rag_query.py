@@ -0,0 +1,213 @@
+import pytest
+
+from app.application.use_cases.rag_query import RAGQueryUseCase
+from app.domain.entities.document import DocumentChunk
+from app.domain.entities.query import Query, LLMResponse, LLMStreamChunk, TokenUsage
+from app.domain.interfaces.llm_provider import LLMProvider
+from app.infrastructure.cache.semantic_cache import SemanticCache
+from app.infrastructure.context.context_builder import ContextBuilder
+from app.infrastructure.evaluation.metrics import ResponseEvaluator
+
+MODEL = "llama-3.3-70b-versatile"
+
+
+class FakeEmbeddingService:
+    async def embed(self, text):
+        return [0.1, 0.2, 0.3]
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.calls = []
+
+    async def search(self, embedding, top_k=5, filters=None, hnsw_ef=None, exact=False):
+        self.calls.append((embedding, top_k, filters, hnsw_ef, exact))
+        return [
+            DocumentChunk(id="c1", content="JWT tokens expire after 30 minutes"),
+            DocumentChunk(id="c2", content="Refresh tokens last 7 days")
+        ]
+
+
+class FakeLLM(LLMProvider):
+    def __init__(self):
+        self.messages = None
+
+    async def generate(self, messages, max_tokens=1000, temperature=0.7):
+        self.messages = messages
+        return LLMResponse(
+            text="30 minutes",
+            usage=TokenUsage(input_tokens=100, output_tokens=5, total_tokens=105),
+            model=MODEL,
+            duration_ms=12.0
+        )
+
+    async def stream(self, messages, max_tokens=1000, temperature=0.7):
+        self.messages = messages
+        for token in ["30", " minutes"]:
+            yield LLMStreamChunk(text=token, model=MODEL)
+        yield LLMStreamChunk(
+            text="",
+            usage=TokenUsage(input_tokens=100, output_tokens=2, total_tokens=102),
+            model=MODEL
+        )
+
+
+@pytest.fixture
+def use_case():
+    return RAGQueryUseCase(
+        llm_provider=FakeLLM(),
+        vector_store=FakeVectorStore(),
+        embedding_service=FakeEmbeddingService(),
+        evaluator=ResponseEvaluator()
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_builds_prompt_from_retrieved_chunks(use_case):
+    response = await use_case.execute(Query(text="When do tokens expire?", top_k=2))
+
+    assert response.text == "30 minutes"
+    assert [s.id for s in response.sources] == ["c1", "c2"]
+    assert use_case.vector_store.calls[0][1] == 2
+
+    system, user = use_case.llm_provider.messages
+    assert system["role"] == "system" and "RAG" in system["content"]
+    assert "Documento 1:\nJWT tokens expire after 30 minutes" in user["content"]
+    assert user["content"].endswith("Pregunta: When do tokens expire?")
+
+    assert response.metrics["input_tokens"] == 100
+    assert "retrieval_ms" in response.metrics
+    assert "ttfb_ms" not in response.metrics
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_sources_tokens_then_metrics(use_case):
+    events = [event async for event in use_case.stream(Query(text="When do tokens expire?"))]
+
+    assert [e["type"] for e in events] == ["sources", "token", "token", "done"]
+    assert "".join(e["text"] for e in events if e["type"] == "token") == "30 minutes"
+
+    metrics = events[-1]["metrics"]
+    assert metrics["output_tokens"] == 2
+    assert metrics["ttfb_ms"] <= metrics["latency_ms"]
+    assert events[-1]["model"] == MODEL
+
+
+@pytest.mark.asyncio
+async def test_default_stream_falls_back_to_generate():
+    class GenerateOnlyLLM(LLMProvider):
+        async def generate(self, messages, max_tokens=1000, temperature=0.7):
+            return await FakeLLM().generate(messages)
+
+    chunks = [c async for c in GenerateOnlyLLM().stream([])]
+
+    assert len(chunks) == 1
+    assert chunks[0].text == "30 minutes"
+    assert chunks[0].usage.total_tokens == 105
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_served_from_semantic_cache():
+    llm = FakeLLM()
+    use_case = RAGQueryUseCase(
+        llm_provider=llm,
+        vector_store=FakeVectorStore(),
+        embedding_service=FakeEmbeddingService(),
+        evaluator=ResponseEvaluator(),
+        answer_cache=SemanticCache(threshold=0.95)
+    )
+
+    first = await use_case.execute(Query(text="When do tokens expire?"))
+    llm.messages = None
+    second = await use_case.execute(Query(text="When do tokens expire?"))
+
+    assert first.metrics["cache_hit"] is False
+    assert second.metrics["cache_hit"] is True
+    assert second.text == first.text
+    assert second.metrics["cost_saved_usd"] == first.metrics["cost_usd"]
+    assert llm.messages is None
+
+
+class FakeLexicalIndex:
+    def __init__(self):
+        self.calls = []
+
+    async def search(self, text, top_k=5):
+        self.calls.append((text, top_k))
+        return [
+            DocumentChunk(id="c3", content="ERR-401 means the token is invalid"),
+            DocumentChunk(id="c2", content="Refresh tokens last 7 days")
+        ]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_retrieval_fuses_lexical_and_vector_results():
+    vector_store, lexical_index = FakeVectorStore(), FakeLexicalIndex()
+    use_case = RAGQueryUseCase(
+        llm_provider=FakeLLM(),
+        vector_store=vector_store,
+        embedding_service=FakeEmbeddingService(),
+        evaluator=ResponseEvaluator(),
+        lexical_index=lexical_index,
+        hybrid_candidates=10
+    )
+
+    response = await use_case.execute(Query(text="ERR-401", top_k=2))
+
+    # c2 is ranked by both retrievers
+    assert [s.id for s in response.sources] == ["c2", "c1"]
+    assert vector_store.calls[0][1] == 10
+    assert lexical_index.calls == [("ERR-401", 10)]
+
+    await use_case.execute(Query(text="ERR-401", top_k=2, filters={"must": []}))
+    assert len(lexical_index.calls) == 1
+
+
+class ReverseReranker:
+    def __init__(self):
+        self.calls = []
+
+    async def rerank(self, query, chunks, top_k):
+        self.calls.append((query, len(chunks), top_k))
+        return list(reversed(chunks))[:top_k]
+
+
+@pytest.mark.asyncio
+async def test_reranker_picks_prompt_chunks_from_overfetched_candidates():
+    vector_store, reranker = FakeVectorStore(), ReverseReranker()
+    use_case = RAGQueryUseCase(
+        llm_provider=FakeLLM(),
+        vector_store=vector_store,
+        embedding_service=FakeEmbeddingService(),
+        evaluator=ResponseEvaluator(),
+        reranker=reranker,
+        rerank_candidates=50
+    )
+
+    response = await use_case.execute(Query(text="When do tokens expire?", top_k=1))
+
+    assert vector_store.calls[0][1] == 50
+    assert reranker.calls == [("When do tokens expire?", 2, 1)]
+    assert [s.id for s in response.sources] == ["c2"]
+    assert "Refresh tokens last 7 days" in use_case.llm_provider.messages[1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_context_builder_limits_prompt_to_budget():
+    words = lambda text: len(text.split())
+    use_case = RAGQueryUseCase(
+        llm_provider=FakeLLM(),
+        vector_store=FakeVectorStore(),
+        embedding_service=FakeEmbeddingService(),
+        evaluator=ResponseEvaluator(),
+        context_builder=ContextBuilder(words, max_tokens=10_000)
+    )
+    reserved = sum(words(m["content"]) for m in use_case.build_messages("When?", []))
+    use_case.context_builder.max_tokens = reserved + 6
+
+    response = await use_case.execute(Query(text="When?", top_k=2))
+
+    assert [s.id for s in response.sources] == ["c1"]
+    assert "Refresh tokens" not in use_case.llm_provider.messages[1]["content"]
+    assert response.metrics["context"]["dropped"] == 1
+    assert response.metrics["context"]["tokens_saved"] == 5
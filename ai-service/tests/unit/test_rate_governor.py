@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+import pytest
+
+from app.domain.entities.query import LLMResponse, TokenUsage
+from app.domain.interfaces.llm_provider import LLMProvider, ProviderRateLimitError
+from app.infrastructure.llm.rate_governor import RateGovernor, RateLimitExceeded
+
+# 40 characters: a 10-token prompt estimate
+MESSAGES = [{"role": "user", "content": "x" * 40}]
+
+
+class FakeLLM(LLMProvider):
+    def __init__(self, model="big", total_tokens=30, delay=0.0, rate_limited=0, retry_after=None):
+        self.model = model
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
+        self.call_times = []
+        self.total_tokens = total_tokens
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, messages, max_tokens=1000, temperature=0.7):
+        self.calls.append(messages[0]["content"])
+        self.call_times.append(time.monotonic())
+        if len(self.calls) <= self.rate_limited:
+            raise ProviderRateLimitError("429 Too Many Requests", self.retry_after)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return LLMResponse(
+            text="ok",
+            usage=TokenUsage(input_tokens=10, output_tokens=self.total_tokens - 10, total_tokens=self.total_tokens),
+            model=self.model,
+            duration_ms=self.delay * 1000
+        )
+
+
+@pytest.mark.asyncio
+async def test_calls_are_paced_at_the_request_limit_in_arrival_order():
+    llm = FakeLLM()
+    # 20 requests per second once the initial burst is spent
+    governor = RateGovernor(llm, rpm_limit=1200, tpm_limit=1_000_000)
+    governor.requests.level = 0
+
+    start = time.monotonic()
+    await asyncio.gather(*(
+        governor.generate([{"role": "user", "content": str(i)}], max_tokens=10) for i in range(5)
+    ))
+
+    assert time.monotonic() - start >= 0.2
+    assert llm.calls == [str(i) for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_reported_usage_replaces_the_reservation():
+    governor = RateGovernor(FakeLLM(total_tokens=30), rpm_limit=60, tpm_limit=6000)
+
+    await governor.generate(MESSAGES, max_tokens=100)
+
+    # 110 tokens reserved, 30 used
+    assert governor.tokens.level == pytest.approx(5970, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited():
+    llm = FakeLLM(delay=0.02)
+    governor = RateGovernor(llm, rpm_limit=1000, tpm_limit=1_000_000, max_concurrent=2)
+
+    await asyncio.gather(*(governor.generate(MESSAGES) for _ in range(6)))
+
+    assert llm.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_calls_over_the_queue_deadline_are_shed():
+    llm = FakeLLM()
+    governor = RateGovernor(llm, rpm_limit=60, tpm_limit=600, max_queue_wait_seconds=1.0)
+    governor.tokens.level = 0
+
+    start = time.monotonic()
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await governor.generate(MESSAGES, max_tokens=100)
+
+    # 110 tokens at 10 per second
+    assert excinfo.value.retry_after == pytest.approx(11, abs=0.1)
+    assert time.monotonic() - start < 0.1
+    assert llm.calls == []
+    assert governor.stats()["shed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_calls_over_the_queue_deadline_degrade_to_fallback():
+    fallback = RateGovernor(FakeLLM(model="small"), rpm_limit=60, tpm_limit=6000)
+    governor = RateGovernor(
+        FakeLLM(), rpm_limit=60, tpm_limit=6000, max_queue_wait_seconds=0.5, fallback=fallback
+    )
+    governor.requests.level = 0
+
+    response = await governor.generate(MESSAGES)
+
+    assert response.model == "small"
+    assert governor.stats()["degraded"] == 1
+    assert governor.stats()["fallback"]["admitted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_429_pauses_admission_before_requeueing():
+    llm = FakeLLM(rate_limited=1, retry_after=0.2)
+    governor = RateGovernor(llm, rpm_limit=6000, tpm_limit=1_000_000)
+
+    response = await governor.generate(MESSAGES)
+
+    assert response.text == "ok"
+    assert llm.call_times[1] - llm.call_times[0] >= 0.2
+    # Both attempts went through admission and were charged
+    assert governor.stats()["admitted"] == 2
+    assert governor.stats()["rate_limited"] == governor.stats()["retried"] == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_429_beyond_the_deadline_is_shed_not_resent():
+    llm = FakeLLM(rate_limited=3, retry_after=30)
+    governor = RateGovernor(llm, rpm_limit=6000, tpm_limit=1_000_000, max_queue_wait_seconds=1.0)
+
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await governor.generate(MESSAGES)
+
+    assert len(llm.calls) == 1
+    assert excinfo.value.retry_after >= 29
+    assert governor.stats()["shed"] == 1
@@ -0,0 +1,67 @@
+import threading
+import time
+import numpy as np
+import pytest
+
+from app.domain.entities.document import DocumentChunk
+from app.infrastructure.embeddings import reranker
+from app.infrastructure.embeddings.reranker import CrossEncoderReranker
+
+
+class FakeCrossEncoder:
+    delay = 0.0
+
+    def __init__(self, model_name):
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=False):
+        self.calls.append((len(pairs), threading.current_thread().name))
+        time.sleep(self.delay)
+        # Relevance is how many query words appear in the chunk
+        return np.array([
+            float(sum(word in text for word in query.split())) for query, text in pairs
+        ])
+
+
+def chunks(*texts):
+    return [DocumentChunk(id=str(i), content=text) for i, text in enumerate(texts)]
+
+
+@pytest.fixture
+def make_reranker(monkeypatch):
+    monkeypatch.setattr(reranker, "CrossEncoder", FakeCrossEncoder)
+    instances = []
+
+    def make(delay=0.0, budget_ms=500):
+        FakeCrossEncoder.delay = delay
+        instance = CrossEncoderReranker("fake", batch_size=16, budget_ms=budget_ms)
+        instances.append(instance)
+        return instance
+
+    yield make
+    for instance in instances:
+        instance.stop()
+
+
+@pytest.mark.asyncio
+async def test_rerank_orders_by_cross_encoder_score_off_loop(make_reranker):
+    model = make_reranker()
+    candidates = chunks("rate limits", "token expiry", "refresh token expiry window")
+
+    ranked = await model.rerank("token expiry window", candidates, top_k=2)
+
+    assert [c.id for c in ranked] == ["2", "1"]
+    assert ranked[0].metadata["rerank_score"] == 3.0
+    assert model.model.calls[0] == (3, "reranker_0")
+
+
+@pytest.mark.asyncio
+async def test_rerank_falls_back_to_retrieval_order_over_budget(make_reranker):
+    model = make_reranker(delay=0.2, budget_ms=20)
+    candidates = chunks("rate limits", "token expiry", "refresh token expiry window")
+
+    ranked = await model.rerank("token expiry window", candidates, top_k=2)
+
+    assert [c.id for c in ranked] == ["0", "1"]
+    assert model.stats["fallbacks"] == 1
+    assert "rerank_score" not in ranked[0].metadata
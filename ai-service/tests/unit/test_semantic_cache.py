@@ -0,0 +1,43 @@
+import time
+
+from app.infrastructure.cache.semantic_cache import SemanticCache
+
+
+def test_similar_query_with_same_sources_hits():
+    cache = SemanticCache(threshold=0.9)
+    cache.store([1.0, 0.0], None, ["c1", "c2"], text="answer", model="m", cost_usd=0.002)
+
+    match = cache.lookup([0.99, 0.05], None, ["c2", "c1"])
+
+    assert match is not None
+    entry, similarity = match
+    assert entry.text == "answer"
+    assert similarity > 0.9
+    assert cache.stats()["cost_saved_usd"] == 0.002
+
+
+def test_dissimilar_query_changed_sources_or_filters_miss():
+    cache = SemanticCache(threshold=0.9)
+    cache.store([1.0, 0.0], {"doc_id": "a"}, ["c1"], text="answer", model="m", cost_usd=0.001)
+
+    assert cache.lookup([0.0, 1.0], {"doc_id": "a"}, ["c1"]) is None
+    assert cache.lookup([1.0, 0.0], {"doc_id": "a"}, ["c1", "c3"]) is None
+    assert cache.lookup([1.0, 0.0], {"doc_id": "b"}, ["c1"]) is None
+    assert cache.stats()["misses"] == 3
+
+
+def test_entries_expire_and_are_evicted_lru():
+    cache = SemanticCache(threshold=0.9, ttl_seconds=60, max_size=2)
+    cache.store([1.0, 0.0], None, ["a"], text="a", model="m", cost_usd=0.0)
+    cache.store([0.0, 1.0], None, ["b"], text="b", model="m", cost_usd=0.0)
+    assert cache.lookup([1.0, 0.0], None, ["a"]) is not None
+
+    cache.store([1.0, 1.0], None, ["c"], text="c", model="m", cost_usd=0.0)
+
+    assert cache.lookup([0.0, 1.0], None, ["b"]) is None
+    assert cache.lookup([1.0, 0.0], None, ["a"]) is not None
+
+    for entry in cache._entries.values():
+        entry.expires_at = time.time() - 1
+    assert cache.lookup([1.0, 0.0], None, ["a"]) is None
+    assert cache.stats()["size"] == 0
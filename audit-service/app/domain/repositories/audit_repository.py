@@ -13,6 +13,11 @@ class IAuditRepository(ABC):
         """Create new audit log entry."""
         pass
     
+    @abstractmethod
+    async def create_many(self, audit_logs: List[AuditLog]) -> List[AuditLog]:
+        """Create several audit log entries in one write."""
+        pass
+    
     @abstractmethod
     async def find_by_user(
         self,
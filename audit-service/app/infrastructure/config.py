@@ -19,6 +19,14 @@ class Settings(BaseSettings):
     RABBITMQ_USER: str = "admin"
     RABBITMQ_PASSWORD: str = "admin123"
     RABBITMQ_QUEUE: str = "audit.queue"
+    # Unacked messages in flight; must exceed AUDIT_BATCH_SIZE for batches to fill
+    RABBITMQ_PREFETCH_COUNT: int = 1000
+    # Concurrent event handlers; further messages wait unacked
+    AUDIT_CONSUMER_CONCURRENCY: int = 1000
+    
+    # Buffered audit writes
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_MS: int = 100
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -0,0 +1,159 @@
+import asyncio
+from datetime import datetime
+from typing import List, Optional, Tuple
+from pymongo.errors import BulkWriteError
+
+from app.domain.entities.audit_log import AuditLog
+from app.domain.repositories.audit_repository import IAuditRepository
+
+
+class BufferedAuditWriter(IAuditRepository):
+    """
+    Audit repository decorator that batches writes.
+
+    Each create() is queued and resolved once its batch has been written
+    with a single create_many(), so callers still only proceed (e.g. ack
+    the message) after the entry is persisted. A batch is flushed when it
+    reaches batch_size or flush_interval_ms after its first entry arrived.
+    Reads are passed straight through to the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        repository: IAuditRepository,
+        batch_size: int = 500,
+        flush_interval_ms: int = 100
+    ):
+        self.repository = repository
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._pending: List[Tuple[AuditLog, asyncio.Future]] = []
+        self._not_empty = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    def start(self) -> None:
+        """Start the background flusher."""
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher once everything still buffered is written."""
+        if self._task:
+            self._closing = True
+            self._not_empty.set()
+            self._batch_full.set()
+            await self._task
+            self._task = None
+
+    @property
+    def pending(self) -> int:
+        """Number of entries waiting to be written."""
+        return len(self._pending)
+
+    async def create(self, audit_log: AuditLog) -> AuditLog:
+        """
+        Queue an audit log and wait until its batch is written.
+
+        Raises:
+            Exception: The write error for this entry, if it failed
+        """
+        if self._task is None:
+            return await self.repository.create(audit_log)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((audit_log, future))
+        self._not_empty.set()
+        if len(self._pending) >= self.batch_size:
+            self._batch_full.set()
+
+        return await future
+
+    async def create_many(self, audit_logs: List[AuditLog]) -> List[AuditLog]:
+        """Write a batch directly, bypassing the buffer."""
+        return await self.repository.create_many(audit_logs)
+
+    async def flush(self) -> int:
+        """
+        Write one batch of buffered entries and resolve their callers.
+
+        On a partial failure only the entries reported in the
+        BulkWriteError are failed; any other error fails the whole batch.
+
+        Returns:
+            Number of entries taken from the buffer
+        """
+        batch = self._pending[:self.batch_size]
+        del self._pending[:self.batch_size]
+        if len(self._pending) < self.batch_size:
+            self._batch_full.clear()
+        if not self._pending:
+            self._not_empty.clear()
+        if not batch:
+            return 0
+
+        audit_logs = [audit_log for audit_log, _ in batch]
+        failed = {}
+        try:
+            await self.repository.create_many(audit_logs)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                failed[write_error["index"]] = BulkWriteError({
+                    "writeErrors": [write_error],
+                    "nInserted": 0
+                })
+            print(f"❌ Audit batch partially failed: {len(failed)}/{len(batch)} entries")
+        except Exception as e:
+            print(f"❌ Audit batch write failed: {e}")
+            failed = {index: e for index in range(len(batch))}
+
+        for index, (audit_log, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in failed:
+                future.set_exception(failed[index])
+            else:
+                future.set_result(audit_log)
+
+        return len(batch)
+
+    async def _run(self) -> None:
+        """Flush full batches immediately, partial ones after the interval."""
+        while True:
+            await self._not_empty.wait()
+            if not self._batch_full.is_set() and not self._closing:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            await self.flush()
+            if self._closing and not self._pending:
+                return
+
+    async def find_by_user(
+        self,
+        user_id: str,
+        limit: int = 100
+    ) -> List[AuditLog]:
+        """Find audit logs by user ID."""
+        return await self.repository.find_by_user(user_id, limit)
+
+    async def find_by_resource(
+        self,
+        resource_type: str,
+        resource_id: str
+    ) -> List[AuditLog]:
+        """Find audit logs by resource."""
+        return await self.repository.find_by_resource(resource_type, resource_id)
+
+    async def find_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int = 1000
+    ) -> List[AuditLog]:
+        """Find audit logs within date range."""
+        return await self.repository.find_by_date_range(start_date, end_date, limit)
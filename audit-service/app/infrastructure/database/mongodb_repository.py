@@ -16,21 +16,33 @@ class MongoDBRepository(IAuditRepository):
     
     async def create(self, audit_log: AuditLog) -> AuditLog:
         """Create new audit log entry in MongoDB."""
-        document = {
-            "event_type": audit_log.event_type,
-            "user_id": audit_log.user_id,
-            "resource_type": audit_log.resource_type,
-            "resource_id": audit_log.resource_id,
-            "action": audit_log.action,
-            "metadata": audit_log.metadata,
-            "timestamp": audit_log.timestamp
-        }
+        document = self._entity_to_document(audit_log)
         
         result = await self.collection.insert_one(document)
         audit_log.id = str(result.inserted_id)
         
         return audit_log
     
+    async def create_many(self, audit_logs: List[AuditLog]) -> List[AuditLog]:
+        """
+        Create audit log entries with a single unordered insert_many.
+        
+        Ids are assigned before the write, so on a partial failure
+        (pymongo BulkWriteError) the successful entries keep their ids.
+        """
+        if not audit_logs:
+            return audit_logs
+        
+        documents = []
+        for audit_log in audit_logs:
+            document = self._entity_to_document(audit_log)
+            document["_id"] = ObjectId()
+            audit_log.id = str(document["_id"])
+            documents.append(document)
+        
+        await self.collection.insert_many(documents, ordered=False)
+        return audit_logs
+    
     async def find_by_user(
         self,
         user_id: str,
@@ -84,6 +96,18 @@ class MongoDBRepository(IAuditRepository):
         
         return logs
     
+    def _entity_to_document(self, audit_log: AuditLog) -> dict:
+        """Convert domain entity to MongoDB document."""
+        return {
+            "event_type": audit_log.event_type,
+            "user_id": audit_log.user_id,
+            "resource_type": audit_log.resource_type,
+            "resource_id": audit_log.resource_id,
+            "action": audit_log.action,
+            "metadata": audit_log.metadata,
+            "timestamp": audit_log.timestamp
+        }
+    
     def _document_to_entity(self, doc: dict) -> AuditLog:
         """Convert MongoDB document to domain entity."""
         return AuditLog(
@@ -1,115 +1,137 @@
 import json
 import asyncio
-from typing import Callable
-import pika
-from pika.adapters.blocking_connection import BlockingConnection
-from pika.channel import Channel
+from typing import Awaitable, Callable, Dict, Any, Optional, Set
+import aio_pika
+from aio_pika.abc import AbstractIncomingMessage
 
 from app.infrastructure.config import settings
 
 
 class RabbitMQConsumer:
-    """RabbitMQ consumer for audit events."""
-    
-    def __init__(self, queue_name: str, callback: Callable):
+    """
+    Asyncio RabbitMQ consumer for audit events.
+
+    At most prefetch_count messages are unacked at a time and at most
+    max_concurrency handlers run at once. A message is acked only after its
+    handler has completed, so a slow database stops the consumer pulling
+    new messages instead of losing them.
+    """
+
+    EXCHANGE_NAME = "user.events"
+    ROUTING_KEYS = ["user.*", "auth.*", "audit.*"]
+
+    def __init__(
+        self,
+        queue_name: str,
+        callback: Callable[[Dict[str, Any]], Awaitable[None]],
+        prefetch_count: int = 1000,
+        max_concurrency: int = 1000
+    ):
         self.queue_name = queue_name
         self.callback = callback
-        self.connection: BlockingConnection | None = None
-        self.channel: Channel | None = None
-        self._closing = False
-        self._loop = None
-    
-    def connect(self) -> None:
+        self.prefetch_count = prefetch_count
+        self.max_concurrency = max_concurrency
+        self.connection: Optional[aio_pika.abc.AbstractRobustConnection] = None
+        self.channel: Optional[aio_pika.abc.AbstractChannel] = None
+        self.queue: Optional[aio_pika.abc.AbstractQueue] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._handlers: Set[asyncio.Task] = set()
+        self._consumer_task: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
         """Establish RabbitMQ connection."""
-        parameters = pika.ConnectionParameters(
+        self.connection = await aio_pika.connect_robust(
             host=settings.RABBITMQ_HOST,
             port=settings.RABBITMQ_PORT,
-            credentials=pika.PlainCredentials(
-                settings.RABBITMQ_USER,
-                settings.RABBITMQ_PASSWORD
-            ),
-            heartbeat=600,
-            blocked_connection_timeout=300
+            login=settings.RABBITMQ_USER,
+            password=settings.RABBITMQ_PASSWORD,
+            heartbeat=600
         )
-        
-        self.connection = pika.BlockingConnection(parameters)
-        self.channel = self.connection.channel()
-        
+        self.channel = await self.connection.channel()
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
+
         # Declare exchange
-        self.channel.exchange_declare(
-            exchange="user.events",
-            exchange_type="topic",
+        exchange = await self.channel.declare_exchange(
+            self.EXCHANGE_NAME,
+            aio_pika.ExchangeType.TOPIC,
             durable=True
         )
-        
+
         # Declare queue
-        self.channel.queue_declare(
-            queue=self.queue_name,
-            durable=True
-        )
-        
+        self.queue = await self.channel.declare_queue(self.queue_name, durable=True)
+
         # Bind queue to exchange with routing patterns
-        routing_keys = ["user.*", "auth.*", "audit.*"]
-        for routing_key in routing_keys:
-            self.channel.queue_bind(
-                queue=self.queue_name,
-                exchange="user.events",
-                routing_key=routing_key
-            )
-        
+        for routing_key in self.ROUTING_KEYS:
+            await self.queue.bind(exchange, routing_key=routing_key)
+
         print(f"✅ Connected to RabbitMQ, listening on queue: {self.queue_name}")
-    
-    def _on_message(self, channel: Channel, method, properties, body: bytes) -> None:
-        """Process received message."""
-        try:
-            message = json.loads(body.decode())
-            
-            # Run async callback in event loop
-            if self._loop and self._loop.is_running():
-                asyncio.run_coroutine_threadsafe(
-                    self.callback(message),
-                    self._loop
-                )
-            else:
-                # Fallback: create new event loop
-                asyncio.run(self.callback(message))
-            
-            # Acknowledge message
-            channel.basic_ack(delivery_tag=method.delivery_tag)
-            
-        except Exception as e:
-            print(f"❌ Error processing message: {e}")
-            # Reject and requeue message
-            channel.basic_nack(
-                delivery_tag=method.delivery_tag,
-                requeue=True
-            )
-    
-    def start(self, loop=None) -> None:
-        """Start consuming messages."""
-        self._loop = loop
-        self.connect()
-        
-        # Start consuming
-        self.channel.basic_consume(
-            queue=self.queue_name,
-            on_message_callback=self._on_message,
-            auto_ack=False
+
+    async def start(self) -> None:
+        """Connect and start consuming messages in the background."""
+        await self.connect()
+        self._consumer_task = asyncio.create_task(self._consume())
+        print(
+            f"🔄 Started consuming from queue: {self.queue_name} "
+            f"(prefetch={self.prefetch_count}, concurrency={self.max_concurrency})"
         )
-        
-        print(f"🔄 Started consuming from queue: {self.queue_name}")
-        
-        try:
-            self.channel.start_consuming()
-        except KeyboardInterrupt:
-            self.stop()
-    
-    def stop(self) -> None:
-        """Stop consuming messages."""
-        self._closing = True
-        if self.channel:
-            self.channel.stop_consuming()
-            self.channel.close()
+
+    async def stop(self) -> None:
+        """Stop consuming, wait for running handlers, then close the connection."""
+        if self._consumer_task:
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+            self._consumer_task = None
+
+        # Messages still unacked are redelivered once the channel closes
+        if self._handlers:
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+
         if self.connection:
-            self.connection.close()
-        print("🛑 RabbitMQ consumer stopped")
\ No newline at end of file
+            await self.connection.close()
+        print("🛑 RabbitMQ consumer stopped")
+
+    @property
+    def in_flight(self) -> int:
+        """Number of handlers currently running."""
+        return len(self._handlers)
+
+    async def _consume(self) -> None:
+        """Pull messages from the queue and dispatch them to handlers."""
+        async with self.queue.iterator() as messages:
+            async for message in messages:
+                await self._dispatch(message)
+
+    async def _dispatch(self, message: AbstractIncomingMessage) -> None:
+        """Start a handler for the message, waiting for a free slot first."""
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._handle(message))
+        self._handlers.add(task)
+        task.add_done_callback(self._handlers.discard)
+
+    async def _handle(self, message: AbstractIncomingMessage) -> None:
+        """Process received message and ack it once the callback has completed."""
+        try:
+            try:
+                event = json.loads(message.body.decode())
+            except ValueError as e:
+                print(f"❌ Discarding malformed message: {e}")
+                await message.reject(requeue=False)
+                return
+
+            try:
+                await self.callback(event)
+            except Exception as e:
+                print(f"❌ Error processing message: {e}")
+                # Reject and requeue message
+                await message.nack(requeue=True)
+                return
+
+            await message.ack()
+        except Exception as e:
+            # Channel closed under us; the broker will redeliver
+            print(f"❌ Failed to settle message: {e}")
+        finally:
+            self._semaphore.release()
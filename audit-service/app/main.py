@@ -1,4 +1,3 @@
-import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -6,20 +5,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.presentation.routes import audit_routes
 from app.infrastructure.database.mongodb_connection import mongodb_connection
 from app.infrastructure.database.mongodb_repository import MongoDBRepository
+from app.infrastructure.database.buffered_audit_writer import BufferedAuditWriter
 from app.infrastructure.messaging.rabbitmq_consumer import RabbitMQConsumer
 from app.infrastructure.messaging.event_handler import EventHandler
 from app.application.use_cases.create_audit_log_use_case import CreateAuditLogUseCase
 from app.infrastructure.config import settings
 
 
-consumer_task = None
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
-    global consumer_task
-    
     # Startup
     print("Starting Audit Service...")
     
@@ -28,35 +23,31 @@ async def lifespan(app: FastAPI):
     print("MongoDB connected")
     
     # Initialize use case and event handler
-    repository = MongoDBRepository(mongodb_connection.get_database())
+    repository = BufferedAuditWriter(
+        MongoDBRepository(mongodb_connection.get_database()),
+        batch_size=settings.AUDIT_BATCH_SIZE,
+        flush_interval_ms=settings.AUDIT_FLUSH_INTERVAL_MS
+    )
+    repository.start()
     use_case = CreateAuditLogUseCase(repository)
     event_handler = EventHandler(use_case)
     
-    # Get current event loop
-    loop = asyncio.get_event_loop()
-    
     # Start RabbitMQ consumer in background
     consumer = RabbitMQConsumer(
         queue_name=settings.RABBITMQ_QUEUE,
-        callback=event_handler.handle_event
-    )
-    
-    consumer_task = asyncio.create_task(
-        asyncio.to_thread(consumer.start, loop)
+        callback=event_handler.handle_event,
+        prefetch_count=settings.RABBITMQ_PREFETCH_COUNT,
+        max_concurrency=settings.AUDIT_CONSUMER_CONCURRENCY
     )
+    await consumer.start()
     print(f"RabbitMQ consumer started on queue: {settings.RABBITMQ_QUEUE}")
     
     yield
     
     # Shutdown
     print("Shutting down Audit Service...")
-    consumer.stop()
-    if consumer_task:
-        consumer_task.cancel()
-        try:
-            await consumer_task
-        except asyncio.CancelledError:
-            pass
+    await consumer.stop()
+    await repository.stop()
     await mongodb_connection.disconnect()
     print("MongoDB disconnected")
 
@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+from datetime import datetime
+from typing import List
+from pymongo.errors import BulkWriteError
+
+from app.domain.entities.audit_log import AuditLog
+from app.domain.repositories.audit_repository import IAuditRepository
+from app.infrastructure.database.buffered_audit_writer import BufferedAuditWriter
+
+
+class FakeRepository(IAuditRepository):
+    """In-memory repository recording each batch write."""
+
+    def __init__(self, fail_indexes=()):
+        self.batches: List[List[AuditLog]] = []
+        self.fail_indexes = set(fail_indexes)
+
+    async def create(self, audit_log):
+        return (await self.create_many([audit_log]))[0]
+
+    async def create_many(self, audit_logs):
+        self.batches.append(list(audit_logs))
+        for index, audit_log in enumerate(audit_logs):
+            audit_log.id = f"id-{index}"
+        if self.fail_indexes:
+            raise BulkWriteError({
+                "writeErrors": [
+                    {"index": index, "code": 11000, "errmsg": "duplicate key"}
+                    for index in sorted(self.fail_indexes)
+                ],
+                "nInserted": len(audit_logs) - len(self.fail_indexes)
+            })
+        return audit_logs
+
+    async def find_by_user(self, user_id, limit=100):
+        return []
+
+    async def find_by_resource(self, resource_type, resource_id):
+        return []
+
+    async def find_by_date_range(self, start_date, end_date, limit=1000):
+        return []
+
+
+def make_log(i: int) -> AuditLog:
+    return AuditLog(
+        event_type="user.created",
+        user_id=f"user{i}",
+        resource_type="user",
+        resource_id=f"user{i}",
+        action="created",
+        metadata={},
+        timestamp=datetime.utcnow()
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_written_in_one_call():
+    """Test that concurrent creates are coalesced into one write."""
+    repository = FakeRepository()
+    writer = BufferedAuditWriter(repository, batch_size=10, flush_interval_ms=10_000)
+    writer.start()
+
+    created = await asyncio.wait_for(
+        asyncio.gather(*(writer.create(make_log(i)) for i in range(10))),
+        timeout=1
+    )
+    await writer.stop()
+
+    assert len(repository.batches) == 1
+    assert [log.user_id for log in created] == [f"user{i}" for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_interval():
+    """Test that a small batch is written once the interval elapses."""
+    repository = FakeRepository()
+    writer = BufferedAuditWriter(repository, batch_size=100, flush_interval_ms=20)
+    writer.start()
+
+    created = await asyncio.wait_for(writer.create(make_log(1)), timeout=1)
+    await writer.stop()
+
+    assert created.id is not None
+    assert len(repository.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_error_fails_only_affected_entries():
+    """Test that per-document errors reach only their own callers."""
+    repository = FakeRepository(fail_indexes=[1])
+    writer = BufferedAuditWriter(repository, batch_size=3, flush_interval_ms=10_000)
+    writer.start()
+
+    results = await asyncio.gather(
+        *(writer.create(make_log(i)) for i in range(3)),
+        return_exceptions=True
+    )
+    await writer.stop()
+
+    assert isinstance(results[1], BulkWriteError)
+    assert isinstance(results[0], AuditLog)
+    assert isinstance(results[2], AuditLog)
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_entries():
+    """Test that shutdown writes entries still in the buffer."""
+    repository = FakeRepository()
+    writer = BufferedAuditWriter(repository, batch_size=100, flush_interval_ms=10_000)
+    writer.start()
+
+    tasks = [asyncio.create_task(writer.create(make_log(i))) for i in range(5)]
+    await asyncio.sleep(0)
+    await writer.stop()
+
+    assert all(task.done() and not task.exception() for task in tasks)
+    assert sum(len(batch) for batch in repository.batches) == 5
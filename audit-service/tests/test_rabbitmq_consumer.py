@@ -0,0 +1,99 @@
+import asyncio
+import json
+import pytest
+
+from app.infrastructure.messaging.rabbitmq_consumer import RabbitMQConsumer
+
+
+class FakeMessage:
+    """Incoming message recording how it was settled."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.settled = None
+
+    async def ack(self):
+        self.settled = "ack"
+
+    async def nack(self, requeue=True):
+        self.settled = "nack"
+
+    async def reject(self, requeue=False):
+        self.settled = "reject"
+
+
+def make_message(event: dict) -> FakeMessage:
+    return FakeMessage(json.dumps(event).encode())
+
+
+@pytest.mark.asyncio
+async def test_message_acked_only_after_handler_completes():
+    """Test that the ack waits for the callback."""
+    release = asyncio.Event()
+
+    async def callback(event):
+        await release.wait()
+
+    consumer = RabbitMQConsumer("audit.queue", callback)
+    message = make_message({"event_type": "user.created"})
+
+    await consumer._dispatch(message)
+    await asyncio.sleep(0)
+    assert message.settled is None
+
+    release.set()
+    await asyncio.gather(*consumer._handlers)
+    assert message.settled == "ack"
+
+
+@pytest.mark.asyncio
+async def test_failed_handler_requeues_and_malformed_is_rejected():
+    """Test nack on handler errors and reject on undecodable bodies."""
+    async def callback(event):
+        raise RuntimeError("mongo down")
+
+    consumer = RabbitMQConsumer("audit.queue", callback)
+    failing = make_message({"event_type": "user.created"})
+    malformed = FakeMessage(b"not json")
+
+    await consumer._dispatch(failing)
+    await consumer._dispatch(malformed)
+    await asyncio.gather(*consumer._handlers)
+
+    assert failing.settled == "nack"
+    assert malformed.settled == "reject"
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """Test that dispatch waits once max_concurrency handlers are running."""
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def callback(event):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+
+    consumer = RabbitMQConsumer("audit.queue", callback, max_concurrency=2)
+    messages = [make_message({"event_type": f"user.{i}"}) for i in range(5)]
+
+    dispatcher = asyncio.create_task(_dispatch_all(consumer, messages))
+    await asyncio.sleep(0.01)
+    assert consumer.in_flight == 2
+    assert not dispatcher.done()
+
+    release.set()
+    await asyncio.wait_for(dispatcher, timeout=1)
+    await asyncio.gather(*consumer._handlers)
+
+    assert peak == 2
+    assert all(message.settled == "ack" for message in messages)
+
+
+async def _dispatch_all(consumer, messages):
+    for message in messages:
+        await consumer._dispatch(message)
@@ -1,7 +1,6 @@
 from datetime import datetime, timedelta
 from typing import Optional
 import jwt
-from passlib.context import CryptContext
 
 from app.domain.entities.user import User
 from app.domain.entities.token import Token, TokenPayload
@@ -9,6 +8,7 @@ from app.domain.repositories.user_repository import IUserRepository
 from app.application.dtos.auth_dto import LoginRequest, LoginResponse
 from app.infrastructure.cache.redis_client import RedisClient
 from app.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+from app.infrastructure.security.password_hasher import PasswordHasher
 
 
 class LoginUseCase:
@@ -22,7 +22,8 @@ class LoginUseCase:
         jwt_secret: str,
         jwt_algorithm: str,
         access_token_expire_minutes: int,
-        refresh_token_expire_days: int
+        refresh_token_expire_days: int,
+        password_hasher: Optional[PasswordHasher] = None
     ):
         self.user_repository = user_repository
         self.redis_client = redis_client
@@ -31,7 +32,7 @@ class LoginUseCase:
         self.jwt_algorithm = jwt_algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.password_hasher = password_hasher or PasswordHasher()
     
     async def execute(self, request: LoginRequest) -> LoginResponse:
         """
@@ -45,6 +46,7 @@ class LoginUseCase:
             
         Raises:
             ValueError: If credentials are invalid
+            PasswordHasherBusyError: If the hashing queue is full
         """
         # Find user by email
         user = await self.user_repository.find_by_email(request.email)
@@ -52,7 +54,7 @@ class LoginUseCase:
             raise ValueError("Invalid email or password")
         
         # Verify password
-        if not self.pwd_context.verify(request.password, user.hashed_password):
+        if not await self.password_hasher.verify(request.password, user.hashed_password):
             raise ValueError("Invalid email or password")
         
         # Check if user is active
@@ -66,8 +68,8 @@ class LoginUseCase:
         # Store refresh token in Redis
         await self._store_refresh_token(user.id, refresh_token)
         
-        # Publish login event (SYNC - no await)
-        self._publish_login_event(user)
+        # Publish login event (buffered, never waits on the broker)
+        await self._publish_login_event(user)
         
         return LoginResponse(
             access_token=access_token,
@@ -113,8 +115,8 @@ class LoginUseCase:
         ttl = self.refresh_token_expire_days * 24 * 60 * 60  # seconds
         await self.redis_client.set(key, token, ttl)
     
-    def _publish_login_event(self, user: User) -> None:
-        """Publish user login event to RabbitMQ (synchronous)."""
+    async def _publish_login_event(self, user: User) -> None:
+        """Queue user login event for RabbitMQ."""
         try:
             event = {
                 "event_type": "user.logged_in",
@@ -123,7 +125,6 @@ class LoginUseCase:
                 "timestamp": datetime.utcnow().isoformat(),
                 "ip_address": None
             }
-            # Call publish WITHOUT await (it's synchronous)
-            self.rabbitmq_publisher.publish("user.login", event)
+            await self.rabbitmq_publisher.publish("user.login", event)
         except Exception as e:
             print(f"⚠️ Failed to publish login event: {e}")
\ No newline at end of file
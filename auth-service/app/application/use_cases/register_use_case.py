@@ -1,11 +1,11 @@
 from datetime import datetime
-from passlib.context import CryptContext
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from app.domain.entities.user import User
+from app.domain.events.domain_event import DomainEvent
 from app.domain.repositories.user_repository import IUserRepository
 from app.application.dtos.auth_dto import RegisterRequest, UserResponse
-from app.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+from app.infrastructure.security.password_hasher import PasswordHasher
 
 
 class RegisterUseCase:
@@ -14,11 +14,10 @@ class RegisterUseCase:
     def __init__(
         self,
         user_repository: IUserRepository,
-        rabbitmq_publisher: RabbitMQPublisher
+        password_hasher: Optional[PasswordHasher] = None
     ):
         self.user_repository = user_repository
-        self.rabbitmq_publisher = rabbitmq_publisher
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.password_hasher = password_hasher or PasswordHasher()
     
     async def execute(self, request: RegisterRequest) -> UserResponse:
         """
@@ -32,6 +31,7 @@ class RegisterUseCase:
             
         Raises:
             ValueError: If email already exists
+            PasswordHasherBusyError: If the hashing queue is full
         """
         # Validate request
         self._validate_request(request)
@@ -42,7 +42,7 @@ class RegisterUseCase:
             raise ValueError("Email already registered")
         
         # Hash password
-        hashed_password = self.pwd_context.hash(request.password)
+        hashed_password = await self.password_hasher.hash(request.password)
         
         # Create user entity
         user = User(
@@ -52,11 +52,12 @@ class RegisterUseCase:
             role="user"
         )
         
-        # Persist user
-        created_user = await self.user_repository.create(user)
-        
-        # Publish user created event
-        await self._publish_user_created_event(created_user)
+        # Persist user and its user.created event in one transaction;
+        # the outbox relay delivers the event to RabbitMQ
+        created_user = await self.user_repository.create(
+            user,
+            events=[self._build_user_created_event(user)]
+        )
         
         return UserResponse(
             id=created_user.id,
@@ -68,10 +69,11 @@ class RegisterUseCase:
             created_at=created_user.created_at.isoformat()
         )
     
-    async def _publish_user_created_event(self, user: User) -> None:
-        # Publish event to RabbitMQ for User Service
-        try:
-            event_data = {
+    def _build_user_created_event(self, user: User) -> DomainEvent:
+        """Build the user.created event consumed by the User Service."""
+        return DomainEvent(
+            routing_key="user.created",
+            payload={
                 "event_type": "user.created",
                 "timestamp": datetime.utcnow().isoformat(),
                 "data": {
@@ -84,15 +86,7 @@ class RegisterUseCase:
                     "created_at": user.created_at.isoformat() if user.created_at else None
                 }
             }
-            
-            self.rabbitmq_publisher.publish(
-                routing_key="user.created",
-                message=event_data
-            )
-            
-        except Exception as e:
-            print(f"⚠️ Failed to publish event (user already created): {e}")
-            # Don't fail the request, user is already created
+        )
 
     def _validate_request(self, request: RegisterRequest) -> None:
         """Validate registration request."""
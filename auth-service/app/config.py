@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -7,17 +8,35 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_PRE_PING: bool = True
+    DB_USE_NULL_POOL: bool = False  # Set when an external pooler (PgBouncer) is used
     
     # Redis
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_DB: int
     
+    # User cache
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_LOCAL_TTL: int = 30  # seconds, per-worker LRU
+    USER_CACHE_REDIS_TTL: int = 300  # seconds, shared layer
+    
     # RabbitMQ
     RABBITMQ_HOST: str
     RABBITMQ_PORT: int
     RABBITMQ_USER: str
     RABBITMQ_PASSWORD: str
+    RABBITMQ_PUBLISH_BATCH_SIZE: int = 100
+    RABBITMQ_PUBLISH_FLUSH_INTERVAL_MS: int = 50
+    RABBITMQ_PUBLISH_MAX_BUFFER: int = 10000
+    RABBITMQ_PUBLISH_OVERFLOW_POLICY: str = "drop_oldest"  # drop_oldest | drop_newest | block
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_INTERVAL_MS: int = 500
     
     # JWT
     JWT_SECRET: str
@@ -25,6 +44,10 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
+    # Password hashing
+    PASSWORD_HASHER_WORKERS: Optional[int] = None  # Defaults to CPU count
+    PASSWORD_HASHER_MAX_QUEUE: int = 64
+    
     # Service
     SERVICE_PORT: int = 8001
     SERVICE_HOST: str = "0.0.0.0"
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any
+import uuid
+
+
+@dataclass
+class DomainEvent:
+    """Domain event to be published to the message broker."""
+    
+    routing_key: str
+    payload: Dict[str, Any]
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: datetime = field(default_factory=datetime.utcnow)
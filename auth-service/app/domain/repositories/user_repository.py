@@ -1,14 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from app.domain.entities.user import User
+from app.domain.events.domain_event import DomainEvent
 
 
 class IUserRepository(ABC):
     """Abstract repository interface for User entity."""
     
     @abstractmethod
-    async def create(self, user: User) -> User:
-        """Create a new user."""
+    async def create(self, user: User, events: Optional[List[DomainEvent]] = None) -> User:
+        """Create a new user, storing any events atomically with it."""
         pass
     
     @abstractmethod
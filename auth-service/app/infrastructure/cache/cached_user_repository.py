@@ -0,0 +1,60 @@
+from typing import List, Optional
+
+from app.domain.entities.user import User
+from app.domain.events.domain_event import DomainEvent
+from app.domain.repositories.user_repository import IUserRepository
+from app.infrastructure.cache.user_cache import UserCache
+
+
+class CachedUserRepository(IUserRepository):
+    """Read-through caching decorator for a user repository."""
+
+    def __init__(self, repository: IUserRepository, cache: UserCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def create(self, user: User, events: Optional[List[DomainEvent]] = None) -> User:
+        """Create user and drop any stale entries for its id/email."""
+        created_user = await self.repository.create(user, events=events)
+        await self.cache.invalidate(created_user.id, created_user.email)
+        return created_user
+
+    async def find_by_id(self, user_id: str) -> Optional[User]:
+        """Find user by ID (local LRU, then Redis, then database)."""
+        user = await self.cache.get("id", user_id)
+        if user is None:
+            user = await self.repository.find_by_id(user_id)
+            if user is not None:
+                await self.cache.set(user)
+        return user
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        """Find user by email (local LRU, then Redis, then database)."""
+        user = await self.cache.get("email", email)
+        if user is None:
+            user = await self.repository.find_by_email(email)
+            if user is not None:
+                await self.cache.set(user)
+        return user
+
+    async def update(self, user: User) -> User:
+        """Update user and invalidate both its old and new email keys."""
+        previous = await self._find_previous(user.id)
+        updated_user = await self.repository.update(user)
+        await self.cache.invalidate(
+            updated_user.id,
+            updated_user.email,
+            previous.email if previous else None
+        )
+        return updated_user
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete user and invalidate its cached entries."""
+        previous = await self._find_previous(user_id)
+        deleted = await self.repository.delete(user_id)
+        await self.cache.invalidate(user_id, previous.email if previous else None)
+        return deleted
+
+    async def _find_previous(self, user_id: str) -> Optional[User]:
+        """Read the stored user from the database to learn its current email."""
+        return await self.repository.find_by_id(user_id)
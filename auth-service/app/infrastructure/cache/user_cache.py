@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+import json
+import logging
+import time
+
+from app.domain.entities.user import User
+from app.infrastructure.cache.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for the user cache."""
+
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        hits = self.local_hits + self.redis_hits
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0
+        }
+
+
+class UserCache:
+    """
+    Two-level user cache: an in-process LRU with TTL in front of Redis.
+
+    The local TTL is kept short because other workers cannot invalidate it;
+    Redis is the shared layer and is invalidated on every write. Redis errors
+    are logged and treated as misses so the database remains the fallback.
+    """
+
+    KEY_PREFIX = "user_cache"
+
+    def __init__(
+        self,
+        redis_client: Optional[RedisClient],
+        max_size: int = 1024,
+        local_ttl: int = 30,
+        redis_ttl: int = 300
+    ):
+        self.redis_client = redis_client
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self.stats = CacheStats()
+        self._local: "OrderedDict[str, Tuple[float, User]]" = OrderedDict()
+
+    async def get(self, field: str, value: str) -> Optional[User]:
+        """Get a user by ``id`` or ``email``, or None on a miss."""
+        key = self._key(field, value)
+
+        user = self._get_local(key)
+        if user is not None:
+            self.stats.local_hits += 1
+            return user
+
+        user = await self._get_redis(key)
+        if user is not None:
+            self.stats.redis_hits += 1
+            self._set_local(user)
+            return user
+
+        self.stats.misses += 1
+        return None
+
+    async def set(self, user: User) -> None:
+        """Store a user under both its id and email keys."""
+        self._set_local(user)
+        if not self.redis_client:
+            return
+
+        payload = json.dumps(self._serialize(user))
+        try:
+            await self.redis_client.set(self._key("id", user.id), payload, self.redis_ttl)
+            await self.redis_client.set(self._key("email", user.email), payload, self.redis_ttl)
+        except Exception as e:
+            logger.warning(f"Failed to write user cache: {e}")
+
+    async def invalidate(self, user_id: str, *emails: Optional[str]) -> None:
+        """Drop a user's cached entries by id and any of the given emails."""
+        keys = [self._key("id", user_id)]
+        keys.extend(self._key("email", email) for email in emails if email)
+
+        for key in keys:
+            self._local.pop(key, None)
+        self.stats.invalidations += 1
+
+        if not self.redis_client:
+            return
+        try:
+            for key in keys:
+                await self.redis_client.delete(key)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate user cache: {e}")
+
+    def _get_local(self, key: str) -> Optional[User]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+
+        expires_at, user = entry
+        if expires_at < time.monotonic():
+            del self._local[key]
+            return None
+
+        self._local.move_to_end(key)
+        return user
+
+    def _set_local(self, user: User) -> None:
+        expires_at = time.monotonic() + self.local_ttl
+        for key in (self._key("id", user.id), self._key("email", user.email)):
+            self._local[key] = (expires_at, user)
+            self._local.move_to_end(key)
+
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    async def _get_redis(self, key: str) -> Optional[User]:
+        if not self.redis_client:
+            return None
+        try:
+            payload = await self.redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read user cache: {e}")
+            return None
+        return self._deserialize(json.loads(payload)) if payload else None
+
+    def _key(self, field: str, value: str) -> str:
+        return f"{self.KEY_PREFIX}:{field}:{value}"
+
+    @staticmethod
+    def _serialize(user: User) -> Dict[str, Any]:
+        return {
+            "id": user.id,
+            "email": user.email,
+            "hashed_password": user.hashed_password,
+            "full_name": user.full_name,
+            "is_active": user.is_active,
+            "is_verified": user.is_verified,
+            "role": user.role,
+            "created_at": user.created_at.isoformat(),
+            "updated_at": user.updated_at.isoformat()
+        }
+
+    @staticmethod
+    def _deserialize(data: Dict[str, Any]) -> User:
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        return User(**data)
@@ -1,31 +1,81 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, Any
 import logging
+import time
 
 from app.infrastructure.database.models import Base
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PoolMetrics:
+    """Connection pool checkout metrics."""
+
+    checkouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        """Record the time spent waiting for a pooled connection."""
+        self.checkouts += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        """Average checkout wait time."""
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
 class DatabaseConnection:
     """Database connection manager."""
-    
-    def __init__(self, database_url: str):
+
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 10,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        use_null_pool: bool = False
+    ):
         # Convert sync URL to async
         self.database_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.use_null_pool = use_null_pool
         self.engine = None
         self.session_factory = None
-    
+        self.metrics = PoolMetrics()
+
     async def connect(self) -> None:
         """Initialize database connection."""
         try:
+            if self.use_null_pool:
+                # External pooler (e.g. PgBouncer) manages connections
+                pool_options = {"poolclass": NullPool}
+            else:
+                pool_options = {
+                    "poolclass": AsyncAdaptedQueuePool,
+                    "pool_size": self.pool_size,
+                    "max_overflow": self.max_overflow,
+                    "pool_timeout": self.pool_timeout,
+                    "pool_recycle": self.pool_recycle,
+                    "pool_pre_ping": self.pool_pre_ping
+                }
             self.engine = create_async_engine(
                 self.database_url,
                 echo=False,
-                poolclass=NullPool,
-                future=True
+                future=True,
+                **pool_options
             )
             self.session_factory = async_sessionmaker(
                 self.engine,
@@ -36,26 +86,55 @@ class DatabaseConnection:
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
-    
+
     async def disconnect(self) -> None:
         """Close database connection."""
         if self.engine:
             await self.engine.dispose()
             logger.info("Database connection closed")
-    
+
     async def create_tables(self) -> None:
         """Create all database tables."""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
             logger.info("Database tables created")
-    
+
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get database session."""
         async with self.session_factory() as session:
             try:
+                # Check out the connection up front to measure pool wait time
+                started = time.perf_counter()
+                await session.connection()
+                self.metrics.record_checkout(time.perf_counter() - started)
+
                 yield session
                 await session.commit()
             except Exception:
                 await session.rollback()
-                raise
\ No newline at end of file
+                raise
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get pool saturation and checkout wait-time statistics."""
+        stats: Dict[str, Any] = {
+            "checkouts": self.metrics.checkouts,
+            "avg_wait_ms": round(self.metrics.avg_wait_seconds * 1000, 3),
+            "max_wait_ms": round(self.metrics.max_wait_seconds * 1000, 3)
+        }
+
+        if self.engine is None or self.use_null_pool:
+            return stats
+
+        pool = self.engine.pool
+        capacity = self.pool_size + self.max_overflow
+        checked_out = pool.checkedout()
+        stats.update({
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "saturation": round(checked_out / capacity, 3) if capacity else 0.0
+        })
+        return stats
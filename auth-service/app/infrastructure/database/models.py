@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, JSON
 from sqlalchemy.orm import declarative_base
 from datetime import datetime
 
@@ -18,4 +18,15 @@ class UserModel(Base):
     is_verified = Column(Boolean, default=False, nullable=False)
     role = Column(String, default="user", nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class OutboxEventModel(Base):
+    """SQLAlchemy model for the transactional outbox."""
+    
+    __tablename__ = "outbox_events"
+    
+    id = Column(String, primary_key=True)
+    routing_key = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -1,10 +1,11 @@
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User
+from app.domain.events.domain_event import DomainEvent
 from app.domain.repositories.user_repository import IUserRepository
-from app.infrastructure.database.models import UserModel
+from app.infrastructure.database.models import UserModel, OutboxEventModel
 from app.infrastructure.database.connection import DatabaseConnection
 
 
@@ -14,8 +15,8 @@ class UserRepositoryImpl(IUserRepository):
     def __init__(self, db_connection: DatabaseConnection):
         self.db_connection = db_connection
     
-    async def create(self, user: User) -> User:
-        """Create new user in database."""
+    async def create(self, user: User, events: Optional[List[DomainEvent]] = None) -> User:
+        """Create new user in database, writing events to the outbox in the same transaction."""
         async with self.db_connection.get_session() as session:
             user_model = UserModel(
                 id=user.id,
@@ -29,6 +30,13 @@ class UserRepositoryImpl(IUserRepository):
                 updated_at=user.updated_at
             )
             session.add(user_model)
+            for event in events or []:
+                session.add(OutboxEventModel(
+                    id=event.id,
+                    routing_key=event.routing_key,
+                    payload=event.payload,
+                    created_at=event.created_at
+                ))
             await session.flush()
             return self._to_entity(user_model)
     
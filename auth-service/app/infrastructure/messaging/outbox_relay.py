@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from typing import Optional
+from sqlalchemy import select, delete
+
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.models import OutboxEventModel
+from app.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Background relay that drains the outbox table to RabbitMQ.
+
+    Rows are locked with SKIP LOCKED so several workers can relay in
+    parallel, and are only deleted after the broker confirms the batch.
+    Delivery is therefore at-least-once: consumers must tolerate duplicates.
+    """
+
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        publisher: RabbitMQPublisher,
+        batch_size: int = 500,
+        poll_interval_ms: int = 500
+    ):
+        self.db_connection = db_connection
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval_ms / 1000
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the relay loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Outbox relay started")
+
+    async def stop(self) -> None:
+        """Stop the relay loop."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Outbox relay stopped")
+
+    async def relay_batch(self) -> int:
+        """
+        Publish one batch of pending events and remove them from the outbox.
+
+        Returns:
+            Number of events relayed
+        """
+        async with self.db_connection.get_session() as session:
+            result = await session.execute(
+                select(OutboxEventModel)
+                .order_by(OutboxEventModel.created_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            events = result.scalars().all()
+            if not events:
+                return 0
+
+            # Raises on any unconfirmed message, rolling back so rows are retried
+            await self.publisher.publish_confirmed(
+                [(event.routing_key, event.payload) for event in events]
+            )
+            await session.execute(
+                delete(OutboxEventModel).where(
+                    OutboxEventModel.id.in_([event.id for event in events])
+                )
+            )
+            return len(events)
+
+    async def _run(self) -> None:
+        """Relay continuously while the outbox is full, otherwise poll."""
+        while True:
+            try:
+                relayed = await self.relay_batch()
+                if relayed:
+                    logger.info(f"Relayed {relayed} outbox events")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to relay outbox events: {e}")
+                relayed = 0
+
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
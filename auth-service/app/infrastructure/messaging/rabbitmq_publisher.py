@@ -1,77 +1,265 @@
-import pika
+import aio_pika
+import asyncio
 import json
 import logging
-from typing import Dict, Any
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
 
 class RabbitMQPublisher:
-    """RabbitMQ message publisher."""
-    
-    def __init__(self, host: str, port: int, username: str, password: str):
+    """
+    Asyncio RabbitMQ publisher with an in-memory outbound buffer.
+
+    ``publish`` only appends to the buffer; a background task drains it in
+    batches and waits for publisher confirms, so callers never wait on the
+    broker. When the buffer is full the overflow policy decides whether to
+    drop the oldest message, drop the new one, or make the caller wait.
+    The same policy applies when a failed batch is put back; under ``block``
+    the batch in flight keeps its room, so it always fits back.
+    """
+
+    EXCHANGE_NAME = "user.events"
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        batch_size: int = 100,
+        flush_interval_ms: int = 50,
+        max_buffer_size: int = 10000,
+        overflow_policy: str = "drop_oldest"
+    ):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy: {overflow_policy}")
+
         self.host = host
         self.port = port
         self.username = username
         self.password = password
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_buffer_size = max_buffer_size
+        self.overflow_policy = overflow_policy
         self.connection = None
         self.channel = None
-    
-    def connect(self) -> None:
-        """Initialize RabbitMQ connection."""
+        self.exchange = None
+        self.stats = {"published": 0, "failed": 0, "dropped": 0}
+        self._buffer: Deque[Tuple[str, bytes]] = deque()
+        self._has_messages = asyncio.Event()
+        self._has_space = asyncio.Event()
+        self._has_space.set()
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._in_flight = 0
+
+    async def connect(self) -> None:
+        """Initialize RabbitMQ connection and start the background flusher."""
         try:
-            credentials = pika.PlainCredentials(self.username, self.password)
-            parameters = pika.ConnectionParameters(
+            self.connection = await aio_pika.connect_robust(
                 host=self.host,
                 port=self.port,
-                credentials=credentials,
-                heartbeat=600,
-                blocked_connection_timeout=300
+                login=self.username,
+                password=self.password,
+                heartbeat=600
             )
-            self.connection = pika.BlockingConnection(parameters)
-            self.channel = self.connection.channel()
-            
+            self.channel = await self.connection.channel(publisher_confirms=True)
+
             # Declare exchange
-            self.channel.exchange_declare(
-                exchange='user.events',
-                exchange_type='topic',
+            self.exchange = await self.channel.declare_exchange(
+                self.EXCHANGE_NAME,
+                aio_pika.ExchangeType.TOPIC,
                 durable=True
             )
             logger.info("RabbitMQ connection established")
         except Exception as e:
             logger.error(f"Failed to connect to RabbitMQ: {e}")
             raise
-    
-    def disconnect(self) -> None:
-        """Close RabbitMQ connection."""
+
+        self.start()
+
+    def start(self) -> None:
+        """Start the background flusher task."""
+        if self._flusher_task is None:
+            self._flusher_task = asyncio.create_task(self._run_flusher())
+
+    async def disconnect(self, drain_timeout: float = 5.0) -> None:
+        """Flush buffered messages (best effort) and close the connection."""
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+
+        try:
+            await asyncio.wait_for(self._drain(), timeout=drain_timeout)
+        except Exception as e:
+            logger.warning(f"Dropping {len(self._buffer)} unpublished messages on shutdown: {e}")
+
         if self.connection and not self.connection.is_closed:
-            self.connection.close()
+            await self.connection.close()
             logger.info("RabbitMQ connection closed")
-    
-    def publish(self, routing_key: str, message: Dict[Any, Any]) -> None:
+
+    async def publish(self, routing_key: str, message: Dict[Any, Any]) -> None:
         """
-        Publish message to exchange (SYNCHRONOUS).
-        
+        Queue a message for publishing.
+
+        Returns as soon as the message is buffered. Only the ``block``
+        overflow policy waits, and only while the buffer is full.
+
         Args:
             routing_key: Routing key for the message
             message: Message payload as dictionary
         """
+        body = json.dumps(message).encode()
+
+        if self._occupied() >= self.max_buffer_size:
+            if self.overflow_policy == "drop_newest":
+                self.stats["dropped"] += 1
+                logger.warning(f"Publish buffer full, dropped message to {routing_key}")
+                return
+            if self.overflow_policy == "drop_oldest":
+                dropped_key, _ = self._buffer.popleft()
+                self.stats["dropped"] += 1
+                logger.warning(f"Publish buffer full, dropped oldest message to {dropped_key}")
+            else:
+                while self._occupied() >= self.max_buffer_size:
+                    self._has_space.clear()
+                    await self._has_space.wait()
+
+        self._buffer.append((routing_key, body))
+        if len(self._buffer) >= self.batch_size:
+            self._has_messages.set()
+
+    @property
+    def buffered(self) -> int:
+        """Number of messages waiting to be published."""
+        return len(self._buffer)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get publish counters and the current buffer depth."""
+        return {**self.stats, "buffered": self.buffered}
+
+    async def flush(self) -> int:
+        """
+        Publish one batch from the buffer and wait for broker confirms.
+
+        Messages from a failed batch are put back at the front of the buffer,
+        subject to the overflow policy.
+
+        Returns:
+            Number of messages confirmed by the broker
+        """
+        if not self._buffer:
+            return 0
+
+        batch: List[Tuple[str, bytes]] = []
+        while self._buffer and len(batch) < self.batch_size:
+            batch.append(self._buffer.popleft())
+
+        self._in_flight = len(batch)
         try:
-            if not self.channel or self.connection.is_closed:
-                self.connect()
-            
-            self.channel.basic_publish(
-                exchange='user.events',
-                routing_key=routing_key,
-                body=json.dumps(message),
-                properties=pika.BasicProperties(
-                    delivery_mode=2,  # Make message persistent
-                    content_type='application/json'
-                )
+            results = await asyncio.gather(
+                *(self._publish_one(routing_key, body) for routing_key, body in batch),
+                return_exceptions=True
             )
-            logger.info(f"Published message to {routing_key}")
-        except Exception as e:
-            logger.error(f"Failed to publish message: {e}")
-            # Attempt reconnection
-            self.connect()
-            raise
\ No newline at end of file
+        finally:
+            self._in_flight = 0
+            self._has_space.set()
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        failed = [item for item, result in zip(batch, results) if isinstance(result, BaseException)]
+        published = len(batch) - len(failed)
+        self.stats["published"] += published
+
+        if failed:
+            self.stats["failed"] += len(failed)
+            self._buffer.extendleft(reversed(failed))
+            self._trim_overflow()
+            raise ConnectionError(f"Failed to publish {len(failed)} of {len(batch)} messages: {errors[0]}")
+
+        logger.debug(f"Published batch of {published} messages")
+        return published
+
+    async def publish_confirmed(self, messages: List[Tuple[str, Dict[Any, Any]]]) -> None:
+        """
+        Publish messages directly (bypassing the buffer) and wait for confirms.
+
+        Args:
+            messages: (routing_key, payload) pairs
+
+        Raises:
+            ConnectionError: If any message was not confirmed by the broker
+        """
+        results = await asyncio.gather(
+            *(self._publish_one(routing_key, json.dumps(message).encode()) for routing_key, message in messages),
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        self.stats["published"] += len(messages) - len(errors)
+        if errors:
+            self.stats["failed"] += len(errors)
+            raise ConnectionError(f"Failed to publish {len(errors)} of {len(messages)} messages: {errors[0]}")
+
+    def _occupied(self) -> int:
+        """Buffer slots in use; a blocking buffer also reserves the batch in flight."""
+        if self.overflow_policy == "block":
+            return len(self._buffer) + self._in_flight
+        return len(self._buffer)
+
+    def _trim_overflow(self) -> None:
+        """Drop messages beyond ``max_buffer_size`` after a failed batch was put back."""
+        excess = len(self._buffer) - self.max_buffer_size
+        if excess <= 0:
+            return
+
+        for _ in range(excess):
+            if self.overflow_policy == "drop_newest":
+                self._buffer.pop()
+            else:
+                self._buffer.popleft()
+        self.stats["dropped"] += excess
+        logger.warning(f"Publish buffer full after failed batch, dropped {excess} messages")
+
+    async def _publish_one(self, routing_key: str, body: bytes) -> None:
+        """Publish a single message and wait for its confirm."""
+        await self.exchange.publish(
+            aio_pika.Message(
+                body=body,
+                content_type="application/json",
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+            ),
+            routing_key=routing_key
+        )
+
+    async def _drain(self) -> None:
+        """Publish everything currently buffered."""
+        while self._buffer:
+            await self.flush()
+
+    async def _run_flusher(self) -> None:
+        """Background loop: flush on a full batch or every flush interval."""
+        backoff = self.flush_interval
+        while True:
+            try:
+                await asyncio.wait_for(self._has_messages.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._has_messages.clear()
+
+            try:
+                await self._drain()
+                backoff = self.flush_interval
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The robust connection reconnects on its own; just back off
+                logger.error(f"Failed to flush publish buffer: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 5.0)
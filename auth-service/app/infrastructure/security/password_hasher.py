@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from passlib.context import CryptContext
+
+logger = logging.getLogger(__name__)
+
+# Module-level context so worker processes build it once on import
+_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash_password(password: str) -> str:
+    """Hash a password (runs inside a worker process)."""
+    return _pwd_context.hash(password)
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash (runs inside a worker process)."""
+    return _pwd_context.verify(password, hashed_password)
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the hashing queue is full and the request is rejected."""
+    pass
+
+
+class PasswordHasher:
+    """
+    Bcrypt hashing executor that keeps CPU work off the event loop.
+
+    Work is dispatched to a process pool started with ``start()``. Until the
+    pool is started, calls fall back to the loop's default thread executor.
+    At most ``max_workers + max_queue_size`` calls may be in flight; further
+    calls raise PasswordHasherBusyError instead of queueing without bound.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue_size: int = 64):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue_size = max_queue_size
+        self.executor: Optional[Executor] = None
+        self._in_flight = 0
+
+    def start(self) -> None:
+        """Start the worker process pool."""
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Password hasher started with {self.max_workers} workers")
+
+    def shutdown(self) -> None:
+        """Stop the worker process pool."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+            logger.info("Password hasher stopped")
+
+    @property
+    def in_flight(self) -> int:
+        """Number of hash/verify calls currently running or queued."""
+        return self._in_flight
+
+    async def hash(self, password: str) -> str:
+        """Hash a password without blocking the event loop."""
+        return await self._run(_hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify a password without blocking the event loop."""
+        return await self._run(_verify_password, password, hashed_password)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Submit work to the executor, rejecting when the queue is full."""
+        if self._in_flight >= self.max_workers + self.max_queue_size:
+            raise PasswordHasherBusyError("Password hashing queue is full")
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self._in_flight -= 1
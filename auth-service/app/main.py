@@ -6,7 +6,10 @@ import logging
 from app.config import get_settings
 from app.infrastructure.database.connection import DatabaseConnection
 from app.infrastructure.cache.redis_client import RedisClient
+from app.infrastructure.cache.user_cache import UserCache
 from app.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+from app.infrastructure.messaging.outbox_relay import OutboxRelay
+from app.infrastructure.security.password_hasher import PasswordHasher
 from app.presentation.routes import auth_routes
 from app.presentation.dependencies import set_infrastructure
 
@@ -27,7 +30,15 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Auth Service...")
     
     # Initialize database
-    db_connection = DatabaseConnection(settings.DATABASE_URL)
+    db_connection = DatabaseConnection(
+        settings.DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        use_null_pool=settings.DB_USE_NULL_POOL
+    )
     await db_connection.connect()
     await db_connection.create_tables()
     
@@ -39,17 +50,45 @@ async def lifespan(app: FastAPI):
     )
     await redis_client.connect()
     
+    # Initialize user cache (shared by all requests in this worker)
+    user_cache = UserCache(
+        redis_client,
+        max_size=settings.USER_CACHE_MAX_SIZE,
+        local_ttl=settings.USER_CACHE_LOCAL_TTL,
+        redis_ttl=settings.USER_CACHE_REDIS_TTL
+    ) if settings.USER_CACHE_ENABLED else None
+    
     # Initialize RabbitMQ
     rabbitmq_publisher = RabbitMQPublisher(
         host=settings.RABBITMQ_HOST,
         port=settings.RABBITMQ_PORT,
         username=settings.RABBITMQ_USER,
-        password=settings.RABBITMQ_PASSWORD
+        password=settings.RABBITMQ_PASSWORD,
+        batch_size=settings.RABBITMQ_PUBLISH_BATCH_SIZE,
+        flush_interval_ms=settings.RABBITMQ_PUBLISH_FLUSH_INTERVAL_MS,
+        max_buffer_size=settings.RABBITMQ_PUBLISH_MAX_BUFFER,
+        overflow_policy=settings.RABBITMQ_PUBLISH_OVERFLOW_POLICY
+    )
+    await rabbitmq_publisher.connect()
+    
+    # Start outbox relay (delivers events stored with their DB transaction)
+    outbox_relay = OutboxRelay(
+        db_connection,
+        rabbitmq_publisher,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_interval_ms=settings.OUTBOX_POLL_INTERVAL_MS
+    )
+    outbox_relay.start()
+    
+    # Initialize password hashing pool
+    password_hasher = PasswordHasher(
+        max_workers=settings.PASSWORD_HASHER_WORKERS,
+        max_queue_size=settings.PASSWORD_HASHER_MAX_QUEUE
     )
-    rabbitmq_publisher.connect()
+    password_hasher.start()
     
     # Set infrastructure in dependencies
-    set_infrastructure(db_connection, redis_client, rabbitmq_publisher)
+    set_infrastructure(db_connection, redis_client, rabbitmq_publisher, password_hasher, user_cache)
     
     logger.info("Auth Service started successfully")
     
@@ -57,9 +96,11 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Auth Service...")
+    await outbox_relay.stop()
     await db_connection.disconnect()
     await redis_client.disconnect()
-    rabbitmq_publisher.disconnect()
+    await rabbitmq_publisher.disconnect()
+    password_hasher.shutdown()
     logger.info("Auth Service stopped")
 
 
@@ -1,9 +1,14 @@
 from functools import lru_cache
+from typing import Optional
 from app.config import get_settings
 from app.infrastructure.database.connection import DatabaseConnection
 from app.infrastructure.database.user_repository_impl import UserRepositoryImpl
 from app.infrastructure.cache.redis_client import RedisClient
+from app.infrastructure.cache.user_cache import UserCache
+from app.infrastructure.cache.cached_user_repository import CachedUserRepository
+from app.domain.repositories.user_repository import IUserRepository
 from app.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+from app.infrastructure.security.password_hasher import PasswordHasher
 from app.application.use_cases.login_use_case import LoginUseCase
 from app.application.use_cases.refresh_token_use_case import RefreshTokenUseCase
 from app.application.use_cases.register_use_case import RegisterUseCase
@@ -12,20 +17,53 @@ from app.application.use_cases.register_use_case import RegisterUseCase
 _db_connection: DatabaseConnection = None
 _redis_client: RedisClient = None
 _rabbitmq_publisher: RabbitMQPublisher = None
+_password_hasher: PasswordHasher = None
+_user_cache: Optional[UserCache] = None
 
 
-def set_infrastructure(db: DatabaseConnection, redis: RedisClient, rabbitmq: RabbitMQPublisher):
+def set_infrastructure(
+    db: DatabaseConnection,
+    redis: RedisClient,
+    rabbitmq: RabbitMQPublisher,
+    password_hasher: PasswordHasher,
+    user_cache: Optional[UserCache] = None
+):
     """Set infrastructure instances."""
-    global _db_connection, _redis_client, _rabbitmq_publisher
+    global _db_connection, _redis_client, _rabbitmq_publisher, _password_hasher, _user_cache
     _db_connection = db
     _redis_client = redis
     _rabbitmq_publisher = rabbitmq
+    _password_hasher = password_hasher
+    _user_cache = user_cache
+
+
+def get_user_repository() -> IUserRepository:
+    """Build the user repository, wrapped in the read-through cache if enabled."""
+    repository = UserRepositoryImpl(_db_connection)
+    if _user_cache is None:
+        return repository
+    return CachedUserRepository(repository, _user_cache)
+
+
+def get_db_connection() -> DatabaseConnection:
+    """Dependency for the database connection manager."""
+    return _db_connection
+
+
+def get_rabbitmq_publisher() -> RabbitMQPublisher:
+    """Dependency for the RabbitMQ publisher."""
+    return _rabbitmq_publisher
+
+
+def get_user_cache() -> Optional[UserCache]:
+    """Dependency for the shared user cache."""
+    return _user_cache
 
 
 def get_login_use_case() -> LoginUseCase:
     """Dependency for login use case."""
     settings = get_settings()
-    user_repository = UserRepositoryImpl(_db_connection)
+    user_repository = get_user_repository()
     return LoginUseCase(
         user_repository=user_repository,
         redis_client=_redis_client,
@@ -33,14 +71,15 @@ def get_login_use_case() -> LoginUseCase:
         jwt_secret=settings.JWT_SECRET,
         jwt_algorithm=settings.JWT_ALGORITHM,
         access_token_expire_minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
-        refresh_token_expire_days=settings.REFRESH_TOKEN_EXPIRE_DAYS
+        refresh_token_expire_days=settings.REFRESH_TOKEN_EXPIRE_DAYS,
+        password_hasher=_password_hasher
     )
 
 
 def get_refresh_use_case() -> RefreshTokenUseCase:
     """Dependency for refresh token use case."""
     settings = get_settings()
-    user_repository = UserRepositoryImpl(_db_connection)
+    user_repository = get_user_repository()
     return RefreshTokenUseCase(
         user_repository=user_repository,
         redis_client=_redis_client,
@@ -52,8 +91,8 @@ def get_refresh_use_case() -> RefreshTokenUseCase:
 
 def get_register_use_case() -> RegisterUseCase:
     """Dependency for register use case."""
-    user_repository = UserRepositoryImpl(_db_connection)
+    user_repository = get_user_repository()
     return RegisterUseCase(
         user_repository=user_repository,
-        rabbitmq_publisher=_rabbitmq_publisher
+        password_hasher=_password_hasher
     )
\ No newline at end of file
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from typing import Annotated
+from typing import Annotated, Optional
 
 from app.application.dtos.auth_dto import (
     LoginRequest, LoginResponse, RefreshTokenRequest,
@@ -8,7 +8,14 @@ from app.application.dtos.auth_dto import (
 from app.application.use_cases.login_use_case import LoginUseCase
 from app.application.use_cases.refresh_token_use_case import RefreshTokenUseCase
 from app.application.use_cases.register_use_case import RegisterUseCase
-from app.presentation.dependencies import get_login_use_case, get_refresh_use_case, get_register_use_case
+from app.infrastructure.security.password_hasher import PasswordHasherBusyError
+from app.infrastructure.cache.user_cache import UserCache
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+from app.presentation.dependencies import (
+    get_login_use_case, get_refresh_use_case, get_register_use_case,
+    get_db_connection, get_user_cache, get_rabbitmq_publisher
+)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -29,6 +36,12 @@ async def register(
         return await use_case.execute(request)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Registration failed")
 
@@ -53,6 +66,12 @@ async def login(
         return result
     except ValueError as e:
         raise HTTPException(status_code=401, detail=str(e))
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         # TEMPORAL: ver error real
         import traceback
@@ -91,4 +110,18 @@ async def logout(
 @router.get("/health")
 async def health_check() -> dict:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "auth-service"}
\ No newline at end of file
+    return {"status": "healthy", "service": "auth-service"}
+
+
+@router.get("/metrics")
+async def metrics(
+    db_connection: Annotated[DatabaseConnection, Depends(get_db_connection)],
+    user_cache: Annotated[Optional[UserCache], Depends(get_user_cache)],
+    rabbitmq_publisher: Annotated[RabbitMQPublisher, Depends(get_rabbitmq_publisher)]
+) -> dict:
+    """Runtime metrics (database pool, user cache and event publisher)."""
+    return {
+        "db_pool": db_connection.get_pool_stats() if db_connection else None,
+        "user_cache": user_cache.stats.to_dict() if user_cache else None,
+        "publisher": rabbitmq_publisher.get_stats() if rabbitmq_publisher else None
+    }
\ No newline at end of file
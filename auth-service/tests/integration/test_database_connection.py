@@ -0,0 +1,47 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.infrastructure.database.connection import DatabaseConnection
+
+
+@pytest_asyncio.fixture
+async def db_connection(tmp_path):
+    connection = DatabaseConnection(
+        f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}",
+        pool_size=2,
+        max_overflow=1
+    )
+    await connection.connect()
+    yield connection
+    await connection.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_checkouts(db_connection):
+    async with db_connection.get_session() as session:
+        await session.execute(text("SELECT 1"))
+        stats = db_connection.get_pool_stats()
+        assert stats["checked_out"] == 1
+        assert stats["saturation"] == pytest.approx(1 / 3, abs=1e-3)
+    
+    stats = db_connection.get_pool_stats()
+    assert stats["checkouts"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["max_wait_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_null_pool_reports_wait_times_only(tmp_path):
+    connection = DatabaseConnection(
+        f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}",
+        use_null_pool=True
+    )
+    await connection.connect()
+    async with connection.get_session() as session:
+        await session.execute(text("SELECT 1"))
+    
+    stats = connection.get_pool_stats()
+    assert stats["checkouts"] == 1
+    assert "saturation" not in stats
+    await connection.disconnect()
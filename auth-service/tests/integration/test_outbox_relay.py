@@ -0,0 +1,77 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, func
+
+from app.domain.entities.user import User
+from app.domain.events.domain_event import DomainEvent
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.models import OutboxEventModel
+from app.infrastructure.database.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.messaging.outbox_relay import OutboxRelay
+
+
+class FakePublisher:
+    """Collects confirmed batches; optionally fails them."""
+    
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batches = []
+    
+    async def publish_confirmed(self, messages):
+        if self.fail:
+            raise ConnectionError("broker unavailable")
+        self.batches.append(messages)
+
+
+@pytest_asyncio.fixture
+async def db_connection(tmp_path):
+    connection = DatabaseConnection(f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}")
+    await connection.connect()
+    await connection.create_tables()
+    yield connection
+    await connection.disconnect()
+
+
+async def count_outbox(db_connection) -> int:
+    async with db_connection.get_session() as session:
+        return (await session.execute(select(func.count()).select_from(OutboxEventModel))).scalar()
+
+
+async def create_user(db_connection, email: str) -> None:
+    user = User(email=email, hashed_password="hash", full_name="Test User")
+    event = DomainEvent(routing_key="user.created", payload={"data": {"email": email}})
+    await UserRepositoryImpl(db_connection).create(user, events=[event])
+
+
+@pytest.mark.asyncio
+async def test_create_writes_outbox_event(db_connection):
+    await create_user(db_connection, "test@example.com")
+    
+    assert await count_outbox(db_connection) == 1
+
+
+@pytest.mark.asyncio
+async def test_relay_publishes_in_batches_and_clears_outbox(db_connection):
+    for i in range(3):
+        await create_user(db_connection, f"user{i}@example.com")
+    publisher = FakePublisher()
+    relay = OutboxRelay(db_connection, publisher, batch_size=2)
+    
+    assert await relay.relay_batch() == 2
+    assert await relay.relay_batch() == 1
+    assert await relay.relay_batch() == 0
+    
+    emails = [payload["data"]["email"] for batch in publisher.batches for _, payload in batch]
+    assert emails == ["user0@example.com", "user1@example.com", "user2@example.com"]
+    assert await count_outbox(db_connection) == 0
+
+
+@pytest.mark.asyncio
+async def test_relay_keeps_events_when_publish_fails(db_connection):
+    await create_user(db_connection, "test@example.com")
+    relay = OutboxRelay(db_connection, FakePublisher(fail=True))
+    
+    with pytest.raises(ConnectionError):
+        await relay.relay_batch()
+    
+    assert await count_outbox(db_connection) == 1
@@ -8,8 +8,7 @@ from app.application.dtos.auth_dto import RegisterRequest
 @pytest.fixture
 def register_use_case():
     return RegisterUseCase(
-        user_repository=AsyncMock(),
-        rabbitmq_publisher=AsyncMock()
+        user_repository=AsyncMock()
     )
 
 
@@ -38,6 +37,10 @@ async def test_register_success(register_use_case):
     assert response.email == "new@example.com"
     assert response.full_name == "New User"
     assert register_use_case.user_repository.create.called
+    
+    events = register_use_case.user_repository.create.call_args.kwargs["events"]
+    assert [event.routing_key for event in events] == ["user.created"]
+    assert events[0].payload["data"]["email"] == "new@example.com"
 
 
 @pytest.mark.asyncio
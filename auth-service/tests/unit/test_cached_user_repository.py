@@ -0,0 +1,95 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from app.domain.entities.user import User
+from app.infrastructure.cache.user_cache import UserCache
+from app.infrastructure.cache.cached_user_repository import CachedUserRepository
+
+
+class FakeRedis:
+    """In-memory stand-in for RedisClient."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    async def get(self, key):
+        return self.data.get(key)
+    
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+    
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def user():
+    return User(id="user123", email="test@example.com", hashed_password="hash", full_name="Test User")
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def repository():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_find_by_email_reads_through_once(repository, redis, user):
+    repository.find_by_email.return_value = user
+    cache = UserCache(redis)
+    cached_repository = CachedUserRepository(repository, cache)
+    
+    first = await cached_repository.find_by_email("test@example.com")
+    second = await cached_repository.find_by_email("test@example.com")
+    by_id = await cached_repository.find_by_id("user123")
+    
+    assert first.id == second.id == by_id.id == "user123"
+    repository.find_by_email.assert_awaited_once()
+    repository.find_by_id.assert_not_awaited()
+    assert cache.stats.local_hits == 2
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_layer_shared_between_workers(repository, redis, user):
+    repository.find_by_id.return_value = user
+    await CachedUserRepository(repository, UserCache(redis)).find_by_id("user123")
+    
+    other_worker_cache = UserCache(redis)
+    found = await CachedUserRepository(repository, other_worker_cache).find_by_email("test@example.com")
+    
+    assert found.hashed_password == "hash"
+    assert other_worker_cache.stats.redis_hits == 1
+    repository.find_by_email.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_old_and_new_email(repository, redis, user):
+    cache = UserCache(redis)
+    cached_repository = CachedUserRepository(repository, cache)
+    repository.find_by_email.return_value = user
+    await cached_repository.find_by_email("test@example.com")
+    
+    renamed = User(id="user123", email="new@example.com", hashed_password="hash", full_name="Test User")
+    repository.find_by_id.return_value = user
+    repository.update.return_value = renamed
+    await cached_repository.update(renamed)
+    
+    assert redis.data == {}
+    assert await cache.get("email", "test@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_local_entry_falls_back(repository, user):
+    repository.find_by_id.return_value = user
+    cache = UserCache(None, local_ttl=-1)
+    cached_repository = CachedUserRepository(repository, cache)
+    
+    await cached_repository.find_by_id("user123")
+    await cached_repository.find_by_id("user123")
+    
+    assert repository.find_by_id.await_count == 2
@@ -0,0 +1,37 @@
+import asyncio
+import pytest
+
+from app.infrastructure.security.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_roundtrip():
+    hasher = PasswordHasher(max_workers=1)
+    hashed = await hasher.hash("Test123456")
+    assert hashed != "Test123456"
+    assert await hasher.verify("Test123456", hashed) is True
+    assert await hasher.verify("WrongPassword", hashed) is False
+
+
+@pytest.mark.asyncio
+async def test_process_pool_hash_and_verify():
+    hasher = PasswordHasher(max_workers=1)
+    hasher.start()
+    try:
+        hashed = await hasher.hash("Test123456")
+        assert await hasher.verify("Test123456", hashed) is True
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_full():
+    hasher = PasswordHasher(max_workers=1, max_queue_size=0)
+    pending = asyncio.create_task(hasher.hash("Test123456"))
+    await asyncio.sleep(0)
+    
+    with pytest.raises(PasswordHasherBusyError):
+        await hasher.hash("Another123")
+    
+    await pending
+    assert hasher.in_flight == 0
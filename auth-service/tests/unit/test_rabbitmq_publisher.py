@@ -0,0 +1,145 @@
+import asyncio
+import json
+import pytest
+
+from app.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+
+
+class FakeExchange:
+    """Records published messages; optionally fails every publish."""
+    
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.fail = fail
+        self.delay = delay
+        self.published = []
+    
+    async def publish(self, message, routing_key):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("broker unavailable")
+        self.published.append((routing_key, json.loads(message.body)))
+
+
+def make_publisher(**kwargs) -> RabbitMQPublisher:
+    return RabbitMQPublisher(host="localhost", port=5672, username="guest", password="guest", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_publish_buffers_without_touching_broker():
+    publisher = make_publisher()
+    publisher.exchange = FakeExchange()
+    
+    await publisher.publish("user.login", {"user_id": "1"})
+    
+    assert publisher.buffered == 1
+    assert publisher.exchange.published == []
+
+
+@pytest.mark.asyncio
+async def test_flush_publishes_in_batches():
+    publisher = make_publisher(batch_size=2)
+    publisher.exchange = FakeExchange()
+    for i in range(3):
+        await publisher.publish("user.login", {"n": i})
+    
+    assert await publisher.flush() == 2
+    assert await publisher.flush() == 1
+    assert [body["n"] for _, body in publisher.exchange.published] == [0, 1, 2]
+    assert publisher.get_stats()["published"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_requeued_in_order():
+    publisher = make_publisher()
+    publisher.exchange = FakeExchange(fail=True)
+    await publisher.publish("user.login", {"n": 0})
+    await publisher.publish("user.login", {"n": 1})
+    
+    with pytest.raises(ConnectionError):
+        await publisher.flush()
+    
+    publisher.exchange = FakeExchange()
+    await publisher.flush()
+    assert [body["n"] for _, body in publisher.exchange.published] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_when_buffer_full():
+    publisher = make_publisher(max_buffer_size=2, overflow_policy="drop_oldest")
+    for i in range(3):
+        await publisher.publish("user.login", {"n": i})
+    
+    assert publisher.buffered == 2
+    assert publisher.get_stats()["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_space():
+    publisher = make_publisher(max_buffer_size=1, overflow_policy="block")
+    publisher.exchange = FakeExchange()
+    await publisher.publish("user.login", {"n": 0})
+    
+    blocked = asyncio.create_task(publisher.publish("user.login", {"n": 1}))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    
+    await publisher.flush()
+    await blocked
+    assert publisher.buffered == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy, kept", [("drop_oldest", [2, 3, 4]), ("drop_newest", [0, 1, 2])])
+async def test_requeued_batch_respects_overflow_policy(policy, kept):
+    publisher = make_publisher(batch_size=2, max_buffer_size=3, overflow_policy=policy)
+    publisher.exchange = FakeExchange(fail=True, delay=0.01)
+    for i in range(3):
+        await publisher.publish("user.login", {"n": i})
+    
+    flushing = asyncio.create_task(publisher.flush())
+    await asyncio.sleep(0)
+    for i in range(3, 5):
+        await publisher.publish("user.login", {"n": i})
+    with pytest.raises(ConnectionError):
+        await flushing
+    
+    assert publisher.buffered == 3
+    assert publisher.get_stats()["dropped"] == 2
+    publisher.exchange = FakeExchange()
+    await publisher._drain()
+    assert [body["n"] for _, body in publisher.exchange.published] == kept
+
+
+@pytest.mark.asyncio
+async def test_block_policy_keeps_room_for_batch_in_flight():
+    publisher = make_publisher(batch_size=2, max_buffer_size=2, overflow_policy="block")
+    publisher.exchange = FakeExchange(fail=True, delay=0.01)
+    for i in range(2):
+        await publisher.publish("user.login", {"n": i})
+    
+    flushing = asyncio.create_task(publisher.flush())
+    await asyncio.sleep(0)
+    blocked = asyncio.create_task(publisher.publish("user.login", {"n": 2}))
+    with pytest.raises(ConnectionError):
+        await flushing
+    await asyncio.sleep(0)
+    
+    assert not blocked.done()
+    assert publisher.buffered == 2
+    publisher.exchange = FakeExchange()
+    await publisher.flush()
+    await blocked
+    assert publisher.get_stats()["dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_background_flusher_drains_buffer():
+    publisher = make_publisher(flush_interval_ms=10)
+    publisher.exchange = FakeExchange()
+    publisher.start()
+    
+    await publisher.publish("user.created", {"id": "1"})
+    await asyncio.sleep(0.05)
+    await publisher.disconnect()
+    
+    assert publisher.exchange.published == [("user.created", {"id": "1"})]
@@ -51,4 +51,29 @@ class UserListResponse(BaseModel):
     users: list[UserResponse]
     total: int
     skip: int
-    limit: int
\ No newline at end of file
+    limit: int
+
+
+class UserCursorPageResponse(BaseModel):
+    """DTO for a keyset-paginated user list."""
+    users: list[UserResponse]
+    next_cursor: Optional[str] = None
+    limit: int
+    total: Optional[int] = None
+
+
+class ImportRowError(BaseModel):
+    """DTO for a rejected import row."""
+    row: int
+    email: Optional[str] = None
+    error: str
+
+
+class ImportUsersResponse(BaseModel):
+    """DTO for bulk import results."""
+    total_rows: int
+    imported: int
+    skipped_existing: int
+    failed: int
+    errors: list[ImportRowError]
+    errors_truncated: bool = False
@@ -1,8 +1,33 @@
 """Get Users Use Case - Application Layer"""
-from typing import List
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
 from app.domain.entities.user import User
 from app.domain.repositories.user_repository import IUserRepository
-from app.application.dtos.user_dto import UserResponse, UserListResponse
+from app.application.dtos.user_dto import UserResponse, UserListResponse, UserCursorPageResponse
+
+
+def encode_cursor(user: User) -> str:
+    """Encode the keyset position of a user as an opaque cursor."""
+    raw = json.dumps({"c": user.created_at.isoformat(), "i": user.id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode an opaque cursor into its (created_at, id) position.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["c"]), str(data["i"])
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
 
 
 class GetUsersUseCase:
@@ -47,6 +72,58 @@ class GetUsersUseCase:
             skip=skip,
             limit=limit
         )
+    
+    async def execute_cursor(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        with_total: bool = False
+    ) -> UserCursorPageResponse:
+        """
+        Get a page of users using keyset pagination.
+        
+        Args:
+            cursor: Opaque cursor from the previous page (None for the first page)
+            limit: Maximum number of records to return
+            with_total: Include an estimated total (skipped by default)
+            
+        Returns:
+            UserCursorPageResponse with users and the cursor for the next page
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after_created_at, after_id = decode_cursor(cursor) if cursor else (None, None)
+        
+        # Fetch one extra row to know whether there is a next page
+        users = await self.user_repository.find_page(
+            limit=limit + 1,
+            after_created_at=after_created_at,
+            after_id=after_id
+        )
+        has_more = len(users) > limit
+        users = users[:limit]
+        
+        return UserCursorPageResponse(
+            users=[
+                UserResponse(
+                    id=u.id,
+                    email=u.email,
+                    full_name=u.full_name,
+                    role=u.role,
+                    is_active=u.is_active,
+                    is_verified=u.is_verified,
+                    phone=u.phone,
+                    department=u.department,
+                    created_at=u.created_at.isoformat(),
+                    updated_at=u.updated_at.isoformat()
+                )
+                for u in users
+            ],
+            next_cursor=encode_cursor(users[-1]) if has_more else None,
+            limit=limit,
+            total=await self.user_repository.estimate_count() if with_total else None
+        )
 
 
 class GetUserByIdUseCase:
@@ -0,0 +1,127 @@
+"""Import Users Use Case - Application Layer"""
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple, Union
+from pydantic import ValidationError
+
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import IUserRepository
+from app.application.dtos.user_dto import CreateUserRequest, ImportRowError, ImportUsersResponse
+
+ImportRow = Tuple[int, Union[Dict[str, Any], Exception]]
+
+
+@dataclass
+class _ImportState:
+    """Running counters for a single import."""
+    total_rows: int = 0
+    imported: int = 0
+    skipped_existing: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+    seen_emails: Set[str] = field(default_factory=set)
+
+
+class ImportUsersUseCase:
+    """Use case for bulk importing users from a row stream."""
+
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        batch_size: int = 1000,
+        max_reported_errors: int = 1000
+    ):
+        self.user_repository = user_repository
+        self.batch_size = batch_size
+        self.max_reported_errors = max_reported_errors
+
+    async def execute(self, rows: AsyncIterator[ImportRow]) -> ImportUsersResponse:
+        """
+        Validate and insert users in batches.
+
+        Each batch costs one query to find existing emails and one
+        multi-row insert, instead of a lookup and insert per user.
+
+        Args:
+            rows: (row_number, data) pairs; data may be a parse error
+
+        Returns:
+            ImportUsersResponse with counts and per-row errors
+        """
+        state = _ImportState()
+        batch: List[Tuple[int, User]] = []
+        async for row_number, data in rows:
+            state.total_rows += 1
+            user = self._validate_row(state, row_number, data)
+            if user is None:
+                continue
+
+            batch.append((row_number, user))
+            if len(batch) >= self.batch_size:
+                await self._import_batch(state, batch)
+                batch = []
+
+        if batch:
+            await self._import_batch(state, batch)
+
+        return ImportUsersResponse(
+            total_rows=state.total_rows,
+            imported=state.imported,
+            skipped_existing=state.skipped_existing,
+            failed=state.failed,
+            errors=state.errors,
+            errors_truncated=state.failed > len(state.errors)
+        )
+
+    def _validate_row(
+        self,
+        state: _ImportState,
+        row_number: int,
+        data: Union[Dict[str, Any], Exception]
+    ) -> Union[User, None]:
+        """Turn a raw row into a User entity, recording an error on failure."""
+        if isinstance(data, Exception):
+            self._record_error(state, row_number, None, str(data))
+            return None
+
+        email = data.get("email")
+        try:
+            request = CreateUserRequest(**data)
+            user = User(
+                email=request.email,
+                full_name=request.full_name,
+                role=request.role,
+                phone=request.phone,
+                department=request.department
+            )
+        except ValidationError as e:
+            message = "; ".join(
+                f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+            )
+            self._record_error(state, row_number, email, message)
+            return None
+        except (TypeError, ValueError) as e:
+            self._record_error(state, row_number, email, str(e))
+            return None
+
+        if user.email in state.seen_emails:
+            self._record_error(state, row_number, user.email, "Duplicate email in import")
+            return None
+        state.seen_emails.add(user.email)
+        return user
+
+    async def _import_batch(self, state: _ImportState, batch: List[Tuple[int, User]]) -> None:
+        """Skip already-registered emails and insert the rest in one statement."""
+        existing = await self.user_repository.find_existing_emails(
+            [user.email for _, user in batch]
+        )
+        new_users = [user for _, user in batch if user.email not in existing]
+
+        inserted = await self.user_repository.bulk_create(new_users)
+        state.imported += len(inserted)
+        # Rows that lost a race with a concurrent create count as existing
+        state.skipped_existing += len(batch) - len(inserted)
+
+    def _record_error(self, state: _ImportState, row_number: int, email: Union[str, None], error: str) -> None:
+        state.failed += 1
+        if len(state.errors) < self.max_reported_errors:
+            state.errors.append(ImportRowError(row=row_number, email=email, error=error))
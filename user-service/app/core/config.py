@@ -14,12 +14,17 @@ class Settings(BaseSettings):
     RABBITMQ_USER: str = "admin"
     RABBITMQ_PASSWORD: str = "admin123"
     
+    # Bulk import
+    BULK_IMPORT_BATCH_SIZE: int = 1000
+    
     # Auth Service
     AUTH_SERVICE_URL: str = "http://localhost:8001"
     
     # JWT - Must match Auth Service
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_MAX_SIZE: int = 10000
     
     # App
     APP_NAME: str = "User Service"
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Set
 from app.domain.entities.user import User
 
 
@@ -11,6 +12,16 @@ class IUserRepository(ABC):
         """Create a new user."""
         pass
     
+    @abstractmethod
+    async def bulk_create(self, users: List[User]) -> Set[str]:
+        """Insert many users in one statement, skipping existing emails; returns inserted emails."""
+        pass
+    
+    @abstractmethod
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Return the subset of the given emails that already exist."""
+        pass
+    
     @abstractmethod
     async def find_by_id(self, user_id: str) -> Optional[User]:
         """Find user by ID."""
@@ -26,6 +37,16 @@ class IUserRepository(ABC):
         """Get all users with pagination."""
         pass
     
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[str] = None
+    ) -> List[User]:
+        """Get users ordered by (created_at, id), starting after the given key."""
+        pass
+    
     @abstractmethod
     async def update(self, user: User) -> User:
         """Update existing user."""
@@ -39,4 +60,9 @@ class IUserRepository(ABC):
     @abstractmethod
     async def count(self) -> int:
         """Count total users."""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def estimate_count(self) -> int:
+        """Approximate user count (cheap, may be stale)."""
+        pass
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -9,6 +9,10 @@ class UserModel(Base):
     """SQLAlchemy model for users table."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        # Supports keyset pagination ordered by (created_at, id)
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
     
     id = Column(String, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -4,8 +4,10 @@ SQLAlchemy implementation of User Repository.
 Manages database operations for User entities.
 """
 from uuid import UUID  # ✅ AGREGAR
-from typing import Optional, List
-from sqlalchemy import select, func, delete
+from datetime import datetime
+from typing import Optional, List, Set
+from sqlalchemy import select, func, delete, text, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from app.domain.entities.user import User
 from app.domain.repositories.user_repository import IUserRepository
 from app.infrastructure.database.models import UserModel
@@ -61,6 +63,76 @@ class UserRepositoryImpl(IUserRepository):
                 logger.error(f"Error creating user: {e}")
                 raise
     
+    async def bulk_create(self, users: List[User]) -> Set[str]:
+        """
+        Insert many users with a single multi-row INSERT ... ON CONFLICT.
+        
+        Rows whose email already exists are skipped by the database, which
+        also covers races with concurrent creates.
+        
+        Args:
+            users: User domain entities
+            
+        Returns:
+            Set[str]: Emails that were actually inserted
+        """
+        if not users:
+            return set()
+        
+        rows = [
+            {
+                "id": user.id,
+                "email": user.email,
+                "full_name": user.full_name,
+                "role": user.role,
+                "is_active": user.is_active,
+                "is_verified": user.is_verified,
+                "phone": user.phone,
+                "department": user.department,
+                "created_at": user.created_at,
+                "updated_at": user.updated_at
+            }
+            for user in users
+        ]
+        
+        async with self.db_connection.get_session() as session:
+            try:
+                dialect = postgresql if session.bind.dialect.name == "postgresql" else sqlite
+                statement = (
+                    dialect.insert(UserModel)
+                    .values(rows)
+                    .on_conflict_do_nothing(index_elements=[UserModel.email])
+                    .returning(UserModel.email)
+                )
+                result = await session.execute(statement)
+                inserted = set(result.scalars().all())
+                await session.commit()
+                logger.info(f"Bulk inserted {len(inserted)} of {len(rows)} users")
+                return inserted
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error bulk inserting users: {e}")
+                raise
+    
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        """
+        Find which of the given emails are already registered.
+        
+        Args:
+            emails: Emails to check
+            
+        Returns:
+            Set[str]: Emails that already exist
+        """
+        if not emails:
+            return set()
+        
+        async with self.db_connection.get_session() as session:
+            result = await session.execute(
+                select(UserModel.email).where(UserModel.email.in_(emails))
+            )
+            return set(result.scalars().all())
+    
     async def find_by_id(self, user_id: str) -> Optional[User]:
         """
         Find user by ID.
@@ -113,6 +185,37 @@ class UserRepositoryImpl(IUserRepository):
             db_users = result.scalars().all()
             return [self._to_entity(u) for u in db_users]
     
+    async def find_page(
+        self,
+        limit: int,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[str] = None
+    ) -> List[User]:
+        """
+        Get a page of users using keyset pagination.
+        
+        Seeks directly to the row after (after_created_at, after_id) via
+        the (created_at, id) index, so cost does not grow with page depth.
+        
+        Args:
+            limit: Maximum number of records to return
+            after_created_at: created_at of the last row of the previous page
+            after_id: id of the last row of the previous page
+            
+        Returns:
+            List[User]: List of user entities
+        """
+        query = select(UserModel).order_by(UserModel.created_at, UserModel.id)
+        if after_created_at is not None and after_id is not None:
+            query = query.where(
+                tuple_(UserModel.created_at, UserModel.id) > tuple_(after_created_at, after_id)
+            )
+        
+        async with self.db_connection.get_session() as session:
+            result = await session.execute(query.limit(limit))
+            db_users = result.scalars().all()
+            return [self._to_entity(u) for u in db_users]
+    
     async def update(self, user: User) -> User:
         """
         Update existing user.
@@ -194,6 +297,30 @@ class UserRepositoryImpl(IUserRepository):
             result = await session.execute(select(func.count(UserModel.id)))
             return result.scalar_one()
     
+    async def estimate_count(self) -> int:
+        """
+        Approximate user count.
+        
+        Uses the planner statistics on PostgreSQL (no table scan) and
+        falls back to an exact count on other databases.
+        
+        Returns:
+            int: Estimated number of users
+        """
+        async with self.db_connection.get_session() as session:
+            if session.bind.dialect.name == "postgresql":
+                result = await session.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+                    {"table": UserModel.__tablename__}
+                )
+                estimate = result.scalar_one_or_none()
+                # reltuples is -1 until the table has been analyzed
+                if estimate is not None and estimate >= 0:
+                    return estimate
+            
+            result = await session.execute(select(func.count(UserModel.id)))
+            return result.scalar_one()
+    
     def _to_entity(self, model: UserModel) -> User:
         """
         Convert database model to domain entity.
@@ -0,0 +1,96 @@
+# user-service/app/infrastructure/importers/user_import_parser.py
+"""
+Streaming parsers for bulk user import payloads.
+Rows are yielded as they arrive so the upload never has to fit in memory.
+"""
+
+from typing import Any, AsyncIterator, Dict, Tuple, Union
+import csv
+import codecs
+import json
+
+ParsedRow = Tuple[int, Union[Dict[str, Any], Exception]]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a byte stream into decoded text lines.
+
+    Args:
+        chunks: Raw request body chunks
+
+    Yields:
+        str: One line without its trailing newline
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """
+    Parse newline-delimited JSON, one user object per line.
+
+    Yields:
+        (row_number, row): row is a dict, or the parse error for that line
+    """
+    row_number = 0
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError("Row must be a JSON object")
+            yield row_number, row
+        except ValueError as e:
+            yield row_number, e
+
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """
+    Parse CSV with a header row, one record per line.
+
+    Quoted fields may contain commas but not line breaks.
+
+    Yields:
+        (row_number, row): row is a dict keyed by header, or the parse error
+    """
+    header = None
+    row_number = 0
+
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            values = next(csv.reader([line]))
+        except csv.Error as e:
+            row_number += 1
+            yield row_number, ValueError(f"Malformed CSV line: {e}")
+            continue
+
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        row_number += 1
+        if len(values) != len(header):
+            yield row_number, ValueError(
+                f"Expected {len(header)} columns, got {len(values)}"
+            )
+            continue
+
+        # Empty cells become None so optional fields validate cleanly
+        yield row_number, {
+            name: (value.strip() or None) for name, value in zip(header, values)
+        }
@@ -0,0 +1,114 @@
+# user-service/app/infrastructure/security/token_cache.py
+"""
+Cache of verified JWT payloads.
+Avoids re-running signature verification and claim parsing for tokens
+that were already validated and have not expired yet.
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import hashlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+RevocationCheck = Callable[[str, Dict[str, Any]], Awaitable[bool]]
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified token payloads keyed by token digest.
+
+    Entries expire at the token's ``exp`` claim; tokens without ``exp`` are
+    never cached. The raw token is not stored, only its SHA-256 digest.
+    """
+
+    def __init__(self, max_size: int = 10000, revocation_check: Optional[RevocationCheck] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached tokens
+            revocation_check: Optional async callable ``(token, payload) -> bool``
+                run on every request, returning True if the token is revoked
+        """
+        self.max_size = max_size
+        self.revocation_check = revocation_check
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached payload for a token.
+
+        Returns:
+            Optional[dict]: Copy of the verified payload, or None if absent or expired
+        """
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(payload)
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        """
+        Cache a payload that has just been verified.
+
+        Args:
+            token: Raw bearer token
+            payload: Decoded and verified claims
+        """
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return
+
+        key = self._digest(token)
+        self._entries[key] = (float(exp), dict(payload))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        """Remove a token from the cache (e.g. after logout)."""
+        self._entries.pop(self._digest(token), None)
+
+    async def is_revoked(self, token: str, payload: Dict[str, Any]) -> bool:
+        """
+        Run the revocation check, if configured.
+
+        Revoked tokens are also evicted so they are re-verified next time.
+        """
+        if self.revocation_check is None:
+            return False
+
+        revoked = await self.revocation_check(token, payload)
+        if revoked:
+            self.invalidate(token)
+        return revoked
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
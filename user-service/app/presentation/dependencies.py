@@ -10,15 +10,18 @@ import logging
 
 from app.infrastructure.database.connection import DatabaseConnection
 from app.infrastructure.database.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.security.token_cache import VerifiedTokenCache
 from app.application.use_cases.create_user_use_case import CreateUserUseCase
 from app.application.use_cases.get_users_use_case import GetUsersUseCase, GetUserByIdUseCase
 from app.application.use_cases.update_user_use_case import UpdateUserUseCase
 from app.application.use_cases.delete_user_use_case import DeleteUserUseCase
+from app.application.use_cases.import_users_use_case import ImportUsersUseCase
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 security = HTTPBearer()
+token_cache = VerifiedTokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
 
 # Global db_connection (set from main.py)
 db_connection: DatabaseConnection = None
@@ -43,6 +46,9 @@ async def get_current_user(
     """
     Validate JWT token locally.
     
+    Verified payloads are cached until the token expires, so repeated
+    requests with the same token skip signature verification.
+    
     Args:
         credentials: Bearer token from request
         
@@ -55,18 +61,30 @@ async def get_current_user(
     token = credentials.credentials
     
     try:
-        # Decode and verify JWT locally
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = token_cache.get(token) if settings.TOKEN_CACHE_ENABLED else None
+        
+        if payload is None:
+            # Decode and verify JWT locally
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET,
+                algorithms=[settings.JWT_ALGORITHM]
+            )
 
-        sub = payload.get("sub")
-        if sub is None:
+            sub = payload.get("sub")
+            if sub is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid authentication credentials"
+                )
+            
+            if settings.TOKEN_CACHE_ENABLED:
+                token_cache.put(token, payload)
+        
+        if await token_cache.is_revoked(token, payload):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials"
+                detail="Token has been revoked"
             )
         
         return payload
@@ -116,4 +134,12 @@ def get_delete_user_use_case(
 ) -> DeleteUserUseCase:
     """Get DeleteUserUseCase with dependencies."""
     repository = UserRepositoryImpl(db_conn)
-    return DeleteUserUseCase(repository)
\ No newline at end of file
+    return DeleteUserUseCase(repository)
+
+
+def get_import_users_use_case(
+    db_conn: DatabaseConnection = Depends(get_db_connection)
+) -> ImportUsersUseCase:
+    """Get ImportUsersUseCase with dependencies."""
+    repository = UserRepositoryImpl(db_conn)
+    return ImportUsersUseCase(repository, batch_size=settings.BULK_IMPORT_BATCH_SIZE)
@@ -1,20 +1,24 @@
 """User routes - Presentation Layer"""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from typing import Annotated, Optional, Union
 
 from app.application.dtos.user_dto import (
-    CreateUserRequest, UpdateUserRequest, UserResponse, UserListResponse
+    CreateUserRequest, UpdateUserRequest, UserResponse, UserListResponse,
+    UserCursorPageResponse, ImportUsersResponse
 )
 from app.application.use_cases.create_user_use_case import CreateUserUseCase
 from app.application.use_cases.get_users_use_case import GetUsersUseCase, GetUserByIdUseCase
 from app.application.use_cases.update_user_use_case import UpdateUserUseCase
 from app.application.use_cases.delete_user_use_case import DeleteUserUseCase
+from app.application.use_cases.import_users_use_case import ImportUsersUseCase
+from app.infrastructure.importers.user_import_parser import parse_csv, parse_ndjson
 from app.presentation.dependencies import (
     get_create_user_use_case,
     get_get_users_use_case,
     get_get_user_by_id_use_case,
     get_update_user_use_case,
     get_delete_user_use_case,
+    get_import_users_use_case,
     get_current_user
 )
 
@@ -27,23 +31,38 @@ async def health_check() -> dict:
     return {"status": "healthy", "service": "user-service"}
 
 
-@router.get("", response_model=UserListResponse)
+@router.get("", response_model=Union[UserListResponse, UserCursorPageResponse])
 async def get_users(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$", description="Pagination mode"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page (cursor mode)"),
+    with_total: bool = Query(False, description="Include estimated total (cursor mode)"),
     use_case: Annotated[GetUsersUseCase, Depends(get_get_users_use_case)] = None,
     current_user: Annotated[dict, Depends(get_current_user)] = None
-) -> UserListResponse:
+) -> Union[UserListResponse, UserCursorPageResponse]:
     """
     Get paginated list of users.
     
-    - **skip**: Number of records to skip (pagination)
+    - **skip**: Number of records to skip (offset mode)
     - **limit**: Maximum number of records to return (1-1000)
+    - **pagination**: `offset` (default) or `cursor`; passing `cursor` implies cursor mode
+    - **cursor**: Opaque `next_cursor` from the previous page
+    - **with_total**: Include an estimated total in cursor mode
+    
+    Cursor mode pages over (created_at, id) and costs the same at any depth.
     
     Requires authentication.
     """
     try:
+        if pagination == "cursor" or cursor is not None:
+            return await use_case.execute_cursor(cursor=cursor, limit=limit, with_total=with_total)
         return await use_case.execute(skip=skip, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -114,6 +133,48 @@ async def create_user(
         )
 
 
+@router.post("/import", response_model=ImportUsersResponse)
+async def import_users(
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$", description="Override Content-Type detection"),
+    use_case: Annotated[ImportUsersUseCase, Depends(get_import_users_use_case)] = None,
+    current_user: Annotated[dict, Depends(get_current_user)] = None
+) -> ImportUsersResponse:
+    """
+    Bulk import users (Admin only).
+    
+    The body is streamed and processed in batches:
+    - **text/csv**: header row with `email,full_name,role,phone,department`
+    - **application/x-ndjson**: one JSON object per line with the same fields
+    
+    Existing emails are skipped; invalid rows are reported per row.
+    """
+    if current_user.get("role") != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can import users"
+        )
+    
+    content_type = request.headers.get("content-type", "")
+    if format == "csv" or (format is None and "csv" in content_type):
+        rows = parse_csv(request.stream())
+    elif format == "ndjson" or (format is None and "ndjson" in content_type):
+        rows = parse_ndjson(request.stream())
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Use text/csv or application/x-ndjson"
+        )
+    
+    try:
+        return await use_case.execute(rows)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"User import failed: {str(e)}"
+        )
+
+
 @router.put("/{user_id}", response_model=UserResponse)
 async def update_user(
     user_id: str,
@@ -0,0 +1,25 @@
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.user_repository_impl import UserRepositoryImpl
+
+
+class SessionProvider:
+    """Minimal stand-in for DatabaseConnection backed by SQLite."""
+    
+    def __init__(self, session_maker):
+        self.session_maker = session_maker
+    
+    def get_session(self) -> AsyncSession:
+        return self.session_maker()
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path):
+    """UserRepositoryImpl over an empty file-backed SQLite database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield UserRepositoryImpl(SessionProvider(async_sessionmaker(engine, expire_on_commit=False)))
+    await engine.dispose()
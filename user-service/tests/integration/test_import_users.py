@@ -0,0 +1,59 @@
+import pytest
+
+from app.domain.entities.user import User
+from app.infrastructure.importers.user_import_parser import parse_csv, parse_ndjson
+from app.application.use_cases.import_users_use_case import ImportUsersUseCase
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_handles_chunk_boundaries():
+    rows = [row async for row in parse_csv(stream(
+        b"email,full_name,role\nalice@example.com,Ali",
+        b"ce Smith,admin\nbob@example.com,Bob\n"
+    ))]
+    
+    assert rows[0] == (1, {"email": "alice@example.com", "full_name": "Alice Smith", "role": "admin"})
+    assert rows[1][0] == 2
+    assert isinstance(rows[1][1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_skips_existing_and_reports_errors(repository):
+    await repository.create(User(email="existing@example.com", full_name="Existing User"))
+    body = (
+        b'{"email": "new1@example.com", "full_name": "New One"}\n'
+        b'{"email": "existing@example.com", "full_name": "Existing User"}\n'
+        b'{"email": "not-an-email", "full_name": "Bad Email"}\n'
+        b'{"email": "new1@example.com", "full_name": "Duplicate"}\n'
+        b'not json\n'
+        b'{"email": "new2@example.com", "full_name": "New Two", "role": "moderator"}\n'
+    )
+    use_case = ImportUsersUseCase(repository, batch_size=2)
+    
+    result = await use_case.execute(parse_ndjson(stream(body)))
+    
+    assert result.total_rows == 6
+    assert result.imported == 2
+    assert result.skipped_existing == 1
+    assert result.failed == 3
+    assert [error.row for error in result.errors] == [3, 4, 5]
+    assert await repository.find_existing_emails(
+        ["new1@example.com", "new2@example.com"]
+    ) == {"new1@example.com", "new2@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_ignores_conflicting_emails(repository):
+    await repository.create(User(email="taken@example.com", full_name="Taken User"))
+    
+    inserted = await repository.bulk_create([
+        User(email="taken@example.com", full_name="Other User"),
+        User(email="free@example.com", full_name="Free User")
+    ])
+    
+    assert inserted == {"free@example.com"}
@@ -0,0 +1,53 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+
+from app.domain.entities.user import User
+from app.application.use_cases.get_users_use_case import GetUsersUseCase, decode_cursor
+
+
+@pytest_asyncio.fixture
+async def seeded_repository(repository):
+    base = datetime(2024, 1, 1)
+    for i in range(5):
+        # Two users share each timestamp to exercise the id tie-breaker
+        await repository.create(User(
+            id=f"user-{i}",
+            email=f"user{i}@example.com",
+            full_name=f"User {i}",
+            created_at=base + timedelta(minutes=i // 2)
+        ))
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_cover_all_users_once(seeded_repository):
+    use_case = GetUsersUseCase(seeded_repository)
+    
+    seen = []
+    cursor = None
+    while True:
+        page = await use_case.execute_cursor(cursor=cursor, limit=2)
+        seen.extend(u.id for u in page.users)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    
+    assert seen == [f"user-{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_cursor_total_is_optional(seeded_repository):
+    use_case = GetUsersUseCase(seeded_repository)
+    
+    without_total = await use_case.execute_cursor(limit=10)
+    with_total = await use_case.execute_cursor(limit=10, with_total=True)
+    
+    assert without_total.total is None
+    assert without_total.next_cursor is None
+    assert with_total.total == 5
+
+
+def test_invalid_cursor_raises_value_error():
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor("not-a-cursor")
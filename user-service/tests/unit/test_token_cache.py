@@ -0,0 +1,57 @@
+import time
+import pytest
+
+from app.infrastructure.security.token_cache import VerifiedTokenCache
+
+
+def test_put_and_get_returns_payload_copy():
+    cache = VerifiedTokenCache()
+    payload = {"sub": "user123", "exp": time.time() + 60}
+    cache.put("token", payload)
+    
+    cached = cache.get("token")
+    cached["role"] = "admin"
+    
+    assert cache.get("token") == payload
+    assert cache.stats()["hits"] == 2
+
+
+def test_expired_token_is_evicted():
+    cache = VerifiedTokenCache()
+    cache._entries[cache._digest("token")] = (time.time() - 1, {"sub": "user123"})
+    
+    assert cache.get("token") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_token_without_exp_is_not_cached():
+    cache = VerifiedTokenCache()
+    cache.put("token", {"sub": "user123"})
+    
+    assert cache.get("token") is None
+
+
+def test_lru_eviction_respects_max_size():
+    cache = VerifiedTokenCache(max_size=2)
+    exp = time.time() + 60
+    cache.put("a", {"sub": "a", "exp": exp})
+    cache.put("b", {"sub": "b", "exp": exp})
+    cache.get("a")
+    cache.put("c", {"sub": "c", "exp": exp})
+    
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_revocation_check_evicts_token():
+    async def revoked(token, payload):
+        return payload["sub"] == "revoked-user"
+    
+    cache = VerifiedTokenCache(revocation_check=revoked)
+    payload = {"sub": "revoked-user", "exp": time.time() + 60}
+    cache.put("token", payload)
+    
+    assert await cache.is_revoked("token", payload) is True
+    assert cache.get("token") is None